@@ -3,14 +3,61 @@ Analyst Agent
 Evaluates discovered targets and prioritizes collection
 Uses multi-criteria scoring to determine target value
 """
+import math
+import numpy as np
+from core.events import ConsoleSink
+from core.target_table import TargetTable, TARGET_TYPES, COMPOSITIONS
+
+# Composition score (rarer materials = higher score)
+COMPOSITION_SCORES = {
+    'ice': 10,  # Most valuable - potential water
+    'anorthosite': 7,  # Ancient crust material
+    'basalt': 4,  # Common volcanic rock
+    'regolith': 2  # Surface dust
+}
+
+# Type score
+TYPE_SCORES = {
+    'anomaly': 8,  # Unknown - high scientific value
+    'crater': 5,  # May reveal subsurface
+    'rock': 3  # Standard sample
+}
+
+# Score for compositions/types missing from the tables above
+DEFAULT_SCORE = 3
+
+# Assumed executor position when no allocator supplies live ones
+EXECUTOR_HOME = (50, 50)
+
+# Score lookups indexed by the target table's category codes
+_COMPOSITION_SCORES_BY_CODE = np.array([COMPOSITION_SCORES.get(c, DEFAULT_SCORE) for c in COMPOSITIONS], dtype=float)
+_TYPE_SCORES_BY_CODE = np.array([TYPE_SCORES.get(t, DEFAULT_SCORE) for t in TARGET_TYPES], dtype=float)
+
+def _priority(score):
+    return 'HIGH' if score > 15 else 'MEDIUM' if score > 8 else 'LOW'
 
 class AnalystAgent:
-    def __init__(self, name, environment, message_bus):
+    role = "analyst"
+    
+    def __init__(self, name, environment, message_bus, sink=None, batch_scoring=True, allocator=None):
         self.name = name
         self.environment = environment
         self.message_bus = message_bus
+        self.sink = sink if sink is not None else ConsoleSink()
         self.pending_evaluations = []
         self.evaluated_targets = []
+        # Score a whole sweep in one NumPy pass and send one batched order
+        self.batch_scoring = batch_scoring
+        # Outstanding orders per executor, for spreading work across the fleet
+        self.executor_load = {}
+        self.assignments = {}
+        # Executors that are full and hand back any further orders
+        self.full_executors = set()
+        # Optional TaskAllocator: assigns from live executor state instead of by load
+        self.allocator = allocator
+        self.message_bus.register(self.name, role=self.role)
+        # Only discoveries and completed collections matter to evaluation
+        self.message_bus.subscribe(self.name, ["TARGET_DISCOVERED", "TARGET_COLLECTED", "ORDERS_RELEASED"])
         
     def process_messages(self):
         """Process incoming target discoveries"""
@@ -18,13 +65,89 @@ class AnalystAgent:
         for msg in messages:
             if msg.msg_type == "TARGET_DISCOVERED":
                 self.pending_evaluations.append(msg.content)
+            elif msg.msg_type == "TARGET_COLLECTED":
+                if self.allocator is not None:
+                    self.allocator.discard(msg.content['target_id'])
+                executor = self.assignments.pop(msg.content['target_id'], None)
+                if executor is not None:
+                    self.executor_load[executor] -= 1
+            elif msg.msg_type == "ORDERS_RELEASED":
+                self._take_back(msg.sender, msg.content)
+    
+    def _take_back(self, executor, content):
+        """Release orders an executor handed back; a full executor's go to the rest of the fleet"""
+        full = content['full']
+        if full:
+            self.full_executors.add(executor)
+        reoffer = []
+        for order in content['orders']:
+            if self.assignments.get(order['target_id']) == executor:
+                del self.assignments[order['target_id']]
+                self.executor_load[executor] -= 1
+            elif self.allocator is None:
+                # Collected or re-routed meanwhile
+                continue
+            if full:
+                reoffer.append(order)
+        if not reoffer:
+            return
+        if self.allocator is not None:
+            self.allocator.backlog.extend(reoffer)
+            return
+        batches = {}
+        for order in reoffer:
+            executor = self._assign_executor(order['target_id'])
+            if executor is not None:
+                batches.setdefault(executor, []).append(order)
+        for executor, batch in batches.items():
+            if self.batch_scoring:
+                self.message_bus.send_message(self.name, executor, "COLLECT_TARGETS", batch)
+            else:
+                for order in batch:
+                    self.message_bus.send_message(self.name, executor, "COLLECT_TARGET", order)
+    
+    def has_work(self):
+        """True while discoveries are waiting to be scored or placed"""
+        return bool(self.pending_evaluations or (self.allocator is not None and self.allocator.backlog))
+    
+    def _assign_executor(self, target_id):
+        """Pick the executor with the fewest outstanding orders (None if all are full or there are none)"""
+        executors = [name for name in self.message_bus.members("executor") if name not in self.full_executors]
+        if not executors:
+            return None
+        load = self.executor_load
+        previous = self.assignments.get(target_id)
+        if previous is not None:
+            # Re-routed: the old order no longer counts against its executor
+            load[previous] -= 1
+        executor = min(executors, key=lambda name: load.get(name, 0))
+        load[executor] = load.get(executor, 0) + 1
+        self.assignments[target_id] = executor
+        return executor
+    
+    def _dispatch(self, orders, msg_type="COLLECT_TARGETS"):
+        """Hand orders to the allocator and send each executor its share"""
+        for executor, batch in self.allocator.allocate(orders).items():
+            if msg_type == "COLLECT_TARGETS":
+                self.message_bus.send_message(self.name, executor, msg_type, batch)
+            else:
+                for evaluation in batch:
+                    self.message_bus.send_message(self.name, executor, msg_type, evaluation)
     
     def take_action(self):
         """Evaluate pending targets and send recommendations"""
         if not self.pending_evaluations:
+            if self.allocator is not None and self.allocator.backlog:
+                # Executors may have room again: re-offer what is left over
+                self._dispatch([], "COLLECT_TARGETS" if self.batch_scoring else "COLLECT_TARGET")
+            return
+        
+        if self.batch_scoring:
+            self._take_batch_action()
             return
         
         # Evaluate each pending target
+        orders = []
         for target_data in self.pending_evaluations:
             score = self._evaluate_target(target_data)
             
@@ -32,26 +155,72 @@ class AnalystAgent:
                 'target_id': target_data['target_id'],
                 'location': target_data['location'],
                 'score': score,
-                'priority': 'HIGH' if score > 15 else 'MEDIUM' if score > 8 else 'LOW'
+                'priority': _priority(score)
             }
             
             self.evaluated_targets.append(evaluation)
             
-            print(f"  🧠 {self.name}: Evaluated Target #{target_data['target_id']} - "
-                  f"Score: {score:.1f} - Priority: {evaluation['priority']}")
+            self.sink.emit('target_evaluated', agent=self.name, target_id=target_data['target_id'],
+                           score=score, priority=evaluation['priority'])
             
-            # Send high-priority targets to Executor
+            # Send high-priority targets to the least-loaded Executor
             if evaluation['priority'] in ['HIGH', 'MEDIUM']:
-                self.message_bus.send_message(
-                    self.name,
-                    "Executor-1",
-                    "COLLECT_TARGET",
-                    evaluation
-                )
+                if self.allocator is not None:
+                    orders.append(evaluation)
+                    continue
+                executor = self._assign_executor(evaluation['target_id'])
+                if executor is not None:
+                    self.message_bus.send_message(
+                        self.name,
+                        executor,
+                        "COLLECT_TARGET",
+                        evaluation
+                    )
+        
+        if self.allocator is not None:
+            self._dispatch(orders, "COLLECT_TARGET")
         
         # Clear pending evaluations
         self.pending_evaluations = []
     
+    def _take_batch_action(self):
+        """Score all pending targets at once and send one COLLECT_TARGETS order"""
+        pending = self.pending_evaluations
+        scores = self._evaluate_batch(pending).tolist()
+        
+        orders = []
+        for target_data, score in zip(pending, scores):
+            evaluation = {
+                'target_id': target_data['target_id'],
+                'location': target_data['location'],
+                'score': score,
+                'priority': _priority(score)
+            }
+            self.evaluated_targets.append(evaluation)
+            if evaluation['priority'] != 'LOW':
+                orders.append(evaluation)
+        
+        if self.sink.enabled:
+            for evaluation in self.evaluated_targets[-len(pending):]:
+                self.sink.emit('target_evaluated', agent=self.name, target_id=evaluation['target_id'],
+                               score=evaluation['score'], priority=evaluation['priority'])
+        
+        if self.allocator is not None:
+            self._dispatch(orders)
+            self.pending_evaluations = []
+            return
+        
+        # Send high-priority targets to the least-loaded Executors, one batch each
+        batches = {}
+        for evaluation in orders:
+            executor = self._assign_executor(evaluation['target_id'])
+            if executor is not None:
+                batches.setdefault(executor, []).append(evaluation)
+        for executor, batch in batches.items():
+            self.message_bus.send_message(self.name, executor, "COLLECT_TARGETS", batch)
+        
+        self.pending_evaluations = []
+    
     def _evaluate_target(self, target_data):
         """
         Multi-criteria scoring function
@@ -62,28 +231,53 @@ class AnalystAgent:
         # Size score (0-10)
         score += target_data['size']
         
-        # Composition score (rarer materials = higher score)
-        composition_scores = {
-            'ice': 10,  # Most valuable - potential water
-            'anorthosite': 7,  # Ancient crust material
-            'basalt': 4,  # Common volcanic rock
-            'regolith': 2  # Surface dust
-        }
-        score += composition_scores.get(target_data['composition'], 3)
-        
-        # Type score
-        type_scores = {
-            'anomaly': 8,  # Unknown - high scientific value
-            'crater': 5,  # May reveal subsurface
-            'rock': 3  # Standard sample
-        }
-        score += type_scores.get(target_data['type'], 3)
+        score += COMPOSITION_SCORES.get(target_data['composition'], DEFAULT_SCORE)
+        score += TYPE_SCORES.get(target_data['type'], DEFAULT_SCORE)
         
         # Distance penalty (closer is better)
-        # Assuming executor starts around (50, 50)
-        distance = ((target_data['location'][0] - 50)**2 + 
-                   (target_data['location'][1] - 50)**2)**0.5
+        x, y = target_data['location']
+        if self.allocator is not None and self.allocator.executors:
+            # Nearest executor as it stands now
+            distance = min(math.sqrt((x - ex)**2 + (y - ey)**2)
+                           for ex, ey in zip(*(p.tolist() for p in self.allocator.positions())))
+        else:
+            distance = math.sqrt((x - EXECUTOR_HOME[0])**2 + (y - EXECUTOR_HOME[1])**2)
         distance_penalty = min(distance / 10, 5)
         score -= distance_penalty
         
         return max(score, 0)
+    
+    def _evaluate_batch(self, targets):
+        """
+        Vectorized _evaluate_target over a list of discoveries
+        Performs the same float operations in the same order, so every
+        score matches the scalar path exactly
+        """
+        table = getattr(self.environment, 'targets', None)
+        if isinstance(table, TargetTable):
+            # Discoveries mirror rows of the target table: gather the columns directly
+            ids = np.fromiter((t['target_id'] for t in targets), dtype=np.intp, count=len(targets))
+            size = table.size[ids].astype(float)
+            composition = _COMPOSITION_SCORES_BY_CODE[table.composition_code[ids]]
+            target_type = _TYPE_SCORES_BY_CODE[table.type_code[ids]]
+            x, y = table.x[ids], table.y[ids]
+        else:
+            size = np.array([t['size'] for t in targets], dtype=float)
+            composition = np.array([COMPOSITION_SCORES.get(t['composition'], DEFAULT_SCORE)
+                                    for t in targets], dtype=float)
+            target_type = np.array([TYPE_SCORES.get(t['type'], DEFAULT_SCORE)
+                                    for t in targets], dtype=float)
+            location = np.array([t['location'] for t in targets], dtype=float).reshape(-1, 2)
+            x, y = location[:, 0], location[:, 1]
+        
+        score = size + composition
+        score += target_type
+        
+        if self.allocator is not None and self.allocator.executors:
+            executor_x, executor_y = self.allocator.positions()
+            distance = np.sqrt((x[:, None] - executor_x)**2 + (y[:, None] - executor_y)**2).min(axis=1)
+        else:
+            distance = np.sqrt((x - EXECUTOR_HOME[0])**2 + (y - EXECUTOR_HOME[1])**2)
+        score -= np.minimum(distance / 10, 5)
+        
+        return np.maximum(score, 0)
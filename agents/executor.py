@@ -1,52 +1,139 @@
 """
 Executor Agent
 Plans optimal routes and executes sample collection
-Uses greedy nearest-neighbor algorithm with obstacle avoidance
+Uses greedy nearest-neighbor algorithm with obstacle avoidance,
+or follows A* waypoints when given a PathPlanner
+With a RouteOptimizer queued targets are visited as one optimized tour
+instead of strictly by score
 """
+import math
+from collections import deque
 import numpy as np
+from core.events import ConsoleSink
+from core.fleet_state import RoverView, MOVE_TOWARDS
+from core.task_queue import TaskQueue
 
-class ExecutorAgent:
-    def __init__(self, name, environment, message_bus, start_x=50, start_y=50):
+class ExecutorAgent(RoverView):
+    role = "executor"
+    
+    def __init__(self, name, environment, message_bus, start_x=50, start_y=50, sink=None, planner=None,
+                 route=None):
         self.name = name
         self.environment = environment
         self.message_bus = message_bus
+        self.sink = sink if sink is not None else ConsoleSink()
         self.x = start_x
         self.y = start_y
-        self.collection_queue = []
+        # A RouteOptimizer replaces the score-ordered queue with a planned tour
+        self.route = route
+        self.collection_queue = route if route is not None else TaskQueue()
         self.current_target = None
         self.carrying_capacity = 15
         self.collected_count = 0
+        self.move_speed = 5
+        # Optional A* planner; the current plan is kept as a queue of waypoints
+        self.planner = planner
+        self.path = None
+        self.path_goal = None
+        self.path_version = None
+        # Event engine: last cycle moved for while sleeping through an approach
+        self.trip = None
+        self.message_bus.register(self.name, role=self.role)
         
     def process_messages(self):
         """Process collection requests from Analyst"""
         messages = self.message_bus.get_messages(self.name)
         for msg in messages:
             if msg.msg_type == "COLLECT_TARGET":
-                # Add to queue, sorted by priority
-                target_info = msg.content
-                # Insert based on score (higher score = higher priority)
-                inserted = False
-                for i, item in enumerate(self.collection_queue):
-                    if target_info['score'] > item['score']:
-                        self.collection_queue.insert(i, target_info)
-                        inserted = True
-                        break
-                if not inserted:
-                    self.collection_queue.append(target_info)
+                self._enqueue(msg.content)
+            elif msg.msg_type == "COLLECT_TARGETS":
+                for target_info in msg.content:
+                    self._enqueue(target_info)
+            elif msg.msg_type == "TARGET_COLLECTED":
+                self._cancel(msg.content['target_id'])
+    
+    def has_work(self):
+        """True while there is a target to chase and room to carry it"""
+        return (self.collected_count < self.carrying_capacity
+                and bool(self.current_target or self.collection_queue))
+    
+    def next_wake(self, cycle):
+        """
+        Event engine: the cycle this executor next needs a step, or None to
+        sleep until mail arrives
+        On a direct approach it sleeps through the moves it cannot arrive
+        before (a blocked move only slows it down); advance_to makes them
+        """
+        self.trip = None
+        if not self.has_work():
+            return None
+        if self.current_target is None or self.fleet is not None or self.planner is not None:
+            return cycle + 1
+        target_x, target_y = self.current_target['location']
+        distance = math.sqrt((self.x - target_x)**2 + (self.y - target_y)**2)
+        moves = int((distance - 3) // self.move_speed)
+        if moves < 1:
+            return cycle + 1
+        # Last cycle whose move has been made
+        self.trip = cycle
+        return cycle + moves + 1
+    
+    def advance_to(self, cycle):
+        """Event engine: make the moves of the cycles slept through, up to and including cycle"""
+        if self.trip is None:
+            return
+        target_x, target_y = self.current_target['location']
+        while self.trip < cycle:
+            self.trip += 1
+            self._move_towards(target_x, target_y)
+    
+    def _enqueue(self, target_info):
+        """Add to queue, sorted by priority"""
+        # Higher score = higher priority; equal scores keep arrival order
+        self.collection_queue.push(target_info)
+    
+    def _cancel(self, target_id):
+        """Forget a target someone else already collected"""
+        self.collection_queue.remove(target_id)
+        if self.current_target and self.current_target['target_id'] == target_id:
+            self.current_target = None
+    
+    def _release_orders(self, full=False):
+        """
+        Hand back orders this executor will not collect: the current target,
+        and the whole queue once full (full also asks for no more orders)
+        """
+        orders = [self.current_target] if self.current_target else []
+        self.current_target = None
+        if full:
+            queued = list(self.collection_queue)
+            for task in queued:
+                self.collection_queue.remove(task['target_id'])
+            orders.extend(queued)
+        self.message_bus.broadcast(self.name, "ORDERS_RELEASED", {'orders': orders, 'full': full})
     
     def take_action(self):
         """Execute collection mission"""
         # If at capacity, skip collection
         if self.collected_count >= self.carrying_capacity:
-            print(f"  🤖 {self.name}: At maximum carrying capacity ({self.carrying_capacity})")
+            self.sink.emit('executor_at_capacity', agent=self.name, capacity=self.carrying_capacity)
+            if self.collection_queue:
+                # Orders that arrived after filling up go straight back
+                self._release_orders(full=True)
             return
         
+        # Keep improving the tour from wherever it will start
+        if self.route is not None and self.collection_queue:
+            start = self.current_target['location'] if self.current_target else (self.x, self.y)
+            self.route.optimize(*start)
+        
         # If no current target, select next from queue
         if not self.current_target and self.collection_queue:
-            self.current_target = self.collection_queue.pop(0)
+            self.current_target = self.collection_queue.pop()
             target_id = self.current_target['target_id']
             target_loc = self.current_target['location']
-            print(f"  🤖 {self.name}: New mission - Target #{target_id} at ({target_loc[0]:.1f}, {target_loc[1]:.1f})")
+            self.sink.emit('collection_assigned', agent=self.name, target_id=target_id,
+                           x=target_loc[0], y=target_loc[1])
         
         # If we have a target, move towards it
         if self.current_target:
@@ -61,8 +148,8 @@ class ExecutorAgent:
                 success = self.environment.collect_target(target_id)
                 if success:
                     self.collected_count += 1
-                    print(f"  🤖 {self.name}: ✅ COLLECTED Target #{target_id} "
-                          f"({self.collected_count}/{self.carrying_capacity})")
+                    self.sink.emit('target_collected', agent=self.name, target_id=target_id,
+                                   count=self.collected_count, capacity=self.carrying_capacity)
                     
                     # Notify mission coordinator
                     self.message_bus.broadcast(
@@ -70,14 +157,67 @@ class ExecutorAgent:
                         "TARGET_COLLECTED",
                         {'target_id': target_id, 'location': target_loc}
                     )
-                
-                self.current_target = None
+                    self.current_target = None
+                    if self.collected_count >= self.carrying_capacity:
+                        self._release_orders(full=True)
+                else:
+                    # Collected by someone else (or gone) before we got here: give the order back
+                    self._release_orders()
+            elif self.planner is not None:
+                self._follow_path(target_loc[0], target_loc[1], distance)
             else:
                 # Move towards target
                 self._move_towards(target_loc[0], target_loc[1])
     
+    def _follow_path(self, target_x, target_y, distance):
+        """Advance along planned waypoints, replanning when the goal or obstacles change"""
+        goal = (target_x, target_y)
+        if (self.path is None or self.path_goal != goal
+                or self.path_version != self.environment.obstacle_version):
+            waypoints = self.planner.plan((self.x, self.y), goal)
+            # An empty plan marks the goal unreachable until it or the obstacles change
+            self.path = deque(waypoints if waypoints is not None else ())
+            self.path_goal = goal
+            self.path_version = self.environment.obstacle_version
+        if not self.path:
+            # Unreachable or over the planning budget: fall back to direct steering
+            self._move_towards(target_x, target_y)
+            return
+        
+        # Walk up to one step's worth of distance along the polyline
+        x, y = self.x, self.y
+        remaining = self.move_speed
+        while self.path and remaining > 0:
+            wx, wy = self.path[0]
+            segment = math.sqrt((wx - x)**2 + (wy - y)**2)
+            if segment <= remaining:
+                x, y = wx, wy
+                remaining -= segment
+                self.path.popleft()
+            else:
+                x += (wx - x) / segment * remaining
+                y += (wy - y) / segment * remaining
+                remaining = 0
+        
+        if self.environment.is_obstacle_free(x, y):
+            self.x = x
+            self.y = y
+            # Set directly even in vectorized mode, so the fleet's step never sees it
+            self.odometer += self.move_speed - remaining
+            self.sink.emit('executor_moved', agent=self.name, x=self.x, y=self.y,
+                           distance=distance)
+        else:
+            # Plan clipped an obstacle edge; steer directly this step and replan next
+            self.path = None
+            self._move_towards(target_x, target_y)
+    
     def _move_towards(self, target_x, target_y):
         """Move towards target with obstacle avoidance"""
+        if self.fleet is not None:
+            # Vectorized mode: the fleet moves every rover at the end of the cycle
+            self.fleet.request_move(self.slot, MOVE_TOWARDS, target_x, target_y, self.move_speed)
+            return
+        
         # Calculate direction vector
         dx = target_x - self.x
         dy = target_y - self.y
@@ -85,7 +225,7 @@ class ExecutorAgent:
         
         if distance > 0:
             # Normalize and scale movement
-            move_speed = min(5, distance)
+            move_speed = min(self.move_speed, distance)
             dx = (dx / distance) * move_speed
             dy = (dy / distance) * move_speed
             
@@ -96,8 +236,9 @@ class ExecutorAgent:
             if self.environment.is_obstacle_free(new_x, new_y):
                 self.x = new_x
                 self.y = new_y
-                print(f"  🤖 {self.name}: Moving to ({self.x:.1f}, {self.y:.1f}) "
-                      f"[{distance:.1f}m from target]")
+                self.odometer += move_speed
+                self.sink.emit('executor_moved', agent=self.name, x=self.x, y=self.y,
+                               distance=distance)
             else:
                 # Try alternative paths if direct path is blocked
                 alternatives = [
@@ -106,7 +247,8 @@ class ExecutorAgent:
                 ]
                 for alt_x, alt_y in alternatives:
                     if self.environment.is_obstacle_free(alt_x, alt_y):
+                        self.odometer += math.sqrt((alt_x - self.x)**2 + (alt_y - self.y)**2)
                         self.x = alt_x
                         self.y = alt_y
-                        print(f"  🤖 {self.name}: Avoiding obstacle, moving to ({self.x:.1f}, {self.y:.1f})")
+                        self.sink.emit('obstacle_avoided', agent=self.name, x=self.x, y=self.y)
                         break
@@ -3,46 +3,76 @@ Scout Agent
 Explores lunar surface and identifies potential targets
 Uses intelligent exploration patterns to maximize coverage
 """
+import math
 import numpy as np
 import random
+from core.coverage import CoverageMap
+from core.events import ConsoleSink
+from core.fleet_state import RoverView, MOVE_SWEEP, MOVE_FRONTIER, SWEEP_OFFSETS
 
-class ScoutAgent:
-    def __init__(self, name, environment, message_bus, start_x=20, start_y=20):
+class ScoutAgent(RoverView):
+    role = "scout"
+    
+    def __init__(self, name, environment, message_bus, start_x=20, start_y=20, sink=None, rng=None,
+                 strategy="sweep", coverage=None):
         self.name = name
         self.environment = environment
         self.message_bus = message_bus
+        self.sink = sink if sink is not None else ConsoleSink()
+        self.rng = rng if rng is not None else random
+        self.message_bus.register(self.name, role=self.role)
+        self.message_bus.subscribe(self.name, ["REQUEST_EXPLORATION"])
         self.x = start_x
         self.y = start_y
         self.sensor_range = 15
         self.visited_areas = set()
         self.exploration_phase = "sweep"
+        # "sweep" picks among 8 fixed neighbours; "frontier" heads for the
+        # nearest unswept cell at the edge of its latest sensor footprint
+        self.strategy = strategy
+        self.step_length = 10
+        self.coverage = coverage if coverage is not None else CoverageMap(environment.width, environment.height)
+        self.frontier_target = None
         
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if state['rng'] is random:
+            # The shared module generator can't be pickled: snapshot its current state
+            rng = random.Random()
+            rng.setstate(random.getstate())
+            state['rng'] = rng
+        return state
+    
     def process_messages(self):
         """Process incoming messages from other agents"""
         messages = self.message_bus.get_messages(self.name)
         for msg in messages:
             if msg.msg_type == "REQUEST_EXPLORATION":
-                print(f"  🔭 {self.name}: Received exploration request for area {msg.content}")
+                self.sink.emit('exploration_request', agent=self.name, area=msg.content)
     
     def take_action(self):
         """Explore and identify targets"""
         # Mark current area as visited
         grid_cell = (int(self.x / 10), int(self.y / 10))
         self.visited_areas.add(grid_cell)
+        self.coverage.mark_disk(self.x, self.y, self.sensor_range,
+                                owner=self.name if self.strategy == "frontier" else None)
         
         # Scan for nearby targets
-        nearby_targets = self.environment.get_nearby_targets(self.x, self.y, self.sensor_range)
+        nearby_targets = self.environment.get_nearby_targets(self.x, self.y, self.sensor_range,
+                                                              undiscovered_only=True)
         
         for target in nearby_targets:
             if not target['discovered']:
                 # Discover new target
                 self.environment.discover_target(target['id'])
-                print(f"  🔭 {self.name}: DISCOVERED {target['type']} at ({target['x']:.1f}, {target['y']:.1f})")
+                self.sink.emit('target_discovered', agent=self.name, target_id=target['id'],
+                               type=target['type'], x=target['x'], y=target['y'])
                 
-                # Send discovery message to Analyst
-                self.message_bus.send_message(
+                # Send discovery message to an Analyst
+                self.message_bus.send_to_role(
                     self.name, 
-                    "Analyst", 
+                    "analyst", 
                     "TARGET_DISCOVERED",
                     {
                         'target_id': target['id'],
@@ -54,13 +84,70 @@ class ScoutAgent:
                 )
         
         # Move to next exploration position using intelligent pattern
-        self._move_to_next_position()
+        if self.fleet is not None:
+            self._request_move()
+        elif self.strategy == "frontier":
+            self._move_to_frontier()
+        else:
+            self._move_to_next_position()
+    
+    def has_work(self):
+        """Scouts keep exploring every cycle"""
+        return True
+    
+    @property
+    def coverage_percent(self):
+        """Share of the map swept so far (by every scout sharing this coverage map)"""
+        return self.coverage.coverage_percent
+    
+    def _frontier_goal(self):
+        """Current frontier cell, picking a new one once it is covered or blocked"""
+        coverage = self.coverage
+        if self.frontier_target is None or not coverage.is_open(self.frontier_target):
+            self.frontier_target = coverage.next_frontier(self.name)
+        return self.frontier_target
+    
+    def _frontier_blocked(self):
+        """Give up on a frontier cell that cannot be reached"""
+        self.coverage.mark_blocked(self.frontier_target)
+        self.frontier_target = None
+    
+    def _request_move(self):
+        """Vectorized mode: leave the move to the fleet's end-of-cycle step"""
+        if self.strategy == "frontier" and self._frontier_goal() is not None:
+            goal_x, goal_y = self.coverage.cell_center(self.frontier_target)
+            self.fleet.request_move(self.slot, MOVE_FRONTIER, goal_x, goal_y, self.step_length)
+        else:
+            self.fleet.request_move(self.slot, MOVE_SWEEP)
+    
+    def _move_to_frontier(self):
+        """Step towards the best open frontier cell, falling back to the sweep pattern"""
+        if self._frontier_goal() is None:
+            self._move_to_next_position()
+            return
+        
+        goal_x, goal_y = self.coverage.cell_center(self.frontier_target)
+        dx, dy = goal_x - self.x, goal_y - self.y
+        distance = math.sqrt(dx**2 + dy**2)
+        step = min(self.step_length, distance)
+        new_x = self.x + dx / distance * step if distance > 0 else goal_x
+        new_y = self.y + dy / distance * step if distance > 0 else goal_y
+        
+        if (0 <= new_x < self.environment.width and 0 <= new_y < self.environment.height
+                and self.environment.is_obstacle_free(new_x, new_y)):
+            self.x, self.y = new_x, new_y
+            self.odometer += step
+            self.sink.emit('scout_moved', agent=self.name, x=self.x, y=self.y)
+        else:
+            # Frontier is behind an obstacle: give up on it and keep exploring
+            self._frontier_blocked()
+            self._move_to_next_position()
     
     def _move_to_next_position(self):
         """Intelligent movement to unexplored areas"""
-        # Find least visited neighboring cells
-        possible_moves = []
-        for dx, dy in [(10, 0), (-10, 0), (0, 10), (0, -10), (7, 7), (-7, 7), (7, -7), (-7, -7)]:
+        # Find reachable neighboring positions
+        candidates = []
+        for dx, dy in SWEEP_OFFSETS:
             new_x = self.x + dx
             new_y = self.y + dy
             
@@ -68,13 +155,24 @@ class ScoutAgent:
             if 0 <= new_x < self.environment.width and 0 <= new_y < self.environment.height:
                 # Check for obstacles
                 if self.environment.is_obstacle_free(new_x, new_y):
-                    grid_cell = (int(new_x / 10), int(new_y / 10))
-                    # Prefer unvisited areas
-                    priority = 0 if grid_cell not in self.visited_areas else 1
-                    possible_moves.append((new_x, new_y, priority))
+                    candidates.append((new_x, new_y))
+        self._take_sweep_move(candidates)
+    
+    def _take_sweep_move(self, candidates):
+        """Move to the least visited of the reachable sweep positions"""
+        possible_moves = []
+        for new_x, new_y in candidates:
+            grid_cell = (int(new_x / 10), int(new_y / 10))
+            # Prefer unvisited areas
+            priority = 0 if grid_cell not in self.visited_areas else 1
+            possible_moves.append((new_x, new_y, priority))
         
         if possible_moves:
             # Sort by priority (unvisited first) and add some randomness
-            possible_moves.sort(key=lambda m: (m[2], random.random()))
-            self.x, self.y, _ = possible_moves[0]
-            print(f"  🔭 {self.name}: Moving to ({self.x:.1f}, {self.y:.1f})")
+            possible_moves.sort(key=lambda m: (m[2], self.rng.random()))
+            new_x, new_y, _ = possible_moves[0]
+            if self.fleet is None:
+                # In vectorized mode this runs inside the fleet's step, which counts it
+                self.odometer += math.sqrt((new_x - self.x)**2 + (new_y - self.y)**2)
+            self.x, self.y = new_x, new_y
+            self.sink.emit('scout_moved', agent=self.name, x=self.x, y=self.y)
@@ -0,0 +1,83 @@
+"""
+Batch Mission Evaluation
+Runs many seeded headless missions in parallel and aggregates the results
+
+Usage:
+    python batch.py --runs 200 --workers 8 --out results.csv
+"""
+
+import argparse
+import sys
+import os
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.batch_runner import DEFAULT_CONFIG, run_batch, summarize, write_csv
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo lunar mission evaluation")
+    parser.add_argument('--runs', type=int, default=100, help="number of missions (one per seed)")
+    parser.add_argument('--seed-start', type=int, default=0, help="first seed")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--cycles', type=int, default=DEFAULT_CONFIG['max_cycles'], help="max cycles per mission")
+    parser.add_argument('--targets', type=int, default=DEFAULT_CONFIG['num_targets'], help="targets per map")
+    parser.add_argument('--size', type=int, default=DEFAULT_CONFIG['width'], help="map width and height (m)")
+    parser.add_argument('--scouts', type=int, default=DEFAULT_CONFIG['num_scouts'], help="scouts per mission")
+    parser.add_argument('--executors', type=int, default=DEFAULT_CONFIG['num_executors'], help="executors per mission")
+    parser.add_argument('--planner', action='store_true', help="executors follow A* paths")
+    parser.add_argument('--strategy', choices=('sweep', 'frontier'), default=DEFAULT_CONFIG['scout_strategy'],
+                        help="scout exploration strategy")
+    parser.add_argument('--vectorized', action='store_true', help="move all rovers in one vectorized pass per cycle")
+    parser.add_argument('--engine', choices=('sync', 'async', 'event'), default=DEFAULT_CONFIG['engine'],
+                        help="round-robin loop, one asyncio task per agent, or discrete events")
+    parser.add_argument('--world', choices=('flat', 'chunked'), default=DEFAULT_CONFIG['world'],
+                        help="pre-generated map or tiles generated around the fleet on demand")
+    parser.add_argument('--allocation', choices=('greedy', 'hungarian'), default=DEFAULT_CONFIG['allocation'],
+                        help="least-loaded executor, or optimal assignment from live executor state")
+    parser.add_argument('--routing', choices=('priority', 'tour'), default=DEFAULT_CONFIG['routing'],
+                        help="executors visit targets in score order, or along an optimized tour")
+    parser.add_argument('--out', default=None, help="write per-seed rows to this CSV file")
+    args = parser.parse_args()
+    if args.planner and args.world == 'chunked':
+        parser.error("--planner needs the flat world: chunked worlds only know the obstacles of loaded tiles")
+    
+    config = {
+        'width': args.size,
+        'height': args.size,
+        'num_targets': args.targets,
+        'max_cycles': args.cycles,
+        'num_scouts': args.scouts,
+        'num_executors': args.executors,
+        'path_planner': args.planner,
+        'scout_strategy': args.strategy,
+        'vectorized': args.vectorized,
+        'engine': args.engine,
+        'world': args.world,
+        'allocation': args.allocation,
+        'routing': args.routing,
+    }
+    seeds = range(args.seed_start, args.seed_start + args.runs)
+    
+    print(f"🚀 Running {args.runs} missions...")
+    start = time.perf_counter()
+    rows = run_batch(seeds, config, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    
+    summary = summarize(rows)
+    print(f"\n📊 {summary['runs']} missions in {elapsed:.2f}s "
+          f"({summary['runs'] / elapsed:.1f} missions/s)")
+    print(f"Completion rate: {summary['completion_rate'] * 100:.1f}%\n")
+    print(f"{'metric':<20}{'mean':>12}{'stdev':>12}{'min':>12}{'max':>12}")
+    for field, stats in summary.items():
+        if isinstance(stats, dict):
+            print(f"{field:<20}{stats['mean']:>12.2f}{stats['stdev']:>12.2f}"
+                  f"{stats['min']:>12.2f}{stats['max']:>12.2f}")
+    
+    if args.out:
+        write_csv(rows, args.out)
+        print(f"\n💾 Results written to {args.out}")
+
+if __name__ == "__main__":
+    main()
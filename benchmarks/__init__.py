@@ -0,0 +1,8 @@
+"""
+Benchmarks
+Standalone scripts (bench_*.py) for individual experiments, plus a
+regression suite with machine-readable output:
+
+    python -m benchmarks --out results.json
+    python -m benchmarks --quick --compare results.json
+"""
@@ -0,0 +1,56 @@
+"""
+Benchmark Suite Runner
+
+Usage:
+    python -m benchmarks [--quick] [--suite environment,bus,analyst,mission]
+                         [--out results.json] [--compare baseline.json] [--tolerance 0.2]
+
+Exits with status 1 when --compare flags a slowdown
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.suite import SUITES, HEADER, run_suite, format_row, compare
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep the core subsystems and report throughput")
+    parser.add_argument('--quick', action='store_true', help="two points per sweep, shorter timing")
+    parser.add_argument('--suite', default=','.join(SUITES), help=f"comma-separated subset of {', '.join(SUITES)}")
+    parser.add_argument('--out', default=None, help="write results as JSON to this file")
+    parser.add_argument('--compare', default=None, metavar='BASELINE',
+                        help="flag cases slower than this earlier --out file")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="allowed slowdown before a case is flagged (fraction)")
+    args = parser.parse_args()
+
+    suites = [name for name in args.suite.split(',') if name]
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(sorted(unknown))}")
+
+    print(HEADER)
+    results = run_suite(suites, quick=args.quick, min_time=0.2 if args.quick else 0.5,
+                        report=lambda row: print(format_row(row), flush=True))
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = compare(baseline, results, args.tolerance)
+        print(f"\n{'case':<64}{'baseline ops/s':>16}{'ops/s':>14}{'change':>9}")
+        for key, before, after, change, flagged in rows:
+            print(f"{key:<64}{before:>16,.0f}{after:>14,.0f}{change:>+8.0%}{'  SLOWER' if flagged else ''}")
+        slower = sum(flagged for *_, flagged in rows)
+        print(f"\n{len(rows)} cases compared, {slower} slower than baseline by more than {args.tolerance:.0%}")
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
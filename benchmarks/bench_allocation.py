@@ -0,0 +1,51 @@
+"""
+Task Allocation Benchmark
+Greedy least-loaded routing versus optimal assignment (TaskAllocator) on
+growing fleets: targets collected, mission value and cycle throughput over
+a fixed number of cycles, with the allocator's own solve time
+
+Usage:
+    python benchmarks/bench_allocation.py
+"""
+
+import sys
+import os
+import math
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.environment import LunarEnvironment
+from core.message_bus import MessageBus
+from core.coordinator import MissionCoordinator
+from core.events import NullSink
+from core.fleet import build_fleet
+
+def run(executors, allocation, cycles=150, seed=0):
+    scouts = executors
+    size = int(100 * math.sqrt((scouts + executors) / 2))
+    environment = LunarEnvironment(width=size, height=size, num_targets=10 * executors, seed=seed)
+    message_bus = MessageBus()
+    agents = build_fleet(environment, message_bus, num_scouts=scouts, num_executors=executors,
+                         seed=seed, sink=NullSink(), vectorized=True, allocation=allocation)
+    coordinator = MissionCoordinator(environment, message_bus, agents, headless=True)
+    # Run every mission for the full length so collection rates compare
+    coordinator._check_mission_complete = lambda: False
+    start = time.perf_counter()
+    coordinator.run_mission(max_cycles=cycles)
+    elapsed = time.perf_counter() - start
+    value = coordinator.total_value
+    allocator = next(agent for agent in agents if agent.role == 'analyst').allocator
+    solve_ms = allocator.solve_time / max(allocator.solves, 1) * 1e3 if allocator else 0.0
+    return len(environment.collected_targets), value, cycles / elapsed, solve_ms
+
+def main():
+    print(f"{'executors':>10}{'allocation':>12}{'collected':>11}{'value':>10}{'cycles/s':>10}{'solve ms':>10}")
+    for executors in (1, 4, 16, 64, 256):
+        for allocation in ('greedy', 'hungarian'):
+            collected, value, rate, solve_ms = run(executors, allocation)
+            print(f"{executors:>10}{allocation:>12}{collected:>11}{value:>10.1f}{rate:>10.1f}{solve_ms:>10.2f}")
+
+if __name__ == "__main__":
+    main()
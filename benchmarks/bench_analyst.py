@@ -0,0 +1,75 @@
+"""
+Analyst Scoring Benchmark
+Compares per-target scalar scoring with the vectorized batch path
+
+Usage:
+    python benchmarks/bench_analyst.py
+"""
+
+import sys
+import os
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.environment import LunarEnvironment
+from core.message_bus import MessageBus
+from core.events import NullSink
+from agents.analyst import AnalystAgent
+
+def make_discoveries(environment):
+    """TARGET_DISCOVERED payloads for every target, as the Scout sends them"""
+    return [{
+        'target_id': target['id'],
+        'location': (target['x'], target['y']),
+        'type': target['type'],
+        'size': target['size'],
+        'composition': target['composition'],
+    } for target in environment.targets]
+
+def best_of(fn, repeat=5):
+    """Fastest wall time of several runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def time_take_action(analyst, discoveries):
+    """One full take_action over a sweep of discoveries, bus traffic included"""
+    def run():
+        analyst.pending_evaluations = list(discoveries)
+        analyst.evaluated_targets = []
+        analyst.executor_load.clear()
+        analyst.assignments.clear()
+        analyst.take_action()
+        analyst.message_bus.get_messages("Executor-1")
+    return best_of(run)
+
+def main():
+    print(f"{'targets':>10}{'score scalar':>14}{'score batch':>14}{'speedup':>9}"
+          f"{'action scalar':>15}{'action batch':>14}{'speedup':>9}   (ms)")
+    for n in (10, 100, 1000, 10000, 100000):
+        environment = LunarEnvironment(width=1000, height=1000, num_targets=n, seed=n)
+        discoveries = make_discoveries(environment)
+        scalar_bus, batch_bus = MessageBus(), MessageBus()
+        scalar_bus.register("Executor-1", role="executor")
+        batch_bus.register("Executor-1", role="executor")
+        scalar_analyst = AnalystAgent("Analyst", environment, scalar_bus, sink=NullSink(), batch_scoring=False)
+        batch_analyst = AnalystAgent("Analyst", environment, batch_bus, sink=NullSink())
+        
+        # The two paths must agree exactly before timing means anything
+        scalar_scores = [scalar_analyst._evaluate_target(t) for t in discoveries]
+        assert batch_analyst._evaluate_batch(discoveries).tolist() == scalar_scores
+        
+        score_scalar = best_of(lambda: [scalar_analyst._evaluate_target(t) for t in discoveries])
+        score_batch = best_of(lambda: batch_analyst._evaluate_batch(discoveries))
+        action_scalar = time_take_action(scalar_analyst, discoveries)
+        action_batch = time_take_action(batch_analyst, discoveries)
+        print(f"{n:>10}{score_scalar * 1e3:>14.3f}{score_batch * 1e3:>14.3f}{score_scalar / score_batch:>8.1f}x"
+              f"{action_scalar * 1e3:>15.3f}{action_batch * 1e3:>14.3f}{action_scalar / action_batch:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Fleet Throughput Benchmark
+Headless missions with growing fleets; reports agent-steps per second
+(one step = process_messages + take_action for one agent in one cycle)
+
+Usage:
+    python benchmarks/bench_fleet.py
+"""
+
+import sys
+import os
+import math
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.environment import LunarEnvironment
+from core.message_bus import MessageBus
+from core.coordinator import MissionCoordinator
+from core.fleet import build_fleet
+
+def run_fleet(num_agents, cycles=100, seed=0, vectorized=False):
+    """Time one mission; the map and target count grow with the fleet"""
+    num_scouts = max(num_agents // 2, 1)
+    num_executors = max(num_agents - num_scouts - 1, 1)
+    size = int(100 * math.sqrt(num_agents / 3))
+    environment = LunarEnvironment(width=size, height=size, num_targets=7 * num_agents, seed=seed)
+    message_bus = MessageBus()
+    agents = build_fleet(environment, message_bus, num_scouts, num_executors, seed=seed,
+                         vectorized=vectorized)
+    coordinator = MissionCoordinator(environment, message_bus, agents, headless=True)
+    # Keep every agent busy for the full run
+    coordinator._check_mission_complete = lambda: False
+    
+    start = time.perf_counter()
+    coordinator.run_mission(max_cycles=cycles)
+    elapsed = time.perf_counter() - start
+    return len(agents), elapsed, coordinator.mission_stats
+
+def main():
+    cycles = 100
+    print(f"{'agents':>8}{'engine':>12}{'cycles/s':>12}{'agent-steps/s':>16}{'us/agent-step':>16}{'collected':>11}")
+    for num_agents in (3, 12, 48, 192, 384, 1536):
+        for vectorized in (False, True):
+            count, elapsed, stats = run_fleet(num_agents, cycles, vectorized=vectorized)
+            steps = count * cycles
+            engine = 'vectorized' if vectorized else 'scalar'
+            print(f"{count:>8}{engine:>12}{cycles / elapsed:>12.1f}{steps / elapsed:>16.0f}"
+                  f"{elapsed / steps * 1e6:>16.1f}{stats['targets_collected']:>11}")
+
+if __name__ == "__main__":
+    main()
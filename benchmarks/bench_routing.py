@@ -0,0 +1,61 @@
+"""
+Route Optimization Benchmark
+Score-ordered queues versus optimized tours (RouteOptimizer) over a fixed
+number of cycles: targets collected, mission value, metres driven per
+collected target and the optimizer's time per executor cycle, with and
+without A* path lengths in the distance matrix
+
+Usage:
+    python benchmarks/bench_routing.py
+"""
+
+import sys
+import os
+import math
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.environment import LunarEnvironment
+from core.message_bus import MessageBus
+from core.coordinator import MissionCoordinator
+from core.events import NullSink
+from core.fleet import build_fleet
+from core.path_planner import PathPlanner
+
+def run(executors, routing, planned, cycles=150, seed=0):
+    scouts = executors
+    size = int(100 * math.sqrt((scouts + executors) / 2))
+    environment = LunarEnvironment(width=size, height=size, num_targets=10 * executors, seed=seed)
+    message_bus = MessageBus()
+    agents = build_fleet(environment, message_bus, num_scouts=scouts, num_executors=executors,
+                         planner=PathPlanner(environment) if planned else None,
+                         seed=seed, sink=NullSink(), routing=routing)
+    executor_agents = [agent for agent in agents if agent.role == 'executor']
+    coordinator = MissionCoordinator(environment, message_bus, agents, headless=True)
+    # Run every mission for the full length so collection rates compare
+    coordinator._check_mission_complete = lambda: False
+    start = time.perf_counter()
+    coordinator.run_mission(max_cycles=cycles)
+    elapsed = time.perf_counter() - start
+    collected = len(environment.collected_targets)
+    value = coordinator.total_value
+    routes = [e.route for e in executor_agents if e.route is not None]
+    optimize_us = (sum(r.stats['time'] for r in routes) / max(sum(r.stats['optimizations'] for r in routes), 1)
+                   * 1e6)
+    driven = sum(e.odometer for e in executor_agents)
+    return collected, value, driven / max(collected, 1), cycles / elapsed, optimize_us
+
+def main():
+    print(f"{'executors':>10}{'planner':>9}{'routing':>10}{'collected':>11}{'value':>10}"
+          f"{'m/target':>10}{'cycles/s':>10}{'opt us':>9}")
+    for executors in (1, 4, 16, 64):
+        for planned in (False, True):
+            for routing in ('priority', 'tour'):
+                collected, value, per_target, rate, optimize_us = run(executors, routing, planned)
+                print(f"{executors:>10}{'A*' if planned else '-':>9}{routing:>10}{collected:>11}{value:>10.1f}"
+                      f"{per_target:>10.1f}{rate:>10.1f}{optimize_us:>9.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Survey Map Loading Benchmark
+Writes target catalogs and hazard rasters of growing size, then measures
+startup time and resident memory of a short mission on each, in a fresh
+process per map (Linux: reads /proc/self/status)
+
+Usage:
+    python benchmarks/bench_survey.py [directory]
+"""
+
+import sys
+import os
+import multiprocessing
+import shutil
+import tempfile
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+# (map side in metres, targets)
+SIZES = ((1000, 100000), (3000, 1000000), (10000, 10000000))
+
+def write_map(directory, side, num_targets, seed=0):
+    """Random catalog plus a hazard raster at 1 m resolution with sparse boulder fields"""
+    from core.survey import write_target_catalog
+    from core.target_table import TargetTable, TARGET_TYPES, COMPOSITIONS
+
+    rng = np.random.default_rng(seed)
+    table = TargetTable(rng.uniform(0, side, num_targets), rng.uniform(0, side, num_targets),
+                        rng.uniform(1, 10, num_targets),
+                        rng.integers(len(TARGET_TYPES), size=num_targets),
+                        rng.integers(len(COMPOSITIONS), size=num_targets))
+    write_target_catalog(os.path.join(directory, 'catalog'), table, side, side)
+    hazard = np.lib.format.open_memmap(os.path.join(directory, 'hazard.npy'), mode='w+',
+                                       dtype=np.uint8, shape=(side, side))
+    for row in range(0, side, 1000):
+        block = hazard[row:row + 1000]
+        block[:] = rng.random(block.shape) < 0.01
+    hazard.flush()
+
+def memory_mb():
+    """(anonymous, file-backed) resident memory in MB; mapped file pages are
+    reclaimable page cache, anonymous pages are what the process really holds"""
+    fields = {}
+    with open('/proc/self/status') as status:
+        for line in status:
+            name, _, value = line.partition(':')
+            fields[name] = value
+    return tuple(int(fields[name].split()[0]) / 1024 for name in ('RssAnon', 'RssFile'))
+
+def run_map(directory, cycles, results):
+    """Load the map, run a short mission and report timings and memory growth"""
+    from core.environment import LunarEnvironment
+    from core.message_bus import MessageBus
+    from core.coordinator import MissionCoordinator
+    from core.fleet import build_fleet
+    from core.survey import HazardMap
+
+    anon_before, file_before = memory_mb()
+    start = time.perf_counter()
+    environment = LunarEnvironment.from_survey(os.path.join(directory, 'catalog'),
+                                               hazard=HazardMap(os.path.join(directory, 'hazard.npy')))
+    startup = time.perf_counter() - start
+
+    message_bus = MessageBus()
+    agents = build_fleet(environment, message_bus, num_scouts=4, num_executors=4, seed=0)
+    coordinator = MissionCoordinator(environment, message_bus, agents, headless=True)
+    start = time.perf_counter()
+    coordinator.run_mission(max_cycles=cycles)
+    mission = time.perf_counter() - start
+    anon, mapped = memory_mb()
+    results.put((startup, mission, anon - anon_before, mapped - file_before, coordinator.mission_stats))
+
+def main():
+    root = sys.argv[1] if len(sys.argv) > 1 else tempfile.mkdtemp(prefix='lunar-survey-')
+    context = multiprocessing.get_context('spawn')
+    cycles = 50
+    print(f"{'map':>10}{'targets':>12}{'on disk MB':>12}{'startup ms':>12}"
+          f"{'ms/cycle':>10}{'anon +MB':>10}{'file +MB':>10}{'discovered':>12}")
+    try:
+        for side, num_targets in SIZES:
+            directory = os.path.join(root, f'{side}m')
+            if not os.path.exists(directory):
+                writer = context.Process(target=write_map, args=(directory, side, num_targets))
+                writer.start()
+                writer.join()
+            disk = sum(os.path.getsize(os.path.join(path, name))
+                       for path, _, names in os.walk(directory) for name in names) / 2**20
+            results = context.Queue()
+            runner = context.Process(target=run_map, args=(directory, cycles, results))
+            runner.start()
+            startup, mission, anon, mapped, stats = results.get()
+            runner.join()
+            print(f"{side:>9}m{num_targets:>12,}{disk:>12.0f}{startup * 1e3:>12.1f}"
+                  f"{mission / cycles * 1e3:>10.2f}{anon:>10.1f}{mapped:>10.1f}"
+                  f"{stats['targets_discovered']:>12}")
+    finally:
+        if len(sys.argv) <= 1:
+            shutil.rmtree(root)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Transport Loopback Benchmark
+Message throughput and round-trip latency through the bus transports:
+in-process calls versus a BusServer in another process over a Unix socket
+
+Usage:
+    python benchmarks/bench_transport.py
+"""
+
+import sys
+import os
+import multiprocessing
+import tempfile
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from core.transport import (BusServer, InProcessTransport, RemoteMessageBus,
+                            UnixSocketTransport, encode_frame, OP_SEND)
+
+# A typical discovery report
+PAYLOAD = {'target_id': 12, 'location': (41.0, 77.0), 'type': 'crater',
+           'size': 6.25, 'composition': 'ice'}
+
+def _serve(path):
+    BusServer(path).serve_forever()
+
+def throughput(bus, messages=200000, batch=1000):
+    """Messages per second sent one way and drained by the recipient"""
+    bus.register("Sink")
+    received = 0
+    start = time.perf_counter()
+    for _ in range(messages // batch):
+        for _ in range(batch):
+            bus.send_message("Source", "Sink", "TARGET_DISCOVERED", PAYLOAD)
+        received += len(bus.get_messages("Sink"))
+    elapsed = time.perf_counter() - start
+    assert received == messages // batch * batch
+    return received / elapsed
+
+def latency(bus, rounds=20000):
+    """Round-trip times in microseconds"""
+    samples = np.empty(rounds)
+    for i in range(rounds):
+        start = time.perf_counter()
+        bus.ping(i)
+        samples[i] = time.perf_counter() - start
+    return samples * 1e6
+
+def report(name, bus):
+    rate = throughput(bus)
+    samples = latency(bus)
+    p50, p99 = np.percentile(samples, [50, 99])
+    print(f"{name:<14}{rate:>14,.0f}{p50:>12.1f}{p99:>12.1f}")
+
+def main():
+    frame = encode_frame(OP_SEND, ("Scout-1", "Analyst", "TARGET_DISCOVERED", PAYLOAD))
+    print(f"Encoded discovery frame: {len(frame)} bytes\n")
+    print(f"{'transport':<14}{'messages/s':>14}{'p50 rtt us':>12}{'p99 rtt us':>12}")
+
+    report("in-process", RemoteMessageBus(InProcessTransport()))
+
+    path = os.path.join(tempfile.mkdtemp(prefix='lunar-bench-'), 'bus.sock')
+    server = multiprocessing.get_context('spawn').Process(target=_serve, args=(path,), daemon=True)
+    server.start()
+    while not os.path.exists(path):
+        time.sleep(0.01)
+    bus = RemoteMessageBus(UnixSocketTransport(path))
+    try:
+        report("unix-socket", bus)
+    finally:
+        bus.close()
+        server.terminate()
+        server.join()
+        os.unlink(path)
+        os.rmdir(os.path.dirname(path))
+
+if __name__ == "__main__":
+    main()
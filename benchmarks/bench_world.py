@@ -0,0 +1,68 @@
+"""
+Chunked World Benchmark
+Startup time, per-cycle cost and peak Python memory of a fixed fleet on
+growing maps, pre-generated (LunarEnvironment) versus tiles generated
+around the fleet on demand (ChunkedLunarEnvironment), at the demo density
+of 20 targets and 15 obstacles per hectare
+
+Usage:
+    python benchmarks/bench_world.py
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.environment import LunarEnvironment
+from core.chunked_world import ChunkedLunarEnvironment
+from core.message_bus import MessageBus
+from core.coordinator import MissionCoordinator
+from core.events import NullSink
+from core.fleet import build_fleet
+
+SIDES = (1000, 3000, 10000)
+TARGETS_PER_M2 = 0.002
+
+def mission(world, side, cycles, seed):
+    """Returns (environment, coordinator, startup seconds, seconds per cycle)"""
+    start = time.perf_counter()
+    if world == 'flat':
+        environment = LunarEnvironment(width=side, height=side,
+                                       num_targets=int(TARGETS_PER_M2 * side * side), seed=seed)
+    else:
+        environment = ChunkedLunarEnvironment(width=side, height=side, seed=seed,
+                                              target_density=TARGETS_PER_M2)
+    startup = time.perf_counter() - start
+
+    message_bus = MessageBus()
+    agents = build_fleet(environment, message_bus, num_scouts=16, num_executors=8,
+                         seed=seed, sink=NullSink(), scout_strategy='frontier', vectorized=True)
+    coordinator = MissionCoordinator(environment, message_bus, agents, headless=True)
+    start = time.perf_counter()
+    coordinator.run_mission(max_cycles=cycles)
+    return environment, coordinator, startup, (time.perf_counter() - start) / cycles
+
+def run(world, side, cycles=100, seed=0):
+    environment, coordinator, startup, per_cycle = mission(world, side, cycles, seed)
+    # Memory from a second, traced run so tracing does not skew the timings
+    tracemalloc.start()
+    mission(world, side, cycles, seed)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    tiles = getattr(environment, 'resident_tiles', '-')
+    print(f"{world:<9}{side:>7}m{startup * 1e3:>12.1f}{per_cycle * 1e3:>11.2f}"
+          f"{peak / 2**20:>11.1f}{tiles:>8}{coordinator.mission_stats['targets_discovered']:>12}")
+
+def main():
+    print(f"{'world':<9}{'map':>8}{'startup ms':>12}{'ms/cycle':>11}{'peak MB':>11}"
+          f"{'tiles':>8}{'discovered':>12}")
+    for side in SIDES:
+        for world in ('flat', 'chunked'):
+            run(world, side)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Benchmark Suite
+Parameter sweeps over the core subsystems: environment queries, message
+bus throughput, analyst scoring and whole-mission cycles
+Every case reports ops/sec, per-step latency percentiles and the peak
+traced memory of setting it up and running one step; results are plain
+dicts so they can be stored as JSON and compared against a baseline
+"""
+import json
+import math
+import platform
+import time
+import tracemalloc
+import numpy as np
+
+from core.environment import LunarEnvironment
+from core.message_bus import MessageBus
+from core.coordinator import MissionCoordinator
+from core.events import NullSink
+from core.fleet import build_fleet
+from agents.analyst import AnalystAgent
+
+RESULT_VERSION = 1
+
+
+def _environment(size, targets, obstacles=15, seed=0):
+    environment = LunarEnvironment(width=size, height=size, num_targets=targets, seed=seed)
+    rng = np.random.default_rng(seed)
+    for x, y, radius in zip(rng.uniform(0, size, obstacles - 15).tolist(),
+                            rng.uniform(0, size, obstacles - 15).tolist(),
+                            rng.uniform(3, 8, obstacles - 15).tolist()):
+        environment.add_obstacle(x, y, radius)
+    return environment
+
+
+def _points(size, count=1000, seed=1):
+    rng = np.random.default_rng(seed)
+    return list(zip(rng.uniform(0, size, count).tolist(), rng.uniform(0, size, count).tolist()))
+
+
+# Each setup returns (step, ops): step() does `ops` operations and may
+# return a list of per-operation latencies (seconds) to use instead of its
+# own wall time
+
+def setup_nearby_targets(size, targets):
+    """1000 scout sensor sweeps (radius 15) at random positions"""
+    environment = _environment(size, targets)
+    points = _points(size)
+    query = environment.get_nearby_targets
+
+    def step():
+        for x, y in points:
+            query(x, y, 15, undiscovered_only=True)
+    return step, len(points)
+
+
+def setup_obstacle_free(size, obstacles):
+    """1000 point-in-obstacle checks"""
+    environment = _environment(size, 20, obstacles)
+    points = _points(size)
+    check = environment.is_obstacle_free
+
+    def step():
+        for x, y in points:
+            check(x, y)
+    return step, len(points)
+
+
+def setup_bus_throughput(messages, recipients):
+    """Send `messages` discovery reports round-robin to the recipients, then drain them"""
+    bus = MessageBus(history_limit=1000)
+    names = [f"Agent-{i}" for i in range(recipients)]
+    for name in names:
+        bus.register(name)
+    payload = {'target_id': 12, 'location': (41.0, 77.0), 'type': 'crater',
+               'size': 6.25, 'composition': 'ice'}
+    order = [names[i % recipients] for i in range(messages)]
+
+    def step():
+        send = bus.send_message
+        for name in order:
+            send("Scout-1", name, "TARGET_DISCOVERED", payload)
+        for name in names:
+            bus.get_messages(name)
+    return step, messages
+
+
+def setup_analyst_scoring(batch):
+    """Vectorized scoring of one sweep worth of discoveries"""
+    environment = _environment(1000, batch)
+    analyst = AnalystAgent("Analyst", environment, MessageBus(), sink=NullSink())
+    discoveries = [{'target_id': target['id'], 'location': (target['x'], target['y']),
+                    'type': target['type'], 'size': target['size'],
+                    'composition': target['composition']} for target in environment.targets]
+
+    def step():
+        analyst._evaluate_batch(discoveries)
+    return step, batch
+
+
+def setup_mission_cycles(agents, vectorized, cycles=20):
+    """`cycles` whole coordinator cycles; latencies are per cycle"""
+    num_scouts = max(agents // 2, 1)
+    num_executors = max(agents - num_scouts - 1, 1)
+    size = int(100 * math.sqrt(agents / 3))
+    environment = LunarEnvironment(width=size, height=size, num_targets=7 * agents, seed=0)
+    message_bus = MessageBus()
+    fleet = build_fleet(environment, message_bus, num_scouts, num_executors, seed=0,
+                        sink=NullSink(), vectorized=vectorized)
+    coordinator = MissionCoordinator(environment, message_bus, fleet, headless=True)
+    # Keep every agent busy for the whole measurement
+    coordinator._check_mission_complete = lambda: False
+    marks = []
+    coordinator.cycle_hooks.append(lambda cycle: marks.append(time.perf_counter()))
+
+    def step():
+        marks.clear()
+        marks.append(time.perf_counter())
+        coordinator.run_mission(max_cycles=coordinator.cycles_run + cycles)
+        return np.diff(marks).tolist()
+    return step, cycles
+
+
+# (suite, case name, setup, full sweep, quick sweep)
+CASES = (
+    ('environment', 'get_nearby_targets', setup_nearby_targets,
+     [{'size': 1000, 'targets': n} for n in (100, 1000, 10000, 100000)]
+     + [{'size': s, 'targets': 10000} for s in (300, 3000, 10000)],
+     [{'size': 1000, 'targets': n} for n in (1000, 100000)]),
+    ('environment', 'is_obstacle_free', setup_obstacle_free,
+     [{'size': 1000, 'obstacles': n} for n in (15, 150, 1500, 15000)],
+     [{'size': 1000, 'obstacles': n} for n in (15, 1500)]),
+    ('bus', 'send_and_drain', setup_bus_throughput,
+     [{'messages': m, 'recipients': r} for m in (1000, 10000, 100000) for r in (1, 16, 256)],
+     [{'messages': 10000, 'recipients': r} for r in (1, 256)]),
+    ('analyst', 'evaluate_batch', setup_analyst_scoring,
+     [{'batch': n} for n in (10, 100, 1000, 10000, 100000)],
+     [{'batch': n} for n in (100, 10000)]),
+    ('mission', 'cycle', setup_mission_cycles,
+     [{'agents': n, 'vectorized': v} for n in (3, 12, 48, 192, 768) for v in (False, True)],
+     [{'agents': n, 'vectorized': v} for n in (12, 192) for v in (False, True)]),
+)
+
+SUITES = tuple(dict.fromkeys(case[0] for case in CASES))
+
+
+def measure(setup, params, min_time=0.5, min_steps=5, max_steps=10000):
+    """Run one case: timings first, then a separate traced run for peak memory"""
+    step, ops = setup(**params)
+    step()  # warm-up: caches, lazy index builds
+    latencies = []
+    elapsed = 0.0
+    steps = 0
+    while steps < max_steps and (elapsed < min_time or steps < min_steps):
+        start = time.perf_counter()
+        samples = step()
+        duration = time.perf_counter() - start
+        elapsed += duration
+        steps += 1
+        latencies.extend(samples if samples is not None else [duration / ops])
+    latencies = np.array(latencies)
+
+    tracemalloc.start()
+    traced_step, _ = setup(**params)
+    traced_step()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) * 1e6
+    return {
+        'ops_per_sec': steps * ops / elapsed,
+        'latency_us': {'p50': p50, 'p90': p90, 'p99': p99, 'max': latencies.max() * 1e6},
+        'samples': len(latencies),
+        'peak_kb': peak / 1024,
+    }
+
+
+def run_suite(suites=SUITES, quick=False, min_time=0.5, report=None):
+    """Run the selected suites; returns the JSON-ready result document"""
+    results = []
+    for suite, name, setup, full, small in CASES:
+        if suite not in suites:
+            continue
+        for params in (small if quick else full):
+            row = {'suite': suite, 'name': name, 'params': params,
+                   **measure(setup, params, min_time=min_time)}
+            results.append(row)
+            if report is not None:
+                report(row)
+    return {
+        'version': RESULT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'quick': quick,
+        'results': results,
+    }
+
+
+def case_key(row):
+    return f"{row['suite']}.{row['name']} {json.dumps(row['params'], sort_keys=True)}"
+
+
+def format_row(row):
+    latency = row['latency_us']
+    return (f"{case_key(row):<64}{row['ops_per_sec']:>14,.0f}{latency['p50']:>10.2f}"
+            f"{latency['p99']:>10.2f}{row['peak_kb']:>11,.0f}")
+
+
+HEADER = f"{'case':<64}{'ops/s':>14}{'p50 us':>10}{'p99 us':>10}{'peak KB':>11}"
+
+
+def compare(baseline, current, tolerance=0.2):
+    """
+    Match cases by name and parameters and flag slowdowns: throughput down
+    or median latency up by more than `tolerance` (a fraction)
+    Returns [(key, base ops/s, new ops/s, change, flagged)] for shared cases
+    """
+    base_rows = {case_key(row): row for row in baseline['results']}
+    rows = []
+    for row in current['results']:
+        key = case_key(row)
+        base = base_rows.get(key)
+        if base is None:
+            continue
+        change = row['ops_per_sec'] / base['ops_per_sec'] - 1
+        latency_change = row['latency_us']['p50'] / base['latency_us']['p50'] - 1 if base['latency_us']['p50'] else 0
+        flagged = change < -tolerance or latency_change > tolerance
+        rows.append((key, base['ops_per_sec'], row['ops_per_sec'], change, flagged))
+    return rows
@@ -0,0 +1,126 @@
+"""
+Async Message Bus
+MessageBus variant for the asyncio coordinator
+Messages sent during a tick are staged and handed to each recipient's
+asyncio.Queue at the next tick boundary, so what an agent sees does not
+depend on how tasks interleave within a tick
+"""
+import asyncio
+from core.message_bus import MessageBus
+
+
+def _drain(queue):
+    messages = []
+    while not queue.empty():
+        messages.append(queue.get_nowait())
+    return messages
+
+
+def _refill(messages):
+    queue = asyncio.Queue()
+    for msg in messages:
+        queue.put_nowait(msg)
+    return queue
+
+
+class AsyncMessageBus(MessageBus):
+    def __init__(self, history_limit=10000, history_log=None, clock=None):
+        # Per-agent inboxes; the inherited deques act as this tick's outboxes
+        self.queues = {}
+        # Messages already taken off a queue by wait_for_mail, not yet read
+        self._stash = {}
+        # Agents blocked in wait_for_mail
+        self._parked = set()
+        self.clock = clock
+        super().__init__(history_limit, history_log)
+
+    def __getstate__(self):
+        # asyncio queues belong to one event loop: snapshot their contents as lists
+        state = self.__dict__.copy()
+        state['queues'] = {}
+        for name, queue in self.queues.items():
+            messages = _drain(queue)
+            for msg in messages:
+                queue.put_nowait(msg)
+            state['queues'][name] = messages
+        state['_parked'] = set()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.queues = {name: _refill(messages) for name, messages in state['queues'].items()}
+
+    def rebind(self):
+        """Fresh inbox queues (same contents) for a new event loop; nobody is parked"""
+        self.queues = {name: _refill(_drain(queue)) for name, queue in self.queues.items()}
+        self._parked = set()
+
+    def register(self, name, role=None):
+        """Open a mailbox and an inbox queue for an agent"""
+        if name not in self.queues:
+            self.queues[name] = asyncio.Queue()
+            self._stash[name] = []
+        return super().register(name, role)
+
+    def deliver(self):
+        """Move staged messages into inboxes, waking agents parked on them; returns the count"""
+        delivered = 0
+        for name, outbox in self.mailboxes.items():
+            if not outbox:
+                continue
+            if name in self._parked:
+                self._parked.discard(name)
+                if self.clock is not None:
+                    self.clock.wake()
+            queue = self.queues[name]
+            for msg in outbox:
+                queue.put_nowait(msg)
+            delivered += len(outbox)
+            outbox.clear()
+        return delivered
+
+    def get_messages(self, recipient):
+        """Drain everything delivered to a recipient so far (never blocks)"""
+        queue = self.queues.get(recipient)
+        if queue is None:
+            self.register(recipient)
+            return []
+        messages = self._stash[recipient]
+        self._stash[recipient] = []
+        while not queue.empty():
+            messages.append(queue.get_nowait())
+        return messages
+
+    async def wait_for_mail(self, recipient):
+        """Sleep until something is delivered to a recipient, without reading it"""
+        if recipient not in self.queues:
+            self.register(recipient)
+        queue = self.queues[recipient]
+        if self._stash[recipient] or not queue.empty():
+            return
+        self._parked.add(recipient)
+        if self.clock is not None:
+            self.clock.park()
+        self._stash[recipient].append(await queue.get())
+
+    async def get_messages_async(self, recipient):
+        """Awaitable get_messages: waits for at least one message"""
+        await self.wait_for_mail(recipient)
+        return self.get_messages(recipient)
+
+    async def subscription(self, recipient):
+        """Async iterator over a recipient's messages as they are delivered"""
+        while True:
+            for msg in await self.get_messages_async(recipient):
+                yield msg
+
+    def pending_count(self, recipient=None):
+        """Messages staged or delivered but not yet read"""
+        names = [recipient] if recipient is not None else list(self.queues)
+        return super().pending_count(recipient) + sum(
+            self.queues[name].qsize() + len(self._stash[name])
+            for name in names if name in self.queues)
+
+    def has_staged(self):
+        """True if any message is waiting for the next tick boundary"""
+        return any(self.mailboxes.values())
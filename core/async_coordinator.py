@@ -0,0 +1,169 @@
+"""
+Async Mission Coordinator
+Runs every agent as its own asyncio task, synchronised by a tick clock
+Agents with nothing to do sleep on their inbox until a message arrives;
+awaitable agent methods (a slow model, a planner in a thread) overlap with
+the other agents instead of stalling the whole cycle
+"""
+import asyncio
+import inspect
+from core.async_bus import AsyncMessageBus
+from core.coordinator import MissionCoordinator
+
+
+class TickClock:
+    """
+    Cycle barrier for agent tasks
+    Counts the agents awake in the current tick; the coordinator only starts
+    the next tick once every one of them has parked again, either on a
+    future tick or on its inbox
+    """
+
+    def __init__(self):
+        self.tick = 0
+        self.running = 0
+        self._sleepers = {}
+        self._settled = None
+
+    def wake(self):
+        """Count one more agent as running this tick"""
+        self.running += 1
+
+    def park(self):
+        """An agent has finished its work for now"""
+        self.running -= 1
+        if self.running == 0 and self._settled is not None and not self._settled.done():
+            self._settled.set_result(self.tick)
+
+    async def sleep_until(self, tick):
+        """Park the calling agent until the given tick starts"""
+        future = asyncio.get_running_loop().create_future()
+        self._sleepers.setdefault(tick, []).append(future)
+        self.park()
+        await future
+
+    def advance(self):
+        """Start the next tick, waking its sleepers in the order they parked"""
+        self.tick += 1
+        for future in self._sleepers.pop(self.tick, ()):
+            self.wake()
+            future.set_result(self.tick)
+        return self.tick
+
+    def reset(self, tick):
+        """Start over at a tick with no agents running or asleep (a new event loop)"""
+        self.tick = tick
+        self.running = 0
+        self._sleepers = {}
+        self._settled = None
+
+    def __getstate__(self):
+        # Futures belong to the event loop that made them
+        state = self.__dict__.copy()
+        state['running'] = 0
+        state['_sleepers'] = {}
+        state['_settled'] = None
+        return state
+
+    def has_sleepers(self):
+        return bool(self._sleepers)
+
+    async def settled(self):
+        """Wait until every agent woken this tick has parked again"""
+        if self.running == 0:
+            return self.tick
+        self._settled = asyncio.get_running_loop().create_future()
+        return await self._settled
+
+
+async def _resolve(result):
+    """Await the result of an agent method if it is a coroutine"""
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+class AsyncMissionCoordinator(MissionCoordinator):
+    """
+    MissionCoordinator with one asyncio task per agent
+    Messages sent during tick N are delivered at the start of tick N+1, and
+    agents woken in a tick run in a fixed order, so runs are reproducible
+    """
+
+    def __init__(self, environment, message_bus, agents, **kwargs):
+        if not isinstance(message_bus, AsyncMessageBus):
+            raise TypeError("AsyncMissionCoordinator needs an AsyncMessageBus")
+        super().__init__(environment, message_bus, agents, **kwargs)
+        self.clock = TickClock()
+        message_bus.clock = self.clock
+        self.steps_run = 0
+
+    async def _agent_loop(self, agent):
+        """One agent's life: step, then sleep until the next tick or the next message"""
+        clock, bus = self.clock, self.message_bus
+        has_work = getattr(agent, 'has_work', None)
+        while True:
+            await _resolve(agent.process_messages())
+            await _resolve(agent.take_action())
+            self.steps_run += 1
+            if has_work is None or has_work():
+                await clock.sleep_until(clock.tick + 1)
+            else:
+                await bus.wait_for_mail(agent.name)
+
+    async def run(self, max_cycles=50):
+        """Run the mission on the current event loop"""
+        sink, clock, bus = self.sink, self.clock, self.message_bus
+        sink.emit('mission_started')
+
+        # Agent tasks live in one event loop: a resumed (or restored) mission
+        # starts new ones at its next cycle
+        cycle = self.cycles_run
+        clock.reset(cycle)
+        bus.rebind()
+        tasks = []
+        try:
+            while self.mission_active and cycle < max_cycles:
+                cycle = clock.advance()
+                sink.emit('cycle_started', cycle=cycle)
+                bus.deliver()
+                if not tasks:
+                    # Tasks start in agent order and are all awake for the first tick
+                    for agent in self.agents:
+                        clock.wake()
+                        tasks.append(asyncio.create_task(self._agent_loop(agent), name=agent.name))
+
+                settled = asyncio.ensure_future(clock.settled())
+                done, _ = await asyncio.wait([settled, *tasks], return_when=asyncio.FIRST_COMPLETED)
+                if settled not in done:
+                    settled.cancel()
+                    # An agent task only finishes by raising: surface its error
+                    for task in tasks:
+                        if task in done:
+                            task.result()
+                if self.fleet is not None:
+                    self.fleet.step(self.environment, sink)
+
+                self._update_stats()
+                self._run_cycle_hooks(cycle)
+                if self._check_mission_complete():
+                    sink.emit('mission_complete', cycle=cycle)
+                    break
+                if not clock.has_sleepers() and not bus.has_staged():
+                    # Everyone is waiting for mail that nobody will send
+                    break
+
+                if self.cycle_delay:
+                    await asyncio.sleep(self.cycle_delay)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.cycles_run = cycle
+        self._print_mission_summary()
+        return self.mission_stats
+
+    def run_mission(self, max_cycles=50):
+        """Run the autonomous mission in a fresh event loop (a restored or paused mission resumes at its next cycle)"""
+        return asyncio.run(self.run(max_cycles))
@@ -0,0 +1,127 @@
+"""
+Batch Mission Runner
+Monte Carlo evaluation of mission strategies over many random seeds
+Each seed builds its own environment and agents and runs headless in a
+worker process; results come back as plain dict rows
+"""
+import csv
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_CONFIG = {
+    'width': 100,
+    'height': 100,
+    'num_targets': 20,
+    'max_cycles': 40,
+    'num_scouts': 1,
+    'num_executors': 1,
+    'path_planner': False,
+    'scout_strategy': 'sweep',
+    'vectorized': False,
+    'engine': 'sync',
+    'world': 'flat',
+    'allocation': 'greedy',
+    'routing': 'priority',
+}
+
+RESULT_FIELDS = ('seed', 'cycles', 'completed', 'targets_discovered', 'targets_collected',
+                 'decisions_made', 'distance_traveled', 'coverage_percent', 'total_value', 'wall_time')
+
+METRIC_FIELDS = ('cycles', 'targets_discovered', 'targets_collected', 'decisions_made',
+                 'distance_traveled', 'coverage_percent', 'total_value', 'wall_time')
+
+
+def build_mission(seed, config=None):
+    """Create a seeded environment, bus, agents and headless coordinator"""
+    from core.environment import LunarEnvironment
+    from core.message_bus import MessageBus
+    from core.coordinator import MissionCoordinator
+    from core.fleet import build_fleet
+    from core.path_planner import PathPlanner
+    from core.async_bus import AsyncMessageBus
+    from core.async_coordinator import AsyncMissionCoordinator
+    from core.event_coordinator import EventMissionCoordinator
+    from core.chunked_world import ChunkedLunarEnvironment
+
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    if config['world'] == 'chunked':
+        # Same expected number of targets, spread over lazily generated tiles
+        environment = ChunkedLunarEnvironment(
+            width=config['width'], height=config['height'], seed=seed,
+            target_density=config['num_targets'] / (config['width'] * config['height']))
+    else:
+        environment = LunarEnvironment(width=config['width'], height=config['height'],
+                                       num_targets=config['num_targets'], seed=seed)
+    asynchronous = config['engine'] == 'async'
+    message_bus = AsyncMessageBus() if asynchronous else MessageBus()
+    agents = build_fleet(environment, message_bus,
+                         num_scouts=config['num_scouts'], num_executors=config['num_executors'],
+                         planner=PathPlanner(environment) if config['path_planner'] else None,
+                         seed=seed, scout_strategy=config['scout_strategy'],
+                         vectorized=config['vectorized'], allocation=config['allocation'],
+                         routing=config['routing'])
+    coordinator_class = {'async': AsyncMissionCoordinator,
+                         'event': EventMissionCoordinator}.get(config['engine'], MissionCoordinator)
+    return coordinator_class(environment, message_bus, agents, headless=True)
+
+
+def run_seeded_mission(seed, config=None):
+    """Run one headless mission and return its result row"""
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    start = time.perf_counter()
+    coordinator = build_mission(seed, config)
+    stats = coordinator.run_mission(max_cycles=config['max_cycles'])
+    return {
+        'seed': seed,
+        'cycles': coordinator.cycles_run,
+        'completed': coordinator._check_mission_complete(),
+        **stats,
+        'total_value': round(coordinator.total_value, 6),
+        'wall_time': time.perf_counter() - start,
+    }
+
+
+def _run_job(job):
+    seed, config = job
+    return run_seeded_mission(seed, config)
+
+
+def run_batch(seeds, config=None, workers=None):
+    """Run one mission per seed across a process pool, in seed order"""
+    seeds = list(seeds)
+    if workers == 1:
+        return [run_seeded_mission(seed, config) for seed in seeds]
+    workers = workers or os.cpu_count() or 1
+    jobs = [(seed, config) for seed in seeds]
+    # Large chunks keep inter-process traffic small relative to mission work
+    chunksize = max(1, len(jobs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_job, jobs, chunksize=chunksize))
+
+
+def summarize(rows):
+    """Mean, standard deviation, min and max of each metric across runs"""
+    summary = {'runs': len(rows),
+               'completion_rate': sum(row['completed'] for row in rows) / len(rows) if rows else 0}
+    for field in METRIC_FIELDS:
+        values = [row[field] for row in rows]
+        if not values:
+            continue
+        summary[field] = {
+            'mean': statistics.fmean(values),
+            'stdev': statistics.stdev(values) if len(values) > 1 else 0.0,
+            'min': min(values),
+            'max': max(values),
+        }
+    return summary
+
+
+def write_csv(rows, path):
+    """Write result rows as CSV"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({field: row[field] for field in RESULT_FIELDS})
@@ -0,0 +1,265 @@
+"""
+Chunked World
+Lunar surface split into square tiles that are generated on first touch
+Each tile's rocks and obstacles come from a generator seeded with
+(world seed, tile x, tile y), so a tile evicted by the LRU policy is rebuilt
+bit-for-bit the next time a rover comes near it; discovered/collected flags
+live in a sparse side table and are re-applied on reload
+Only tiles around the fleet stay resident, so the per-cycle cost follows
+fleet activity rather than map area (10 km x 10 km worlds are cheap)
+"""
+import math
+from collections import OrderedDict
+import numpy as np
+from core.spatial_index import make_index
+from core.target_table import TargetTable, TARGET_TYPES, COMPOSITIONS, DISCOVERED, COLLECTED
+
+# Target ids are tile_number * TILE_ID_STRIDE + row inside the tile
+TILE_ID_STRIDE = 1 << 16
+
+# Largest generated obstacle; a point can be covered by obstacles of tiles
+# up to this far away
+MAX_OBSTACLE_RADIUS = 8.0
+
+
+class WorldTile:
+    """Targets and obstacles of one tile"""
+    __slots__ = ('key', 'base_id', 'targets', 'obstacle_x', 'obstacle_y', 'obstacle_radius')
+
+    def __init__(self, key, base_id, targets, obstacle_x, obstacle_y, obstacle_radius):
+        self.key = key
+        self.base_id = base_id
+        self.targets = targets
+        self.obstacle_x = obstacle_x
+        self.obstacle_y = obstacle_y
+        self.obstacle_radius = obstacle_radius
+
+    def target(self, row):
+        """Plain dict for one target, carrying its world-wide id"""
+        target = self.targets[row].to_dict()
+        target['id'] = self.base_id + row
+        return target
+
+    def obstacle_hits(self, xs, ys):
+        """Boolean mask of points strictly inside one of this tile's obstacles"""
+        if not len(self.obstacle_x):
+            return np.zeros(len(xs), dtype=bool)
+        dist = np.sqrt((xs[:, None] - self.obstacle_x)**2 + (ys[:, None] - self.obstacle_y)**2)
+        return (dist < self.obstacle_radius).any(axis=1)
+
+
+class ChunkedTargets:
+    """Dict-like access to targets by world id; iterates resident tiles only"""
+
+    def __init__(self, world):
+        self.world = world
+
+    def __getitem__(self, target_id):
+        tile, row = self.world._locate(target_id)
+        if tile is None:
+            raise IndexError(f"target id {target_id} out of range")
+        return tile.target(row)
+
+    def __iter__(self):
+        for tile in list(self.world.tiles.values()):
+            for row in range(len(tile.targets)):
+                yield tile.target(row)
+
+    def __len__(self):
+        """Targets currently resident in memory"""
+        return sum(len(tile.targets) for tile in self.world.tiles.values())
+
+
+class ChunkedLunarEnvironment:
+    """
+    Drop-in LunarEnvironment for large worlds
+    Densities are per square metre; the defaults match the 100 x 100 demo map
+    (20 targets, 15 obstacles). max_tiles bounds how many tiles stay resident
+    """
+    # Obstacles exist only for tiles generated so far, so no whole-map
+    # occupancy grid (PathPlanner) can be built from them
+    obstacles_on_demand = True
+
+    def __init__(self, width=10000, height=10000, tile_size=100.0, seed=None,
+                 target_density=0.002, obstacle_density=0.0015, max_tiles=1024, cell_size=10):
+        self.width = width
+        self.height = height
+        self.tile_size = float(tile_size)
+        self.tiles_x = max(int(math.ceil(width / self.tile_size)), 1)
+        self.tiles_y = max(int(math.ceil(height / self.tile_size)), 1)
+        # Fix an entropy value up front so regenerated tiles match even without a seed
+        self.seed = seed if seed is not None else np.random.SeedSequence().entropy
+        self.target_density = target_density
+        self.obstacle_density = obstacle_density
+        self.max_tiles = max_tiles
+        self.tiles = OrderedDict()
+        self.tiles_generated = 0
+        self.tiles_evicted = 0
+        self.targets = ChunkedTargets(self)
+        # Flags of every target ever discovered or collected: tile key -> {row: flags}
+        self._state = {}
+        self.discovered_targets = []
+        self.collected_targets = []
+        # Obstacles added at runtime are not part of any tile
+        self.dynamic_obstacles = []
+        self.obstacle_index = make_index('grid', cell_size)
+        self.hazard = None
+        self.obstacle_version = 0
+
+    @property
+    def obstacles(self):
+        """Obstacles of the resident tiles plus runtime ones (for display)"""
+        resident = [{'x': x, 'y': y, 'radius': r}
+                    for tile in self.tiles.values()
+                    for x, y, r in zip(tile.obstacle_x.tolist(), tile.obstacle_y.tolist(),
+                                       tile.obstacle_radius.tolist())]
+        return resident + self.dynamic_obstacles
+
+    def tile_of(self, x, y):
+        """Key of the tile containing a world position"""
+        return (math.floor(x / self.tile_size), math.floor(y / self.tile_size))
+
+    def tile(self, key):
+        """Resident tile for a key (generated if needed), or None outside the world"""
+        tx, ty = key
+        if not (0 <= tx < self.tiles_x and 0 <= ty < self.tiles_y):
+            return None
+        tile = self.tiles.get(key)
+        if tile is not None:
+            self.tiles.move_to_end(key)
+            return tile
+        tile = self._generate_tile(tx, ty)
+        self.tiles[key] = tile
+        self.tiles_generated += 1
+        while len(self.tiles) > self.max_tiles:
+            self.tiles.popitem(last=False)
+            self.tiles_evicted += 1
+        return tile
+
+    def _generate_tile(self, tx, ty):
+        """Deterministic contents of tile (tx, ty), with saved flags re-applied"""
+        rng = np.random.default_rng([self.seed, tx, ty])
+        x0, y0 = tx * self.tile_size, ty * self.tile_size
+        w = min(self.tile_size, self.width - x0)
+        h = min(self.tile_size, self.height - y0)
+
+        num = min(int(rng.poisson(self.target_density * w * h)), TILE_ID_STRIDE)
+        targets = TargetTable(x0 + rng.uniform(0, w, size=num), y0 + rng.uniform(0, h, size=num),
+                              rng.uniform(1, 10, size=num).astype(np.float32),
+                              rng.integers(len(TARGET_TYPES), size=num, dtype=np.uint8),
+                              rng.integers(len(COMPOSITIONS), size=num, dtype=np.uint8))
+        num = int(rng.poisson(self.obstacle_density * w * h))
+        obstacle_x = x0 + rng.uniform(0, w, size=num)
+        obstacle_y = y0 + rng.uniform(0, h, size=num)
+        obstacle_radius = rng.uniform(3, MAX_OBSTACLE_RADIUS, size=num)
+
+        for row, flags in self._state.get((tx, ty), {}).items():
+            targets.state[row] = flags
+        base_id = (ty * self.tiles_x + tx) * TILE_ID_STRIDE
+        return WorldTile((tx, ty), base_id, targets, obstacle_x, obstacle_y, obstacle_radius)
+
+    def _tiles_around(self, x, y, radius):
+        """Resident tiles overlapping the square of half-width radius around (x, y)"""
+        ts = self.tile_size
+        tiles = []
+        for tx in range(math.floor((x - radius) / ts), math.floor((x + radius) / ts) + 1):
+            for ty in range(math.floor((y - radius) / ts), math.floor((y + radius) / ts) + 1):
+                tile = self.tile((tx, ty))
+                if tile is not None:
+                    tiles.append(tile)
+        return tiles
+
+    def _locate(self, target_id):
+        """(tile, row) of a world target id, or (None, None)"""
+        number, row = divmod(int(target_id), TILE_ID_STRIDE)
+        if target_id < 0 or number >= self.tiles_x * self.tiles_y:
+            return None, None
+        tile = self.tile((number % self.tiles_x, number // self.tiles_x))
+        if row >= len(tile.targets):
+            return None, None
+        return tile, row
+
+    @property
+    def resident_tiles(self):
+        return len(self.tiles)
+
+    def discover_target(self, target_id):
+        """Mark a target as discovered"""
+        tile, row = self._locate(target_id)
+        if tile is None:
+            return None
+        if tile.targets.set_flag(row, DISCOVERED):
+            self._state.setdefault(tile.key, {})[row] = int(tile.targets.state[row])
+            self.discovered_targets.append(target_id)
+        return tile.target(row)
+
+    def collect_target(self, target_id):
+        """Mark a target as collected; False if it does not exist or was already collected"""
+        tile, row = self._locate(target_id)
+        if tile is None or not tile.targets.set_flag(row, COLLECTED):
+            return False
+        self._state.setdefault(tile.key, {})[row] = int(tile.targets.state[row])
+        self.collected_targets.append(target_id)
+        return True
+
+    def add_obstacle(self, x, y, radius):
+        """Place a new obstacle on the surface and return its index"""
+        obstacle_id = len(self.dynamic_obstacles)
+        self.dynamic_obstacles.append({'x': x, 'y': y, 'radius': radius})
+        self.obstacle_index.insert(obstacle_id, x, y, radius)
+        self.obstacle_version += 1
+        return obstacle_id
+
+    def remove_obstacle(self, obstacle_id):
+        """Clear a runtime obstacle; its slot is kept so other indices stay valid"""
+        if self.obstacle_index.remove(obstacle_id):
+            self.dynamic_obstacles[obstacle_id] = {'x': 0, 'y': 0, 'radius': 0}
+            self.obstacle_version += 1
+            return True
+        return False
+
+    def is_obstacle_free(self, x, y):
+        """Check if a position is free of obstacles"""
+        if self.obstacle_index.query_point(x, y):
+            return False
+        point_x, point_y = np.array([x], dtype=float), np.array([y], dtype=float)
+        for tile in self._tiles_around(x, y, MAX_OBSTACLE_RADIUS):
+            if tile.obstacle_hits(point_x, point_y)[0]:
+                return False
+        return self.hazard is None or not self.hazard.is_blocked(x, y)
+
+    def obstacle_free_mask(self, xs, ys):
+        """Vectorized is_obstacle_free over arrays of positions"""
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        blocked = self.obstacle_index.contains_points(xs, ys)
+        ts = self.tile_size
+        # The corners of each point's MAX_OBSTACLE_RADIUS box cover every tile
+        # whose obstacles can reach it
+        tx = np.floor(np.stack([xs - MAX_OBSTACLE_RADIUS, xs + MAX_OBSTACLE_RADIUS]) / ts).astype(np.int64)
+        ty = np.floor(np.stack([ys - MAX_OBSTACLE_RADIUS, ys + MAX_OBSTACLE_RADIUS]) / ts).astype(np.int64)
+        tx = np.concatenate([tx[0], tx[1], tx[0], tx[1]])
+        ty = np.concatenate([ty[0], ty[0], ty[1], ty[1]])
+        points = np.tile(np.arange(len(xs)), 4)
+        inside = (tx >= 0) & (tx < self.tiles_x) & (ty >= 0) & (ty < self.tiles_y)
+        pairs = np.unique(np.stack([(ty * self.tiles_x + tx)[inside], points[inside]]), axis=1)
+        numbers, starts = np.unique(pairs[0], return_index=True)
+        for number, group in zip(numbers.tolist(), np.split(pairs[1], starts[1:])):
+            tile = self.tile((number % self.tiles_x, number // self.tiles_x))
+            blocked[group] |= tile.obstacle_hits(xs[group], ys[group])
+        free = ~blocked
+        if self.hazard is not None:
+            free &= ~self.hazard.blocked_mask(xs, ys)
+        return free
+
+    def get_nearby_targets(self, x, y, radius, undiscovered_only=False):
+        """Find all targets within radius of position"""
+        found = []
+        for tile in self._tiles_around(x, y, radius):
+            table = tile.targets
+            rows = np.flatnonzero(np.sqrt((x - table.x)**2 + (y - table.y)**2) <= radius)
+            if undiscovered_only:
+                rows = rows[(table.state[rows] & DISCOVERED) == 0]
+            found.extend(tile.target(row) for row in rows.tolist())
+        found.sort(key=lambda target: target['id'])
+        return found
@@ -3,51 +3,105 @@ Mission Coordinator
 Orchestrates multi-agent lunar exploration mission
 """
 import time
+from core.events import ConsoleSink, NullSink
+from core.metrics import MissionMetrics
 
 class MissionCoordinator:
-    def __init__(self, environment, message_bus, agents):
+    def __init__(self, environment, message_bus, agents, headless=False, sink=None, cycle_delay=0.1):
         self.environment = environment
         self.message_bus = message_bus
         self.agents = agents
+        for agent in agents:
+            message_bus.register(agent.name, role=getattr(agent, 'role', None))
         self.mission_active = True
         self.mission_stats = {
             'targets_discovered': 0,
             'targets_collected': 0,
             'decisions_made': 0,
-            'distance_traveled': 0
+            'distance_traveled': 0,
+            'coverage_percent': 0.0
         }
+        # Scouts built together share one coverage map; take it from the first
+        self.coverage = next((agent.coverage for agent in agents
+                              if getattr(agent, 'coverage', None) is not None), None)
+        self.coverage_history = []
+        # Running counters fed by every message sent on the bus
+        self.metrics = MissionMetrics(environment, agents)
+        message_bus.message_hooks.append(self.metrics.on_message)
+        # Rovers sharing a FleetState are moved together after every agent has acted
+        self.fleet = next((agent.fleet for agent in agents
+                           if getattr(agent, 'fleet', None) is not None), None)
+        
+        # Headless runs skip the readability delay and narrate nothing by default
+        self.headless = headless
+        self.cycle_delay = 0 if headless else cycle_delay
+        if sink is None:
+            sink = NullSink() if headless else ConsoleSink()
+        self.sink = sink
+        for agent in agents:
+            agent.sink = sink
+        self.cycles_run = 0
+        self.total_value = 0
+        # Callables run as hook(cycle) at the end of every cycle (display, recording)
+        self.cycle_hooks = []
         
     def run_mission(self, max_cycles=50):
-        """Run the autonomous mission"""
-        print("\n🚀 LUNAR EXPLORATION MISSION INITIATED 🌙")
-        print("="*60)
+        """Run the autonomous mission (a restored or paused mission resumes at its next cycle)"""
+        sink = self.sink
+        sink.emit('mission_started')
+        
+        # Bind each agent's step methods once; attribute lookups add up across a fleet
+        steps = [(agent.process_messages, agent.take_action) for agent in self.agents]
         
-        cycle = 0
+        cycle = self.cycles_run
         while self.mission_active and cycle < max_cycles:
             cycle += 1
-            print(f"\n--- Cycle {cycle} ---")
+            sink.emit('cycle_started', cycle=cycle)
             
             # Each agent processes messages and takes actions
-            for agent in self.agents:
-                agent.process_messages()
-                agent.take_action()
+            for process_messages, take_action in steps:
+                process_messages()
+                take_action()
+            if self.fleet is not None:
+                self.fleet.step(self.environment, sink)
                 
             # Update mission statistics
             self._update_stats()
+            self._run_cycle_hooks(cycle)
             
             # Check if mission objectives met
             if self._check_mission_complete():
-                print("\n✅ MISSION OBJECTIVES ACHIEVED!")
+                sink.emit('mission_complete', cycle=cycle)
                 break
                 
-            time.sleep(0.1)  # Small delay for readability
+            if self.cycle_delay:
+                time.sleep(self.cycle_delay)  # Small delay for readability
         
+        self.cycles_run = cycle
         self._print_mission_summary()
+        return self.mission_stats
     
     def _update_stats(self):
         """Update mission statistics"""
-        self.mission_stats['targets_discovered'] = len(self.environment.discovered_targets)
-        self.mission_stats['targets_collected'] = len(self.environment.collected_targets)
+        metrics = self.metrics
+        metrics.update_distance()
+        self.mission_stats['targets_discovered'] = metrics.targets_discovered
+        self.mission_stats['targets_collected'] = metrics.targets_collected
+        self.mission_stats['decisions_made'] = metrics.decisions_made
+        self.mission_stats['distance_traveled'] = metrics.distance_traveled
+        if self.coverage is not None:
+            self.mission_stats['coverage_percent'] = self.coverage.coverage_percent
+            self.coverage_history.append(self.mission_stats['coverage_percent'])
+        
+    def _run_cycle_hooks(self, cycle):
+        for hook in self.cycle_hooks:
+            hook(cycle)
+        
+    def __getstate__(self):
+        # Hooks usually hold figures or files; snapshots leave them behind
+        state = self.__dict__.copy()
+        state['cycle_hooks'] = []
+        return state
         
     def _check_mission_complete(self):
         """Check if mission objectives are complete"""
@@ -55,22 +109,9 @@ class MissionCoordinator:
         return len(self.environment.collected_targets) >= 10
     
     def _print_mission_summary(self):
-        """Print final mission statistics"""
-        print("\n" + "="*60)
-        print("📊 MISSION SUMMARY")
-        print("="*60)
-        print(f"Targets Discovered: {self.mission_stats['targets_discovered']}")
-        print(f"Targets Collected: {self.mission_stats['targets_collected']}")
-        print(f"Decisions Made: {self.mission_stats['decisions_made']}")
-        print("\n🎯 Mission Value:")
-        
-        # Calculate mission value based on collected targets
-        total_value = 0
-        for target_id in self.environment.collected_targets:
-            target = self.environment.targets[target_id]
-            value = target['size'] * {'basalt': 1, 'anorthosite': 2, 'regolith': 1, 'ice': 5}.get(target['composition'], 1)
-            total_value += value
-            print(f"  • {target['type'].title()} ({target['composition']}) - Value: {value:.1f}")
-        
-        print(f"\n💎 Total Mission Value: {total_value:.1f}")
-        print("="*60)
+        """Report final mission statistics to the event sink"""
+        # Values were cached as targets were discovered and summed as they were collected
+        self.total_value = self.metrics.total_value
+        self.sink.emit('mission_summary', stats=dict(self.mission_stats),
+                       collected=list(self.metrics.collected), total_value=self.total_value,
+                       cycles=self.cycles_run)
@@ -0,0 +1,119 @@
+"""
+Coverage Map
+Incremental record of which parts of the surface the scouts' sensors have swept
+Keeps a per-scout frontier heap so picking the next unexplored cell is O(log n)
+"""
+import heapq
+import math
+import numpy as np
+
+
+class CoverageMap:
+    def __init__(self, width, height, cell_size=5.0):
+        self.width = width
+        self.height = height
+        self.cell_size = float(cell_size)
+        self.nx = max(int(math.ceil(width / self.cell_size)), 1)
+        self.ny = max(int(math.ceil(height / self.cell_size)), 1)
+        self.covered = np.zeros((self.nx, self.ny), dtype=bool)
+        self.blocked = np.zeros((self.nx, self.ny), dtype=bool)
+        self.covered_count = 0
+        self.total_cells = self.nx * self.ny
+        # owner -> heap of (-sweep number, squared distance, i, j)
+        self._frontiers = {}
+        self._sweeps = {}
+        self._compact_at = {}
+
+    @property
+    def coverage_percent(self):
+        """Share of the map swept by any sensor so far"""
+        return 100.0 * self.covered_count / self.total_cells
+
+    def cell_of(self, x, y):
+        """Grid cell containing a world position (clamped to the map)"""
+        i = min(max(int(x / self.cell_size), 0), self.nx - 1)
+        j = min(max(int(y / self.cell_size), 0), self.ny - 1)
+        return i, j
+
+    def cell_center(self, cell):
+        """World coordinates of a cell's centre"""
+        return ((cell[0] + 0.5) * self.cell_size, (cell[1] + 0.5) * self.cell_size)
+
+    def is_open(self, cell):
+        """True while a cell is neither covered nor marked unreachable"""
+        return not (self.covered[cell] or self.blocked[cell])
+
+    def mark_disk(self, x, y, radius, owner=None):
+        """
+        Mark a sensor footprint as covered and queue the uncovered cells
+        bordering it as frontier for the owning scout; returns cells newly covered
+        """
+        ci, cj = self.cell_of(x, y)
+        reach = int(math.ceil(radius / self.cell_size))
+        # Footprint window plus a one-cell ring for frontier detection, clipped to the map
+        i0, i1 = max(ci - reach - 1, 0), min(ci + reach + 2, self.nx)
+        j0, j1 = max(cj - reach - 1, 0), min(cj + reach + 2, self.ny)
+        di = np.arange(i0, i1)[:, None] - ci
+        dj = np.arange(j0, j1)[None, :] - cj
+        footprint = (di**2 + dj**2) * self.cell_size**2 <= radius**2
+
+        window = self.covered[i0:i1, j0:j1]
+        newly = footprint & ~window
+        count = int(newly.sum())
+        if count:
+            window |= newly
+            self.covered_count += count
+
+        if owner is not None:
+            self._push_frontier(owner, x, y, window, i0, j0)
+        return count
+
+    def _push_frontier(self, owner, x, y, window, i0, j0):
+        """Queue open cells 4-adjacent to covered ones in a window"""
+        near = np.zeros_like(window)
+        near[1:, :] |= window[:-1, :]
+        near[:-1, :] |= window[1:, :]
+        near[:, 1:] |= window[:, :-1]
+        near[:, :-1] |= window[:, 1:]
+        frontier = near & ~window & ~self.blocked[i0:i0 + window.shape[0], j0:j0 + window.shape[1]]
+        if not frontier.any():
+            return
+
+        sweep = self._sweeps.get(owner, 0) + 1
+        self._sweeps[owner] = sweep
+        heap = self._frontiers.setdefault(owner, [])
+        fi, fj = np.nonzero(frontier)
+        fi += i0
+        fj += j0
+        dist2 = ((fi + 0.5) * self.cell_size - x)**2 + ((fj + 0.5) * self.cell_size - y)**2
+        # Newest sweep first, nearest first within a sweep
+        for d, i, j in zip(dist2.tolist(), fi.tolist(), fj.tolist()):
+            heapq.heappush(heap, (-sweep, d, i, j))
+
+        # Stale entries from old sweeps sink to the bottom; compact once they dominate
+        if len(heap) > self._compact_at.get(owner, 1024):
+            live = [entry for entry in heap if self.is_open((entry[2], entry[3]))]
+            # Keep the newest entry per cell
+            seen = set()
+            compact = []
+            for entry in sorted(live):
+                if (entry[2], entry[3]) not in seen:
+                    seen.add((entry[2], entry[3]))
+                    compact.append(entry)
+            heapq.heapify(compact)
+            self._frontiers[owner] = compact
+            self._compact_at[owner] = 2 * len(compact) + 1024
+
+    def next_frontier(self, owner):
+        """Best open frontier cell for a scout, or None when it has run out"""
+        heap = self._frontiers.get(owner)
+        while heap:
+            _, _, i, j = heap[0]
+            if self.is_open((i, j)):
+                return (i, j)
+            heapq.heappop(heap)
+        return None
+
+    def mark_blocked(self, cell):
+        """Stop offering a cell as frontier (e.g. it lies inside an obstacle)"""
+        self.blocked[cell] = True
@@ -0,0 +1,109 @@
+"""
+Multi-Process Mission Runner
+Runs scouts, the analyst and executors in separate OS processes that talk
+through a BusServer over a Unix domain socket
+Every process rebuilds the same seeded environment; the processes step in
+lockstep at the server's tick barrier, and mission progress is tracked from
+the messages that pass through the bus
+"""
+import multiprocessing
+import os
+import tempfile
+import time
+from core.batch_runner import DEFAULT_CONFIG
+from core.metrics import target_value
+
+# Roles that get a process each; all members of a role share a process so
+# their shared environment replica stays consistent
+PROCESS_ROLES = ('scout', 'analyst', 'executor')
+
+
+def _build(seed, config, message_bus):
+    from core.environment import LunarEnvironment
+    from core.fleet import build_fleet
+    from core.path_planner import PathPlanner
+    from core.events import NullSink
+
+    environment = LunarEnvironment(width=config['width'], height=config['height'],
+                                   num_targets=config['num_targets'], seed=seed)
+    agents = build_fleet(environment, message_bus,
+                         num_scouts=config['num_scouts'], num_executors=config['num_executors'],
+                         planner=PathPlanner(environment) if config['path_planner'] else None,
+                         seed=seed, sink=NullSink(), scout_strategy=config['scout_strategy'])
+    return environment, agents
+
+
+def _role_process(role, seed, config, path):
+    """Worker: run every agent of one role until the server says stop"""
+    from core.transport import RemoteMessageBus, UnixSocketTransport
+
+    message_bus = RemoteMessageBus(UnixSocketTransport(path))
+    _, agents = _build(seed, config, message_bus)
+    agents = [agent for agent in agents if agent.role == role]
+    try:
+        while not message_bus.barrier():
+            for agent in agents:
+                agent.process_messages()
+                agent.take_action()
+    finally:
+        message_bus.close()
+
+
+def run_multiprocess_mission(seed, config=None, socket_path=None):
+    """Run one mission with one process per role; returns a batch-runner style row"""
+    from core.message_bus import MessageBus
+    from core.transport import BusServer
+
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    start = time.perf_counter()
+    socket_dir = None
+    if socket_path is None:
+        socket_dir = tempfile.mkdtemp(prefix='lunar-bus-')
+        socket_path = os.path.join(socket_dir, 'bus.sock')
+
+    # Register the fleet up front so role order does not depend on process start-up
+    message_bus = MessageBus()
+    environment, _ = _build(seed, config, message_bus)
+    discovered, collected = set(), []
+
+    def on_tick(tick, messages):
+        for msg in messages:
+            if msg.msg_type == "TARGET_DISCOVERED":
+                discovered.add(msg.content['target_id'])
+            elif msg.msg_type == "TARGET_COLLECTED" and msg.content['target_id'] not in collected:
+                collected.append(msg.content['target_id'])
+        # Tick N's barrier delivers what was sent during cycle N
+        return len(collected) >= 10 or tick >= config['max_cycles']
+
+    server = BusServer(socket_path, message_bus, parties=len(PROCESS_ROLES), on_tick=on_tick).start()
+    context = multiprocessing.get_context('spawn')
+    workers = [context.Process(target=_role_process, args=(role, seed, config, socket_path),
+                               name=f"lunar-{role}")
+               for role in PROCESS_ROLES]
+    try:
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    finally:
+        server.close()
+        if socket_dir is not None:
+            os.rmdir(socket_dir)
+    failed = [worker.name for worker in workers if worker.exitcode]
+    if failed:
+        raise RuntimeError(f"Mission processes failed: {', '.join(failed)}")
+
+    total_value = 0
+    for target_id in collected:
+        target = environment.targets[target_id]
+        total_value += target_value(target['size'], target['composition'])
+    return {
+        'seed': seed,
+        'cycles': server.tick - 1,
+        'completed': len(collected) >= 10,
+        'targets_discovered': len(discovered),
+        'targets_collected': len(collected),
+        'total_value': round(total_value, 6),
+        'messages': message_bus.next_seq,
+        'wall_time': time.perf_counter() - start,
+    }
@@ -2,77 +2,129 @@
 Lunar Environment Simulator
 Simulates lunar surface with rocks, craters, and obstacles
 """
-import random
 import numpy as np
+from core.spatial_index import make_index
+from core.target_table import TargetTable, TARGET_TYPES, COMPOSITIONS, DISCOVERED, COLLECTED
 
 class LunarEnvironment:
-    def __init__(self, width=100, height=100, num_targets=20):
+    def __init__(self, width=100, height=100, num_targets=20, index='grid', cell_size=10, seed=None):
         self.width = width
         self.height = height
+        # Dedicated generator: the same seed always gives the same map
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
         self.targets = self._generate_targets(num_targets)
         self.obstacles = self._generate_obstacles(15)
+        # Optional impassable-terrain raster (see core.survey.HazardMap)
+        self.hazard = None
+        # Bumped whenever obstacles change so cached plans can be invalidated
+        self.obstacle_version = 0
         self.discovered_targets = []
         self.collected_targets = []
+        self._build_indexes(index, cell_size)
+        
+    @classmethod
+    def from_survey(cls, catalog, hazard=None, obstacles=(), cell_size=10):
+        """
+        World backed by survey files instead of random generation
+        catalog is a TargetCatalog or its directory; hazard an optional HazardMap
+        Nothing is read up front: both stay memory-mapped and are paged in by queries
+        """
+        from core.survey import TargetCatalog
+        if not isinstance(catalog, TargetCatalog):
+            catalog = TargetCatalog(catalog)
+        env = cls.__new__(cls)
+        env.width = catalog.width
+        env.height = catalog.height
+        env.seed = None
+        env.rng = np.random.default_rng()
+        env.targets = catalog.table
+        env.obstacles = [dict(obs) for obs in obstacles]
+        env.hazard = hazard
+        env.obstacle_version = 0
+        env.discovered_targets = []
+        env.collected_targets = []
+        env.target_index = catalog.index
+        env._build_obstacle_index('grid', cell_size)
+        return env
+    
+    def _build_indexes(self, index, cell_size):
+        """Bucket targets and obstacles so queries only touch nearby cells"""
+        xs, ys = self.targets.x, self.targets.y
+        self.target_index = make_index(index, cell_size)
+        self.target_index.bulk_insert(xs, ys)
+        self._build_obstacle_index(index, cell_size)
+    
+    def _build_obstacle_index(self, index, cell_size):
+        self.obstacle_index = make_index(index, cell_size)
+        for i, obs in enumerate(self.obstacles):
+            self.obstacle_index.insert(i, obs['x'], obs['y'], obs['radius'])
         
     def _generate_targets(self, num):
         """Generate interesting targets (rocks, craters) on lunar surface"""
-        targets = []
-        for i in range(num):
-            target = {
-                'id': i,
-                'x': random.randint(10, self.width - 10),
-                'y': random.randint(10, self.height - 10),
-                'type': random.choice(['rock', 'crater', 'anomaly']),
-                'size': random.uniform(1, 10),
-                'composition': random.choice(['basalt', 'anorthosite', 'regolith', 'ice']),
-                'discovered': False,
-                'collected': False
-            }
-            targets.append(target)
-        return targets
+        rng = self.rng
+        x = rng.integers(10, self.width - 10, size=num, endpoint=True).astype(np.float64)
+        y = rng.integers(10, self.height - 10, size=num, endpoint=True).astype(np.float64)
+        type_code = rng.integers(len(TARGET_TYPES), size=num, dtype=np.uint8)
+        size = rng.uniform(1, 10, size=num).astype(np.float32)
+        composition_code = rng.integers(len(COMPOSITIONS), size=num, dtype=np.uint8)
+        return TargetTable(x, y, size, type_code, composition_code)
     
     def _generate_obstacles(self, num):
         """Generate obstacles that robots must avoid"""
-        obstacles = []
-        for _ in range(num):
-            obstacles.append({
-                'x': random.randint(0, self.width),
-                'y': random.randint(0, self.height),
-                'radius': random.uniform(3, 8)
-            })
-        return obstacles
+        rng = self.rng
+        xs = rng.integers(0, self.width, size=num, endpoint=True).tolist()
+        ys = rng.integers(0, self.height, size=num, endpoint=True).tolist()
+        radii = rng.uniform(3, 8, size=num).tolist()
+        return [{'x': x, 'y': y, 'radius': radius} for x, y, radius in zip(xs, ys, radii)]
     
     def discover_target(self, target_id):
         """Mark a target as discovered"""
         if target_id < len(self.targets):
-            self.targets[target_id]['discovered'] = True
-            if target_id not in self.discovered_targets:
+            if self.targets.set_flag(target_id, DISCOVERED):
                 self.discovered_targets.append(target_id)
             return self.targets[target_id]
         return None
     
     def collect_target(self, target_id):
-        """Mark a target as collected"""
-        if target_id < len(self.targets):
-            self.targets[target_id]['collected'] = True
-            if target_id not in self.collected_targets:
-                self.collected_targets.append(target_id)
+        """Mark a target as collected; False if it does not exist or was already collected"""
+        if target_id < len(self.targets) and self.targets.set_flag(target_id, COLLECTED):
+            self.collected_targets.append(target_id)
+            return True
+        return False
+    
+    def add_obstacle(self, x, y, radius):
+        """Place a new obstacle on the surface and return its index"""
+        obstacle_id = len(self.obstacles)
+        self.obstacles.append({'x': x, 'y': y, 'radius': radius})
+        self.obstacle_index.insert(obstacle_id, x, y, radius)
+        self.obstacle_version += 1
+        return obstacle_id
+    
+    def remove_obstacle(self, obstacle_id):
+        """Clear an obstacle; its slot is kept so other indices stay valid"""
+        if self.obstacle_index.remove(obstacle_id):
+            self.obstacles[obstacle_id] = {'x': 0, 'y': 0, 'radius': 0}
+            self.obstacle_version += 1
             return True
         return False
     
     def is_obstacle_free(self, x, y):
         """Check if a position is free of obstacles"""
-        for obs in self.obstacles:
-            dist = np.sqrt((x - obs['x'])**2 + (y - obs['y'])**2)
-            if dist < obs['radius']:
-                return False
-        return True
+        if self.obstacle_index.query_point(x, y):
+            return False
+        return self.hazard is None or not self.hazard.is_blocked(x, y)
+    
+    def obstacle_free_mask(self, xs, ys):
+        """Vectorized is_obstacle_free over arrays of positions"""
+        free = ~self.obstacle_index.contains_points(xs, ys)
+        if self.hazard is not None:
+            free &= ~self.hazard.blocked_mask(xs, ys)
+        return free
     
-    def get_nearby_targets(self, x, y, radius):
+    def get_nearby_targets(self, x, y, radius, undiscovered_only=False):
         """Find all targets within radius of position"""
-        nearby = []
-        for target in self.targets:
-            dist = np.sqrt((x - target['x'])**2 + (y - target['y'])**2)
-            if dist <= radius:
-                nearby.append(target)
-        return nearby
+        ids = self.target_index.query_radius(x, y, radius)
+        if undiscovered_only:
+            ids = ids[(self.targets.state[ids] & DISCOVERED) == 0]
+        return [self.targets[i] for i in ids.tolist()]
@@ -0,0 +1,178 @@
+"""
+Event Mission Coordinator
+Discrete-event variant of the mission loop: agents are stepped only at
+cycles they have something scheduled, and the clock jumps straight to the
+next scheduled cycle when nothing happens in between
+An agent is scheduled for the next cycle while it has work, wakes when a
+message lands in its mailbox (later in the same cycle if it comes after
+the sender, as in the round-robin loop), and may ask for a later cycle
+itself: a rover on a direct approach sleeps until it could first arrive
+"""
+import heapq
+import time
+from core.async_bus import AsyncMessageBus
+from core.coordinator import MissionCoordinator
+
+
+class EventQueue:
+    """
+    Earliest-first queue of (cycle, agent index) wake-ups
+    Each agent holds at most one live entry; rescheduling it earlier
+    supersedes the old entry, which is skipped when it surfaces
+    Within a cycle agents wake in agent order, like the round-robin loop
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._due = {}
+
+    def __len__(self):
+        return len(self._due)
+
+    def schedule(self, cycle, index):
+        """Wake an agent at a cycle, replacing whatever was scheduled for it"""
+        self._due[index] = cycle
+        heapq.heappush(self._heap, (cycle, index))
+
+    def wake(self, cycle, index):
+        """Wake an agent at a cycle unless it is already due by then"""
+        due = self._due.get(index)
+        if due is None or cycle < due:
+            self.schedule(cycle, index)
+
+    def cancel(self, index):
+        """Drop an agent's wake-up; it sleeps until the next wake()"""
+        self._due.pop(index, None)
+
+    def due(self, index):
+        """Cycle an agent is scheduled for, or None while it sleeps"""
+        return self._due.get(index)
+
+    def _skip_stale(self):
+        heap = self._heap
+        while heap and self._due.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def next_cycle(self):
+        """Earliest scheduled cycle, or None when every agent sleeps"""
+        self._skip_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop(self, cycle):
+        """Next agent index due at this cycle, or None once the cycle is drained"""
+        self._skip_stale()
+        if not self._heap or self._heap[0][0] != cycle:
+            return None
+        _, index = heapq.heappop(self._heap)
+        del self._due[index]
+        return index
+
+
+class EventMissionCoordinator(MissionCoordinator):
+    """
+    MissionCoordinator that skips idle agents and idle cycles
+    Agents may define next_wake(cycle) -> cycle or None to pick their own
+    next step (default: the next cycle while has_work(), else mail only)
+    and advance_to(cycle) to catch up on moves they slept through; the
+    coordinator calls it before stepping them and at the end of every
+    processed cycle, so positions are current for other agents and hooks
+    Cycle hooks and stats run only at processed cycles
+    """
+
+    def __init__(self, environment, message_bus, agents, **kwargs):
+        if isinstance(message_bus, AsyncMessageBus):
+            raise TypeError("EventMissionCoordinator needs a synchronous MessageBus")
+        super().__init__(environment, message_bus, agents, **kwargs)
+        self.events = EventQueue()
+        self._index = {agent.name: i for i, agent in enumerate(agents)}
+        # Agents sleeping through a multi-cycle move, by index
+        self._coasting = {}
+        self._cycle = None
+        self._running = -1
+        self.steps_run = 0
+        self.cycles_skipped = 0
+        message_bus.delivery_hook = self._on_delivery
+        for i in range(len(agents)):
+            self.events.schedule(self.cycles_run + 1, i)
+
+    def _on_delivery(self, name):
+        """Mail wakes its recipient: this cycle if it has not had its turn yet, else the next"""
+        index = self._index.get(name)
+        if index is None:
+            return
+        if self._cycle is None:
+            self.events.wake(self.cycles_run + 1, index)
+        else:
+            self.events.wake(self._cycle + (index <= self._running), index)
+
+    def _step(self, index, cycle):
+        agent = self.agents[index]
+        coasting = self._coasting.pop(index, None)
+        if coasting is not None:
+            coasting.advance_to(cycle - 1)
+        self._running = index
+        agent.process_messages()
+        agent.take_action()
+        self.steps_run += 1
+
+        next_wake = getattr(agent, 'next_wake', None)
+        if next_wake is not None:
+            wake = next_wake(cycle)
+        else:
+            has_work = getattr(agent, 'has_work', None)
+            wake = cycle + 1 if has_work is None or has_work() else None
+        if wake is not None:
+            # Mail that arrived during the step may already have it due sooner
+            self.events.wake(wake, index)
+            if wake > cycle + 1 and hasattr(agent, 'advance_to'):
+                self._coasting[index] = agent
+
+    def _settle(self, cycle):
+        """Replay slept-through moves up to the end of this cycle"""
+        for agent in self._coasting.values():
+            agent.advance_to(cycle)
+
+    def run_mission(self, max_cycles=50):
+        """Run the mission, stepping only scheduled agents (a restored mission resumes where it stopped)"""
+        sink, events = self.sink, self.events
+        sink.emit('mission_started')
+
+        cycle = self.cycles_run
+        while self.mission_active:
+            next_cycle = events.next_cycle()
+            if next_cycle is None:
+                # Everyone is waiting for mail that nobody will send
+                break
+            if next_cycle > max_cycles:
+                # Nothing happens before the end: jump there
+                self.cycles_skipped += max_cycles - cycle
+                cycle = max_cycles
+                self._settle(cycle)
+                self._update_stats()
+                break
+            self.cycles_skipped += next_cycle - cycle - 1
+            cycle = self._cycle = next_cycle
+            sink.emit('cycle_started', cycle=cycle)
+
+            index = events.pop(cycle)
+            while index is not None:
+                self._step(index, cycle)
+                index = events.pop(cycle)
+            self._running = -1
+            if self.fleet is not None:
+                self.fleet.step(self.environment, sink)
+            self._settle(cycle)
+
+            self._update_stats()
+            self._run_cycle_hooks(cycle)
+            if self._check_mission_complete():
+                sink.emit('mission_complete', cycle=cycle)
+                break
+
+            if self.cycle_delay:
+                time.sleep(self.cycle_delay)
+
+        self._cycle = None
+        self.cycles_run = cycle
+        self._print_mission_summary()
+        return self.mission_stats
@@ -0,0 +1,115 @@
+"""
+Mission Events
+Structured event sinks for agent and coordinator activity
+ConsoleSink reproduces the narrated demo output; NullSink, MemorySink and
+FileSink support headless batch runs
+"""
+import json
+from collections import deque
+
+
+def _format_mission_summary(fields):
+    """Multi-line end-of-mission report"""
+    stats = fields['stats']
+    lines = [
+        "\n" + "="*60,
+        "📊 MISSION SUMMARY",
+        "="*60,
+        f"Targets Discovered: {stats['targets_discovered']}",
+        f"Targets Collected: {stats['targets_collected']}",
+        f"Decisions Made: {stats['decisions_made']}",
+        "\n🎯 Mission Value:",
+    ]
+    for target_type, composition, value in fields['collected']:
+        lines.append(f"  • {target_type.title()} ({composition}) - Value: {value:.1f}")
+    lines.append(f"\n💎 Total Mission Value: {fields['total_value']:.1f}")
+    lines.append("="*60)
+    return "\n".join(lines)
+
+
+# Console rendering for each event kind: a format string or a callable
+CONSOLE_FORMATS = {
+    'mission_started': "\n🚀 LUNAR EXPLORATION MISSION INITIATED 🌙\n" + "="*60,
+    'cycle_started': "\n--- Cycle {cycle} ---",
+    'mission_complete': "\n✅ MISSION OBJECTIVES ACHIEVED!",
+    'mission_summary': _format_mission_summary,
+    'exploration_request': "  🔭 {agent}: Received exploration request for area {area}",
+    'target_discovered': "  🔭 {agent}: DISCOVERED {type} at ({x:.1f}, {y:.1f})",
+    'scout_moved': "  🔭 {agent}: Moving to ({x:.1f}, {y:.1f})",
+    'target_evaluated': "  🧠 {agent}: Evaluated Target #{target_id} - Score: {score:.1f} - Priority: {priority}",
+    'executor_at_capacity': "  🤖 {agent}: At maximum carrying capacity ({capacity})",
+    'collection_assigned': "  🤖 {agent}: New mission - Target #{target_id} at ({x:.1f}, {y:.1f})",
+    'target_collected': "  🤖 {agent}: ✅ COLLECTED Target #{target_id} ({count}/{capacity})",
+    'executor_moved': "  🤖 {agent}: Moving to ({x:.1f}, {y:.1f}) [{distance:.1f}m from target]",
+    'obstacle_avoided': "  🤖 {agent}: Avoiding obstacle, moving to ({x:.1f}, {y:.1f})",
+}
+
+
+class EventSink:
+    """Base sink; subclasses decide what to do with each event"""
+    enabled = True
+
+    def emit(self, kind, **fields):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class NullSink(EventSink):
+    """Discards everything (fastest headless mode)"""
+    enabled = False
+
+    def emit(self, kind, **fields):
+        pass
+
+
+class MemorySink(EventSink):
+    """Keeps (kind, fields) tuples in memory, optionally only the newest N"""
+
+    def __init__(self, limit=None):
+        self.events = deque(maxlen=limit)
+
+    def emit(self, kind, **fields):
+        self.events.append((kind, fields))
+
+    def of_kind(self, kind):
+        """All recorded events of one kind"""
+        return [fields for event_kind, fields in self.events if event_kind == kind]
+
+
+class FileSink(EventSink):
+    """Writes one JSON object per event to a JSON Lines file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def emit(self, kind, **fields):
+        self._file.write(json.dumps({'kind': kind, **fields}, default=str))
+        self._file.write('\n')
+
+    def __getstate__(self):
+        self._file.flush()
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        # A restored sink carries on appending to the same file
+        self.path = state['path']
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def close(self):
+        self._file.close()
+
+
+class ConsoleSink(EventSink):
+    """Narrates the mission on stdout, as in the interactive demo"""
+
+    def __init__(self, formats=None):
+        self.formats = formats or CONSOLE_FORMATS
+
+    def emit(self, kind, **fields):
+        fmt = self.formats.get(kind)
+        if fmt is None:
+            return
+        print(fmt(fields) if callable(fmt) else fmt.format(**fields))
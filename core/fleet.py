@@ -0,0 +1,63 @@
+"""
+Fleet Builder
+Creates N scouts, one analyst and M executors wired to a shared bus
+Scouts and executors are spread over a lattice covering the map
+"""
+import math
+import random
+from agents.scout import ScoutAgent
+from agents.analyst import AnalystAgent
+from agents.executor import ExecutorAgent
+from core.coverage import CoverageMap
+from core.fleet_state import FleetState
+from core.task_allocation import TaskAllocator
+from core.route_optimizer import RouteOptimizer
+
+
+def lattice_positions(count, width, height, offset):
+    """count points on a near-square lattice; offset is the position inside each cell (0-1)"""
+    columns = math.ceil(math.sqrt(count))
+    rows = math.ceil(count / columns) if count else 0
+    cell_w, cell_h = width / columns if columns else 0, height / rows if rows else 0
+    return [((i % columns + offset) * cell_w, (i // columns + offset) * cell_h)
+            for i in range(count)]
+
+
+def build_fleet(environment, message_bus, num_scouts=1, num_executors=1,
+                planner=None, seed=None, sink=None, scout_strategy="sweep", vectorized=False,
+                allocation="greedy", routing="priority"):
+    """
+    Agents for a mission: Scout-1..N, Analyst, Executor-1..M
+    With one of each this matches the classic demo layout: the scout at
+    (20, 20) and the executor at (50, 50) on a 100 x 100 map
+    All scouts share one coverage map so frontier scouts avoid each other's ground
+    vectorized=True puts every rover's position in one FleetState that the
+    coordinator moves in a single pass per cycle
+    allocation="hungarian" has the analyst assign orders with a TaskAllocator
+    over the executors' live positions, queues and capacity instead of by load
+    routing="tour" gives each executor a RouteOptimizer so it visits its
+    queue as one planned tour rather than in score order
+    """
+    width, height = environment.width, environment.height
+    coverage = CoverageMap(width, height)
+    agents = []
+    for i, (x, y) in enumerate(lattice_positions(num_scouts, width, height, 0.2), start=1):
+        name = f"Scout-{i}"
+        rng = random.Random(f"{seed}:{name}") if seed is not None else None
+        agents.append(ScoutAgent(name, environment, message_bus, start_x=x, start_y=y,
+                                 sink=sink, rng=rng, strategy=scout_strategy, coverage=coverage))
+    analyst = AnalystAgent("Analyst", environment, message_bus, sink=sink)
+    agents.append(analyst)
+    executors = [ExecutorAgent(f"Executor-{i}", environment, message_bus, start_x=x, start_y=y,
+                               sink=sink, planner=planner,
+                               route=RouteOptimizer(planner) if routing == "tour" else None)
+                 for i, (x, y) in enumerate(lattice_positions(num_executors, width, height, 0.5), start=1)]
+    agents.extend(executors)
+    if allocation == "hungarian":
+        analyst.allocator = TaskAllocator(executors)
+    if vectorized:
+        fleet = FleetState(capacity=num_scouts + num_executors)
+        for agent in agents:
+            if agent.role != "analyst":
+                fleet.add(agent)
+    return agents
@@ -0,0 +1,191 @@
+"""
+Fleet State
+Shared position arrays for every rover in a mission
+In vectorized mode agents only request a move during take_action; the
+coordinator then moves the whole fleet, with one obstacle check, per cycle
+"""
+import numpy as np
+
+# Movement requested for a rover this cycle
+MOVE_NONE = 0
+MOVE_TOWARDS = 1   # Executor-style: straight at the goal, sidestep if blocked
+MOVE_SWEEP = 2     # Scout sweep: best of the fixed neighbour offsets
+MOVE_FRONTIER = 3  # Straight at a frontier cell; sweep instead if blocked
+
+# Scout sweep offsets, in the order candidates are considered
+SWEEP_OFFSETS = ((10, 0), (-10, 0), (0, 10), (0, -10), (7, 7), (-7, 7), (7, -7), (-7, -7))
+_SWEEP_DX = np.array([dx for dx, _ in SWEEP_OFFSETS], dtype=float)
+_SWEEP_DY = np.array([dy for _, dy in SWEEP_OFFSETS], dtype=float)
+
+
+class RoverView:
+    """
+    Position storage for mobile agents
+    Detached agents keep x/y and the odometer on the instance; once added
+    to a FleetState they read and write their row of the shared arrays
+    instead (the fleet's step adds its own moves to the odometer)
+    """
+    fleet = None
+    slot = None
+    _odometer = 0.0
+
+    @property
+    def x(self):
+        return self._x if self.fleet is None else float(self.fleet.x[self.slot])
+
+    @x.setter
+    def x(self, value):
+        if self.fleet is None:
+            self._x = value
+        else:
+            self.fleet.x[self.slot] = value
+
+    @property
+    def y(self):
+        return self._y if self.fleet is None else float(self.fleet.y[self.slot])
+
+    @y.setter
+    def y(self, value):
+        if self.fleet is None:
+            self._y = value
+        else:
+            self.fleet.y[self.slot] = value
+
+    @property
+    def odometer(self):
+        """Total distance moved"""
+        return self._odometer if self.fleet is None else float(self.fleet.odometer[self.slot])
+
+    @odometer.setter
+    def odometer(self, value):
+        if self.fleet is None:
+            self._odometer = value
+        else:
+            self.fleet.odometer[self.slot] = value
+
+
+class FleetState:
+    def __init__(self, capacity=16):
+        self.agents = []
+        self.count = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """(Re)size the per-rover arrays, keeping existing rows"""
+        fields = {
+            'x': float, 'y': float,        # position
+            'vx': float, 'vy': float,      # displacement during the last step
+            'goal_x': float, 'goal_y': float,
+            'speed': float,
+            'odometer': float,             # total distance moved
+            'mode': np.uint8,
+        }
+        for name, dtype in fields.items():
+            new = np.zeros(capacity, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def __len__(self):
+        return self.count
+
+    def add(self, agent):
+        """Move an agent's position into the shared arrays; returns its slot"""
+        if self.count == len(self.x):
+            self._allocate(2 * self.count)
+        slot = self.count
+        self.x[slot], self.y[slot] = agent.x, agent.y
+        self.odometer[slot] = agent.odometer
+        self.count += 1
+        self.agents.append(agent)
+        agent.fleet, agent.slot = self, slot
+        return slot
+
+    def request_move(self, slot, mode, goal_x=0.0, goal_y=0.0, speed=0.0):
+        """Record the move a rover wants to make at the end of this cycle"""
+        self.mode[slot] = mode
+        self.goal_x[slot] = goal_x
+        self.goal_y[slot] = goal_y
+        self.speed[slot] = speed
+
+    def step(self, environment, sink):
+        """Apply every requested move in one vectorized pass"""
+        n = self.count
+        mode = self.mode[:n]
+        x, y = self.x[:n], self.y[:n]
+        start_x, start_y = x.copy(), y.copy()
+        agents = self.agents
+
+        # Candidate points: the direct step for straight movers, 8 sweep
+        # offsets for scouts (also the fallback for blocked frontier moves)
+        straight = np.flatnonzero((mode == MOVE_TOWARDS) | (mode == MOVE_FRONTIER))
+        sweeping = np.flatnonzero((mode == MOVE_SWEEP) | (mode == MOVE_FRONTIER))
+
+        # Same float operations as ExecutorAgent._move_towards
+        dx = self.goal_x[straight] - x[straight]
+        dy = self.goal_y[straight] - y[straight]
+        distance = np.sqrt(dx**2 + dy**2)
+        moving = distance > 0
+        straight, dx, dy, distance = straight[moving], dx[moving], dy[moving], distance[moving]
+        step = np.minimum(self.speed[straight], distance)
+        dx = (dx / distance) * step
+        dy = (dy / distance) * step
+        direct_x, direct_y = x[straight] + dx, y[straight] + dy
+        # Perpendicular sidesteps, as computed by the scalar executor
+        side_dx = dy / distance * step
+        side_dy = dx / distance * step
+        towards = mode[straight] == MOVE_TOWARDS
+        sweep_x = x[sweeping, None] + _SWEEP_DX
+        sweep_y = y[sweeping, None] + _SWEEP_DY
+
+        points_x = np.concatenate([direct_x, x[straight] + side_dx, x[straight] - side_dx,
+                                   sweep_x.ravel()])
+        points_y = np.concatenate([direct_y, y[straight] - side_dy, y[straight] + side_dy,
+                                   sweep_y.ravel()])
+        free = environment.obstacle_free_mask(points_x, points_y)
+        k = len(straight)
+        direct_free, right_free, left_free = free[:k], free[k:2 * k], free[2 * k:3 * k]
+        in_bounds = ((points_x >= 0) & (points_x < environment.width)
+                     & (points_y >= 0) & (points_y < environment.height))
+        sweep_ok = (free & in_bounds)[3 * k:].reshape(-1, len(SWEEP_OFFSETS))
+
+        # Executors: direct step, else first free sidestep, else stay put
+        go = towards & direct_free
+        x[straight[go]], y[straight[go]] = direct_x[go], direct_y[go]
+        right = towards & ~direct_free & right_free
+        x[straight[right]] = x[straight[right]] + side_dx[right]
+        y[straight[right]] = y[straight[right]] - side_dy[right]
+        left = towards & ~direct_free & ~right_free & left_free
+        x[straight[left]] = x[straight[left]] - side_dx[left]
+        y[straight[left]] = y[straight[left]] + side_dy[left]
+
+        # Frontier scouts must also stay on the map
+        frontier_ok = ~towards & direct_free & in_bounds[:k]
+        x[straight[frontier_ok]] = direct_x[frontier_ok]
+        y[straight[frontier_ok]] = direct_y[frontier_ok]
+        sweep_needed = mode[sweeping] == MOVE_SWEEP
+        sweep_needed[np.searchsorted(sweeping, straight[~towards & ~frontier_ok])] = True
+        for slot in straight[~towards & ~frontier_ok].tolist():
+            agents[slot]._frontier_blocked()
+
+        if sink.enabled:
+            for slot, dist in zip(straight[go].tolist(), distance[go].tolist()):
+                sink.emit('executor_moved', agent=agents[slot].name, x=float(x[slot]),
+                          y=float(y[slot]), distance=dist)
+            for slot in np.concatenate([straight[right], straight[left]]).tolist():
+                sink.emit('obstacle_avoided', agent=agents[slot].name, x=float(x[slot]),
+                          y=float(y[slot]))
+            for slot in straight[frontier_ok].tolist():
+                sink.emit('scout_moved', agent=agents[slot].name, x=float(x[slot]), y=float(y[slot]))
+
+        # Sweep choice needs each scout's visited cells and random tie-break
+        for row in np.flatnonzero(sweep_needed).tolist():
+            ok = sweep_ok[row]
+            agents[sweeping[row]]._take_sweep_move(
+                list(zip(sweep_x[row][ok].tolist(), sweep_y[row][ok].tolist())))
+
+        self.vx[:n] = x - start_x
+        self.vy[:n] = y - start_y
+        self.odometer[:n] += np.sqrt(self.vx[:n]**2 + self.vy[:n]**2)
+        mode[:] = MOVE_NONE
@@ -2,45 +2,141 @@
 Message Bus for Agent Communication
 Enables asynchronous message passing between agents
 """
+import time
 from collections import deque
-from datetime import datetime
+from core.message_history import MessageHistory
 
 class Message:
-    def __init__(self, sender, recipient, msg_type, content):
+    __slots__ = ('seq', 'sender', 'recipient', 'msg_type', 'content', 'timestamp')
+    
+    def __init__(self, sender, recipient, msg_type, content, timestamp=None, seq=0):
+        self.seq = seq
         self.sender = sender
         self.recipient = recipient
         self.msg_type = msg_type
         self.content = content
-        self.timestamp = datetime.now()
+        # Monotonic nanoseconds: cheap to take and never goes backwards
+        self.timestamp = time.monotonic_ns() if timestamp is None else timestamp
     
     def __repr__(self):
         return f"[{self.sender} → {self.recipient}] {self.msg_type}: {self.content}"
+    
+    def to_record(self):
+        """Flatten into a list for serialization"""
+        return [self.seq, self.timestamp, self.sender, self.recipient, self.msg_type, self.content]
+    
+    @classmethod
+    def from_record(cls, record):
+        """Rebuild a message from to_record() output"""
+        seq, timestamp, sender, recipient, msg_type, content = record
+        return cls(sender, recipient, msg_type, content, timestamp=timestamp, seq=seq)
 
 class MessageBus:
-    def __init__(self):
-        self.messages = deque()
-        self.message_history = []
+    # Optional callable(recipient) run whenever a message lands in a mailbox
+    delivery_hook = None
+    
+    def __init__(self, history_limit=10000, history_log=None):
+        self.mailboxes = {}
+        self.subscriptions = {}
+        self.message_history = MessageHistory(history_limit, history_log)
+        self.next_seq = 0
+        self.roles = {}
+        self._role_cursor = {}
+        # msg_type -> mailboxes a broadcast of that type reaches
+        self._fanout = {}
+        # Callables(msg) run once for every message sent, in the order added
+        self.message_hooks = []
+        
+    def register(self, name, role=None):
+        """Open a mailbox for an agent so it also receives broadcasts"""
+        if name not in self.mailboxes:
+            self.mailboxes[name] = deque()
+            self._fanout.clear()
+        if role is not None and name not in self.roles.setdefault(role, []):
+            self.roles[role].append(name)
+        return self.mailboxes[name]
+    
+    def members(self, role):
+        """Names registered under a role, in registration order"""
+        return self.roles.get(role, [])
+    
+    def subscribe(self, name, msg_types):
+        """Only deliver the given message types to an agent"""
+        self.register(name)
+        self.subscriptions.setdefault(name, set()).update(msg_types)
+        self._fanout.clear()
+    
+    def unsubscribe(self, name):
+        """Drop an agent's topic filter so it receives everything again"""
+        self.subscriptions.pop(name, None)
+        self._fanout.clear()
+    
+    def _broadcast_targets(self, msg_type):
+        """(name, mailbox) pairs subscribed to a message type, cached per type"""
+        targets = self._fanout.get(msg_type)
+        if targets is None:
+            targets = [(name, mailbox) for name, mailbox in self.mailboxes.items()
+                       if name not in self.subscriptions or msg_type in self.subscriptions[name]]
+            self._fanout[msg_type] = targets
+        return targets
         
     def send_message(self, sender, recipient, msg_type, content):
         """Send a message from one agent to another"""
-        msg = Message(sender, recipient, msg_type, content)
-        self.messages.append(msg)
+        msg = Message(sender, recipient, msg_type, content, seq=self.next_seq)
+        self.next_seq += 1
+        hook = self.delivery_hook
+        if recipient == "ALL":
+            # Fan out to every other interested mailbox
+            for name, mailbox in self._broadcast_targets(msg_type):
+                if name != sender:
+                    mailbox.append(msg)
+                    if hook is not None:
+                        hook(name)
+        else:
+            topics = self.subscriptions.get(recipient)
+            if topics is None or msg_type in topics:
+                self.register(recipient).append(msg)
+                if hook is not None:
+                    hook(recipient)
         self.message_history.append(msg)
+        for message_hook in self.message_hooks:
+            message_hook(msg)
         return msg
     
     def get_messages(self, recipient):
         """Get all messages for a specific recipient"""
-        recipient_msgs = [msg for msg in self.messages if msg.recipient == recipient or msg.recipient == "ALL"]
+        mailbox = self.mailboxes.get(recipient)
+        if mailbox is None:
+            self.register(recipient)
+            return []
+        recipient_msgs = list(mailbox)
         # Remove retrieved messages
-        self.messages = deque([msg for msg in self.messages if msg.recipient != recipient and msg.recipient != "ALL"])
+        mailbox.clear()
         return recipient_msgs
     
+    def pending_count(self, recipient=None):
+        """Number of undelivered messages, for one recipient or in total"""
+        if recipient is not None:
+            return len(self.mailboxes.get(recipient, ()))
+        return sum(len(mailbox) for mailbox in self.mailboxes.values())
+    
+    def send_to_role(self, sender, role, msg_type, content):
+        """Send to one member of a role, rotating round-robin; None if the role is empty"""
+        names = self.roles.get(role)
+        if not names:
+            return None
+        cursor = self._role_cursor.get(role, 0) % len(names)
+        self._role_cursor[role] = cursor + 1
+        return self.send_message(sender, names[cursor], msg_type, content)
+    
     def broadcast(self, sender, msg_type, content):
         """Broadcast a message to all agents"""
         return self.send_message(sender, "ALL", msg_type, content)
     
     def get_history(self, limit=None):
-        """Get message history"""
-        if limit:
-            return self.message_history[-limit:]
-        return self.message_history
+        """Get the most recent message history held in memory"""
+        return self.message_history.recent(limit)
+    
+    def close(self):
+        """Write any buffered history out to the audit log"""
+        self.message_history.close()
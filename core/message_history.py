@@ -0,0 +1,84 @@
+"""
+Message History
+Bounded ring buffer of bus traffic with an optional on-disk audit log
+Records evicted from memory are appended to a JSON Lines file that can be
+streamed back for offline replay
+"""
+import json
+from collections import deque
+from itertools import islice
+
+
+def _encode_default(obj):
+    """JSON fallback for NumPy scalars/arrays and other odd payloads"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    return str(obj)
+
+
+class MessageHistory:
+    def __init__(self, limit=10000, log_path=None):
+        self.limit = limit
+        self.log_path = log_path
+        self.records = deque()
+        self.total = 0
+        self._log = None
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getstate__(self):
+        # Snapshots keep the log path; the file is reopened for append on the next spill
+        self.flush()
+        return {**self.__dict__, '_log': None}
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def append(self, msg):
+        """Record a message, spilling the oldest one once the buffer is full"""
+        if self.limit and len(self.records) >= self.limit:
+            self._spill(self.records.popleft())
+        self.records.append(msg)
+        self.total += 1
+
+    def recent(self, limit=None):
+        """The newest records still held in memory, oldest first"""
+        if not limit or limit >= len(self.records):
+            return list(self.records)
+        return list(islice(self.records, len(self.records) - limit, None))
+
+    def _spill(self, msg):
+        """Append an evicted record to the audit log, if one is configured"""
+        if self.log_path is None:
+            return
+        if self._log is None:
+            self._log = open(self.log_path, 'a', encoding='utf-8')
+        self._log.write(json.dumps(msg.to_record(), default=_encode_default))
+        self._log.write('\n')
+
+    def flush(self):
+        """Push buffered log writes to disk"""
+        if self._log is not None:
+            self._log.flush()
+
+    def close(self):
+        """Spill everything still in memory so the log holds the full trail"""
+        if self.log_path is not None:
+            while self.records:
+                self._spill(self.records.popleft())
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
+def read_message_log(path):
+    """Stream Message records back from an audit log, oldest first"""
+    from core.message_bus import Message
+
+    with open(path, encoding='utf-8') as log:
+        for line in log:
+            if line.strip():
+                yield Message.from_record(json.loads(line))
@@ -0,0 +1,79 @@
+"""
+Mission Metrics
+Running mission counters kept up to date from bus traffic as it is sent:
+discoveries (TARGET_DISCOVERED), collection orders (COLLECT_TARGET and
+batched COLLECT_TARGETS) and collections (TARGET_COLLECTED)
+A target's mission value is worked out once, when it is discovered, so
+the running total and the summary never rescan the collected targets
+Distance traveled is read from the rovers' odometers, which count every
+step where it is made (multi-waypoint path steps and moves an event
+engine replays included)
+"""
+
+# Mission value multiplier per composition
+COMPOSITION_VALUES = {'basalt': 1, 'anorthosite': 2, 'regolith': 1, 'ice': 5}
+
+
+def target_value(size, composition):
+    """Mission value of one collected target"""
+    return size * COMPOSITION_VALUES.get(composition, 1)
+
+
+class MissionMetrics:
+    def __init__(self, environment, agents=()):
+        self.environment = environment
+        self.targets_discovered = 0
+        self.targets_collected = 0
+        self.decisions_made = 0
+        self.distance_traveled = 0.0
+        self.total_value = 0
+        # (type, composition, value) per collected target, in collection order
+        self.collected = []
+        # target_id -> (type, composition, value) for discovered, uncollected targets
+        self._values = {}
+        rovers = [agent for agent in agents if getattr(agent, 'role', None) in ('scout', 'executor')]
+        self.fleet = next((rover.fleet for rover in rovers if rover.fleet is not None), None)
+        # Rovers outside the FleetState keep their own odometers
+        self._rovers = [rover for rover in rovers if rover.fleet is None]
+
+    def on_message(self, msg):
+        """Bus message hook: count one sent message"""
+        msg_type = msg.msg_type
+        if msg_type == "TARGET_DISCOVERED":
+            content = msg.content
+            self.targets_discovered += 1
+            self._values[content['target_id']] = (
+                content['type'], content['composition'],
+                target_value(content['size'], content['composition']))
+        elif msg_type == "COLLECT_TARGET":
+            self.decisions_made += 1
+        elif msg_type == "COLLECT_TARGETS":
+            self.decisions_made += len(msg.content)
+        elif msg_type == "TARGET_COLLECTED":
+            target_id = msg.content['target_id']
+            entry = self._values.pop(target_id, None)
+            if entry is None:
+                # Discovered without a report on the bus
+                target = self.environment.targets[target_id]
+                entry = (target['type'], target['composition'],
+                         target_value(target['size'], target['composition']))
+            self.targets_collected += 1
+            self.total_value += entry[2]
+            self.collected.append(entry)
+
+    def update_distance(self):
+        """Total the rovers' odometers"""
+        distance = float(sum(rover.odometer for rover in self._rovers))
+        if self.fleet is not None:
+            distance += float(self.fleet.odometer[:len(self.fleet)].sum())
+        self.distance_traveled = distance
+
+    def stats(self):
+        """Current counters"""
+        return {
+            'targets_discovered': self.targets_discovered,
+            'targets_collected': self.targets_collected,
+            'decisions_made': self.decisions_made,
+            'distance_traveled': self.distance_traveled,
+            'total_value': self.total_value,
+        }
@@ -0,0 +1,206 @@
+"""
+Path Planner
+A* search over a rasterized occupancy grid of the lunar surface
+Obstacles are inflated by a clearance margin; plans are cached per
+(start cell, goal cell) and dropped when the environment's obstacles change
+"""
+import heapq
+import math
+from collections import OrderedDict
+import numpy as np
+
+# 8-connected moves: (di, dj, cost in cells)
+_NEIGHBORS = [(1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+              (1, 1, math.sqrt(2)), (1, -1, math.sqrt(2)),
+              (-1, 1, math.sqrt(2)), (-1, -1, math.sqrt(2))]
+
+
+class OccupancyGrid:
+    """Boolean raster of blocked cells; cell (i, j) covers [i*res, (i+1)*res)"""
+
+    def __init__(self, environment, resolution=2.0, clearance=1.0):
+        if getattr(environment, 'obstacles_on_demand', False):
+            raise ValueError("an occupancy grid needs every obstacle up front; "
+                             "worlds generated tile by tile cannot be planned over")
+        self.environment = environment
+        self.resolution = float(resolution)
+        self.clearance = clearance
+        self.nx = int(math.ceil(environment.width / self.resolution)) + 1
+        self.ny = int(math.ceil(environment.height / self.resolution)) + 1
+        self.blocked = np.zeros((self.nx, self.ny), dtype=bool)
+        self.version = None
+        self.rebuild()
+
+    def rebuild(self):
+        """Rasterize every obstacle disk (plus clearance) into the grid"""
+        res = self.resolution
+        self.blocked[:] = False
+        centers_x = (np.arange(self.nx) + 0.5) * res
+        centers_y = (np.arange(self.ny) + 0.5) * res
+        for obs in self.environment.obstacles:
+            radius = obs['radius'] + self.clearance
+            if obs['radius'] <= 0:
+                continue
+            i0 = max(int((obs['x'] - radius) / res), 0)
+            i1 = min(int((obs['x'] + radius) / res) + 1, self.nx)
+            j0 = max(int((obs['y'] - radius) / res), 0)
+            j1 = min(int((obs['y'] + radius) / res) + 1, self.ny)
+            if i0 >= i1 or j0 >= j1:
+                continue
+            dx = centers_x[i0:i1, None] - obs['x']
+            dy = centers_y[None, j0:j1] - obs['y']
+            self.blocked[i0:i1, j0:j1] |= dx**2 + dy**2 < radius**2
+        hazard = getattr(self.environment, 'hazard', None)
+        if hazard is not None:
+            # Sample the hazard raster at every cell centre
+            grid_x, grid_y = np.meshgrid(centers_x, centers_y, indexing='ij')
+            self.blocked |= hazard.blocked_mask(grid_x.ravel(), grid_y.ravel()).reshape(self.nx, self.ny)
+        # Flat byte copy for the planner's inner loop (index i * ny + j)
+        self.blocked_flat = self.blocked.tobytes()
+        self.version = self.environment.obstacle_version
+
+    def cell_of(self, x, y):
+        """Grid cell containing a world position (clamped to the grid)"""
+        i = min(max(int(x / self.resolution), 0), self.nx - 1)
+        j = min(max(int(y / self.resolution), 0), self.ny - 1)
+        return i, j
+
+    def cell_center(self, cell):
+        """World coordinates of a cell's centre"""
+        return ((cell[0] + 0.5) * self.resolution, (cell[1] + 0.5) * self.resolution)
+
+    def segment_free(self, start, end):
+        """True if the straight segment between two world points crosses no blocked cell"""
+        length = math.sqrt((end[0] - start[0])**2 + (end[1] - start[1])**2)
+        steps = max(int(length / (0.5 * self.resolution)), 1) + 1
+        t = np.linspace(0.0, 1.0, steps)
+        i = np.clip(((start[0] + (end[0] - start[0]) * t) / self.resolution).astype(int), 0, self.nx - 1)
+        j = np.clip(((start[1] + (end[1] - start[1]) * t) / self.resolution).astype(int), 0, self.ny - 1)
+        return not self.blocked[i, j].any()
+
+
+class PathPlanner:
+    def __init__(self, environment, resolution=2.0, clearance=1.0,
+                 max_expansions=100000, cache_size=1024):
+        self.environment = environment
+        self.grid = OccupancyGrid(environment, resolution, clearance)
+        self.max_expansions = max_expansions
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.stats = {'plans': 0, 'cache_hits': 0, 'expansions': 0, 'failures': 0}
+
+    @property
+    def version(self):
+        """Obstacle version the current grid and cache were built from"""
+        return self.grid.version
+
+    def _sync(self):
+        """Rebuild the grid and drop cached plans if obstacles changed"""
+        if self.grid.version != self.environment.obstacle_version:
+            self.grid.rebuild()
+            self.cache.clear()
+
+    def plan(self, start, goal):
+        """
+        Waypoints from start to goal (goal included, start excluded),
+        or None if the goal is unreachable within the expansion budget
+        """
+        self._sync()
+        self.stats['plans'] += 1
+        grid = self.grid
+        start_cell = grid.cell_of(*start)
+        goal_cell = grid.cell_of(*goal)
+        key = (start_cell, goal_cell)
+
+        if key in self.cache:
+            self.stats['cache_hits'] += 1
+            self.cache.move_to_end(key)
+            cells = self.cache[key]
+        else:
+            if grid.segment_free(grid.cell_center(start_cell), grid.cell_center(goal_cell)):
+                cells = []
+            else:
+                cells = self._astar(start_cell, goal_cell)
+                if cells is not None:
+                    cells = self._smooth(start_cell, cells)
+            self.cache[key] = cells
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+        if cells is None:
+            self.stats['failures'] += 1
+            return None
+        return [grid.cell_center(cell) for cell in cells] + [tuple(goal)]
+
+    def _astar(self, start, goal):
+        """Cells from start (excluded) to goal (included) on the 8-connected grid"""
+        grid = self.grid
+        nx, ny = grid.nx, grid.ny
+        blocked = grid.blocked_flat
+        goal_i, goal_j = goal
+        start_k = start[0] * ny + start[1]
+        goal_k = goal_i * ny + goal_j
+        diagonal_extra = math.sqrt(2) - 1
+
+        g_score = {start_k: 0.0}
+        came_from = {}
+        closed = set()
+        open_heap = [(0.0, 0.0, start_k)]
+        expansions = 0
+
+        while open_heap:
+            _, g, k = heapq.heappop(open_heap)
+            if k in closed:
+                continue
+            if k == goal_k:
+                path = []
+                while k != start_k:
+                    path.append(divmod(k, ny))
+                    k = came_from[k]
+                path.reverse()
+                self.stats['expansions'] += expansions
+                return path
+            closed.add(k)
+            expansions += 1
+            if expansions > self.max_expansions:
+                break
+
+            i, j = divmod(k, ny)
+            for di, dj, cost in _NEIGHBORS:
+                ni, nj = i + di, j + dj
+                if not (0 <= ni < nx and 0 <= nj < ny):
+                    continue
+                nk = ni * ny + nj
+                # The goal cell may sit inside the clearance margin
+                if blocked[nk] and nk != goal_k:
+                    continue
+                # No cutting corners past blocked cells
+                if di and dj and (blocked[nk - dj] or blocked[nk - di * ny]):
+                    continue
+                tentative = g + cost
+                if tentative < g_score.get(nk, math.inf):
+                    g_score[nk] = tentative
+                    came_from[nk] = k
+                    # Octile distance heuristic
+                    hi, hj = abs(ni - goal_i), abs(nj - goal_j)
+                    h = (hi + diagonal_extra * hj) if hi > hj else (hj + diagonal_extra * hi)
+                    heapq.heappush(open_heap, (tentative + h, tentative, nk))
+
+        self.stats['expansions'] += expansions
+        return None
+
+    def _smooth(self, start, cells):
+        """Drop intermediate cells that have a clear line of sight past them"""
+        grid = self.grid
+        smoothed = []
+        anchor = grid.cell_center(start)
+        k = 0
+        while k < len(cells):
+            # Furthest cell still visible from the anchor
+            far = k
+            while far + 1 < len(cells) and grid.segment_free(anchor, grid.cell_center(cells[far + 1])):
+                far += 1
+            smoothed.append(cells[far])
+            anchor = grid.cell_center(cells[far])
+            k = far + 1
+        return smoothed
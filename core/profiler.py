@@ -0,0 +1,218 @@
+"""
+Mission Profiler
+Opt-in instrumentation for a running coordinator
+attach() shadows the hot methods (agent process_messages/take_action,
+environment queries, bus reads, the fleet step) with timed wrappers on the
+instances themselves and detach() removes them again, so an unprofiled
+mission runs the original code with no checks at all
+Collects call counts, total/max time and latency histograms per
+method, per-cycle durations and per-agent inbox depths; exports a summary
+dict, a CSV table and a Chrome trace-event JSON (chrome://tracing, Perfetto)
+"""
+import csv
+import json
+import os
+import time
+from collections import deque
+
+AGENT_METHODS = ('process_messages', 'take_action')
+ENVIRONMENT_METHODS = ('get_nearby_targets', 'is_obstacle_free', 'obstacle_free_mask')
+BUS_METHODS = ('get_messages',)
+
+# Latency histogram: four buckets per power of two (25% resolution) in nanoseconds
+HISTOGRAM_BUCKETS = 4 * 64
+
+
+def _bucket(ns):
+    """Histogram bucket of a duration: its bit length and the two bits after the leading one"""
+    bits = ns.bit_length()
+    return ns if bits < 3 else (bits << 2) | ((ns >> (bits - 3)) & 3)
+
+
+def _bucket_limit(bucket):
+    """Exclusive upper bound, in ns, of a histogram bucket"""
+    if bucket < 8:
+        return bucket + 1
+    bits, sub = bucket >> 2, bucket & 3
+    return (5 + sub) << (bits - 3)
+
+
+PROFILE_FIELDS = ('name', 'calls', 'total_ms', 'mean_us', 'p50_us', 'p99_us', 'max_us')
+
+
+class Timer:
+    """Running statistics for one instrumented method"""
+    __slots__ = ('calls', 'total_ns', 'max_ns', 'histogram')
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def add(self, ns):
+        self.calls += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.histogram[_bucket(ns)] += 1
+
+    def percentile(self, fraction):
+        """Upper bound of the histogram bucket holding the given fraction of calls, in ns"""
+        wanted = fraction * self.calls
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= wanted:
+                return min(_bucket_limit(bucket), self.max_ns)
+        return self.max_ns
+
+
+class MissionProfiler:
+    def __init__(self, trace=True, max_events=200000):
+        self.timers = {}
+        self.cycle_times = []
+        self.queue_depths = {}
+        self.trace = trace
+        # Newest events win once the trace buffer is full
+        self.events = deque(maxlen=max_events)
+        self._threads = {}
+        self._patched = []
+        self._cycle_start = None
+        self._origin = time.perf_counter_ns()
+
+    def timer(self, name):
+        if name not in self.timers:
+            self.timers[name] = Timer()
+        return self.timers[name]
+
+    def _thread(self, name):
+        """Trace-viewer row for an agent (or the coordinator)"""
+        if name not in self._threads:
+            self._threads[name] = len(self._threads) + 1
+        return self._threads[name]
+
+    def _wrap(self, owner, method, name, span=None):
+        """Shadow owner.method with a timed wrapper; span is the trace row, if any"""
+        original = getattr(owner, method)
+        timer = self.timer(name)
+        clock = time.perf_counter_ns
+        events = self.events if self.trace and span is not None else None
+        tid = self._thread(span) if events is not None else None
+        origin = self._origin
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                timer.add(elapsed)
+                if events is not None:
+                    events.append((method, tid, start - origin, elapsed))
+
+        setattr(owner, method, timed)
+        self._patched.append((owner, method))
+
+    def attach(self, coordinator):
+        """Instrument a coordinator's agents, environment, bus and fleet"""
+        for agent in coordinator.agents:
+            for method in AGENT_METHODS:
+                self._wrap(agent, method, f'{agent.name}.{method}', span=agent.name)
+        environment = coordinator.environment
+        for method in ENVIRONMENT_METHODS:
+            if hasattr(environment, method):
+                self._wrap(environment, method, f'environment.{method}')
+        for method in BUS_METHODS:
+            self._wrap(coordinator.message_bus, method, f'bus.{method}')
+        if coordinator.fleet is not None:
+            self._wrap(coordinator.fleet, 'step', 'fleet.step', span='Coordinator')
+        self.coordinator = coordinator
+        self._names = [agent.name for agent in coordinator.agents]
+        coordinator.cycle_hooks.append(self.on_cycle)
+        self._cycle_start = time.perf_counter_ns()
+        return self
+
+    def detach(self):
+        """Restore the original methods (needed before snapshotting the mission)"""
+        for owner, method in self._patched:
+            # The wrappers are instance attributes shadowing the class methods
+            del owner.__dict__[method]
+        self._patched = []
+        hooks = self.coordinator.cycle_hooks
+        if self.on_cycle in hooks:
+            hooks.remove(self.on_cycle)
+
+    def on_cycle(self, cycle):
+        """Cycle hook: close the cycle's span and sample the inbox depths"""
+        now = time.perf_counter_ns()
+        elapsed = now - self._cycle_start
+        self.cycle_times.append(elapsed)
+        bus = self.coordinator.message_bus
+        depths = {name: bus.pending_count(name) for name in self._names}
+        for name, depth in depths.items():
+            self.queue_depths.setdefault(name, []).append(depth)
+        if self.trace:
+            self.events.append((f'cycle {cycle}', 0, self._cycle_start - self._origin, elapsed))
+            self.events.append(('queue depth', None, now - self._origin, depths))
+        self._cycle_start = time.perf_counter_ns()
+
+    def summary(self):
+        """Plain-dict report: per-method timers, cycle times and inbox depths"""
+        methods = {}
+        for name, timer in sorted(self.timers.items(), key=lambda item: -item[1].total_ns):
+            if not timer.calls:
+                continue
+            methods[name] = {
+                'calls': timer.calls,
+                'total_ms': timer.total_ns / 1e6,
+                'mean_us': timer.total_ns / timer.calls / 1e3,
+                'p50_us': timer.percentile(0.5) / 1e3,
+                'p99_us': timer.percentile(0.99) / 1e3,
+                'max_us': timer.max_ns / 1e3,
+            }
+        cycles = self.cycle_times
+        return {
+            'cycles': len(cycles),
+            'cycle_mean_ms': sum(cycles) / len(cycles) / 1e6 if cycles else 0.0,
+            'cycle_max_ms': max(cycles) / 1e6 if cycles else 0.0,
+            'methods': methods,
+            'queue_depths': {name: {'mean': sum(d) / len(d), 'max': max(d)}
+                             for name, d in self.queue_depths.items() if d},
+        }
+
+    def format_summary(self, limit=15):
+        """Text table of the most expensive methods"""
+        report = self.summary()
+        lines = [f"{report['cycles']} cycles, mean {report['cycle_mean_ms']:.2f} ms, "
+                 f"max {report['cycle_max_ms']:.2f} ms",
+                 f"{'method':<34}{'calls':>9}{'total ms':>11}{'mean us':>10}{'p99 us':>10}"]
+        for name, row in list(report['methods'].items())[:limit]:
+            lines.append(f"{name:<34}{row['calls']:>9}{row['total_ms']:>11.2f}"
+                         f"{row['mean_us']:>10.1f}{row['p99_us']:>10.1f}")
+        return "\n".join(lines)
+
+    def write_csv(self, path):
+        """One row per instrumented method"""
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=PROFILE_FIELDS)
+            writer.writeheader()
+            for name, row in self.summary()['methods'].items():
+                writer.writerow({'name': name, **{key: round(value, 3) if isinstance(value, float) else value
+                                                  for key, value in row.items()}})
+
+    def write_trace(self, path):
+        """Chrome trace-event JSON: agent steps and cycles as spans, inbox depths as counters"""
+        pid = os.getpid()
+        trace = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                 for name, tid in self._threads.items()]
+        trace.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': 'Cycles'}})
+        for name, tid, start, value in self.events:
+            if tid is None:
+                trace.append({'name': name, 'ph': 'C', 'pid': pid, 'ts': start / 1e3, 'args': value})
+            else:
+                trace.append({'name': name, 'ph': 'X', 'pid': pid, 'tid': tid,
+                              'ts': start / 1e3, 'dur': value / 1e3})
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f)
+        return len(trace)
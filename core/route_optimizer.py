@@ -0,0 +1,359 @@
+"""
+Route Optimizer
+Orders an executor's queued targets into a multi-stop tour instead of
+visiting them strictly by score
+The tour minimizes score-weighted arrival distance (each stop's travel
+from the tour start times its weight), so valuable stops come early
+without zig-zagging past cheap ones on the way. New tours are seeded
+nearest-neighbour style (best weight per metre next) and refined with
+2-opt and Or-opt moves, each costed in O(1) from running sums, on a
+distance matrix kept between cycles; later
+arrivals are inserted into the existing tour at their cheapest position
+With a PathPlanner the straight-line matrix entries are replaced by A*
+path lengths a few pairs per cycle
+Work per cycle is capped by counts (planned pairs, candidate moves), never
+by wall time, so a seeded mission always builds the same tours
+Drop-in replacement for TaskQueue in ExecutorAgent
+"""
+import math
+import time
+import numpy as np
+
+# Candidate moves evaluated per call (one call per executor cycle); a
+# count rather than a clock so tours do not depend on machine load
+MOVE_BUDGET = 2000
+# Matrix pairs replaced by planned path lengths per call
+PLAN_BUDGET = 4
+# Smallest cost drop (metre-weights) a move must make to be taken
+MIN_GAIN = 1e-6
+# Added to the straight-line distance when the planner finds no path
+UNREACHABLE_PENALTY = 1000.0
+# Longest run of stops an Or-opt move relocates
+OR_OPT_SEGMENT = 3
+
+
+class RouteOptimizer:
+    def __init__(self, planner=None, key='score', move_budget=MOVE_BUDGET, plan_budget=PLAN_BUDGET,
+                 capacity=16):
+        self.planner = planner
+        self.key = key
+        self.move_budget = move_budget
+        self.plan_budget = plan_budget
+        # Slot 0 is the tour start; every queued task owns one other slot
+        self.dist = np.zeros((capacity, capacity))
+        self.weight = np.zeros(capacity)
+        self.points = np.zeros((capacity, 2))
+        self._free = list(range(capacity - 1, 0, -1))
+        self._slots = {}
+        self._tasks = {}
+        self.tour = []
+        # Tasks pushed since the last optimize(), in arrival order
+        self._pending = []
+        # Matrix pairs still holding straight-line distances
+        self._unplanned = []
+        self._origin = None
+        self._improving = False
+        self.stats = {'optimizations': 0, 'seeds': 0, 'insertions': 0, 'moves': 0,
+                      'planned_pairs': 0, 'time': 0.0}
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def __bool__(self):
+        return bool(self._tasks)
+
+    def __contains__(self, target_id):
+        return target_id in self._tasks
+
+    def __iter__(self):
+        """Queued tasks in visiting order (pending arrivals last)"""
+        for target_id in self.tour + self._pending:
+            yield self._tasks[target_id]
+
+    def push(self, task):
+        """Queue a task; pushing a target id that is already queued updates it"""
+        target_id = task['target_id']
+        if target_id in self._tasks:
+            self._tasks[target_id] = task
+            if target_id in self._slots:
+                self.weight[self._slots[target_id]] = self._weight(task)
+                self._improving = True
+            return
+        self._tasks[target_id] = task
+        self._pending.append(target_id)
+
+    def pop(self):
+        """Remove and return the first stop of the tour"""
+        if not self._tasks:
+            raise IndexError("pop from empty RouteOptimizer")
+        self._place()
+        target_id = self.tour.pop(0)
+        self._release(target_id)
+        # The tour now starts where this stop is
+        self._origin = None
+        return self._tasks.pop(target_id)
+
+    def peek(self):
+        """First stop without removing it, or None"""
+        if not self._tasks:
+            return None
+        self._place()
+        return self._tasks[self.tour[0]]
+
+    def remove(self, target_id):
+        """Cancel a queued task; returns it, or None if it was not queued"""
+        task = self._tasks.pop(target_id, None)
+        if task is None:
+            return None
+        if target_id in self._slots:
+            self.tour.remove(target_id)
+            self._release(target_id)
+        else:
+            self._pending.remove(target_id)
+        return task
+
+    def optimize(self, x, y):
+        """
+        Improve the tour starting from (x, y), planning at most plan_budget
+        matrix pairs and evaluating at most move_budget candidate moves
+        Call once per cycle before popping; work left over continues next call
+        """
+        start = time.perf_counter()
+        if self._origin != (x, y):
+            self._set_origin(x, y)
+        self._place()
+        for _ in range(min(self.plan_budget, len(self._unplanned))):
+            self._plan_pair(*self._unplanned.pop())
+        if self._improving and not self._unplanned:
+            self._improving = self._refine(self.move_budget)
+        self.stats['optimizations'] += 1
+        self.stats['time'] += time.perf_counter() - start
+
+    def _weight(self, task):
+        # Zero-score targets still count, so every stop pulls towards the start
+        return task[self.key] + 1.0
+
+    def _slot(self, target_id):
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self._slots[target_id] = slot
+        task = self._tasks[target_id]
+        self.weight[slot] = self._weight(task)
+        self.points[slot] = task['location']
+        slots = list(self._slots.values())
+        self._straight(slot, slots)
+        return slot
+
+    def _release(self, target_id):
+        slot = self._slots.pop(target_id)
+        self._free.append(slot)
+        self._unplanned = [pair for pair in self._unplanned if slot not in pair]
+
+    def _grow(self):
+        size = len(self.weight)
+        dist = np.zeros((2 * size, 2 * size))
+        dist[:size, :size] = self.dist
+        self.dist = dist
+        self.weight = np.concatenate((self.weight, np.zeros(size)))
+        self.points = np.concatenate((self.points, np.zeros((size, 2))))
+        self._free.extend(range(2 * size - 1, size - 1, -1))
+
+    def _straight(self, slot, others):
+        """Straight-line distances between slot and others (and the start), both ways"""
+        others = np.array(([0] if slot else []) + [other for other in others if other != slot],
+                          dtype=np.intp)
+        delta = self.points[others] - self.points[slot]
+        row = np.sqrt(delta[:, 0]**2 + delta[:, 1]**2)
+        self.dist[slot, others] = row
+        self.dist[others, slot] = row
+        if self.planner is not None:
+            self._unplanned.extend((slot, int(other)) for other in others)
+
+    def _plan_pair(self, a, b):
+        """Replace one straight-line entry pair with the planned path length (kept symmetric)"""
+        # Plan away from the tour start so that row is the one measured
+        u, v = (a, b) if b else (b, a)
+        waypoints = self.planner.plan(tuple(self.points[u]), tuple(self.points[v]))
+        if waypoints is None:
+            length = self.dist[u, v] + UNREACHABLE_PENALTY
+        else:
+            length, (px, py) = 0.0, self.points[u]
+            for wx, wy in waypoints:
+                length += math.sqrt((wx - px)**2 + (wy - py)**2)
+                px, py = wx, wy
+        self.dist[u, v] = self.dist[v, u] = length
+        self.stats['planned_pairs'] += 1
+        self._improving = True
+
+    def _set_origin(self, x, y):
+        self._origin = (x, y)
+        self.points[0] = (x, y)
+        self._unplanned = [pair for pair in self._unplanned if 0 not in pair]
+        slots = list(self._slots.values())
+        if slots:
+            self._straight(0, slots)
+            self._improving = True
+
+    def _place(self):
+        """Give pending arrivals slots: seed a fresh tour or insert into the current one"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        slots = {target_id: self._slot(target_id) for target_id in pending}
+        if not self.tour:
+            self._seed(slots)
+        else:
+            for target_id, slot in slots.items():
+                self._insert(target_id, slot)
+        self._improving = True
+
+    def _seed(self, slots):
+        """Nearest-neighbour tour: repeatedly take the best weight per metre from here"""
+        remaining = dict(slots)
+        here = 0
+        while remaining:
+            ids = list(remaining)
+            candidates = np.array([remaining[target_id] for target_id in ids], dtype=np.intp)
+            ratio = self.weight[candidates] / np.maximum(self.dist[here, candidates], 1e-9)
+            best = ids[int(np.argmax(ratio))]
+            self.tour.append(best)
+            here = remaining.pop(best)
+        self.stats['seeds'] += 1
+
+    def _insert(self, target_id, slot):
+        """Cheapest insertion of one stop into the current tour (O(1) per position)"""
+        dist, weight = self.dist, self.weight
+        nodes = [0] + [self._slots[t] for t in self.tour]
+        leg, prefix, suffix, _ = _prefixes(dist, weight, nodes)
+        n = len(nodes) - 1
+        w = weight[slot]
+        best, best_delta = 0, math.inf
+        for k in range(n + 1):
+            # The new stop arrives after the first k stops; everything behind it waits longer
+            delta = w * (prefix[k] + dist[nodes[k], slot])
+            if k < n:
+                delta += suffix[k + 1] * (dist[nodes[k], slot] + dist[slot, nodes[k + 1]] - leg[k + 1])
+            if delta < best_delta:
+                best, best_delta = k, delta
+        self.tour.insert(best, target_id)
+        self.stats['insertions'] += 1
+
+    def _refine(self, budget):
+        """
+        2-opt (reverse a stretch) and Or-opt (move a run of up to
+        OR_OPT_SEGMENT stops) until no move helps or `budget` candidate
+        moves have been evaluated; each candidate is costed in O(1) from
+        prefix sums of leg lengths and suffix sums of stop weights
+        Returns True if the budget ran out before the tour was locally optimal
+        """
+        dist, weight = self.dist.tolist(), self.weight.tolist()
+        nodes = [0] + [self._slots[t] for t in self.tour]
+        n = len(nodes) - 1
+        evaluations = 0
+        while True:
+            sums = _prefixes(dist, weight, nodes)
+            move = None
+            for i in range(1, n + 1):
+                # 2-opt: reverse positions i..j
+                for j in range(i + 1, n + 1):
+                    if evaluations >= budget:
+                        self._commit(nodes)
+                        return True
+                    evaluations += 1
+                    if _reversal_delta(dist, nodes, sums, i, j) < -MIN_GAIN:
+                        move = nodes[:i] + nodes[i:j + 1][::-1] + nodes[j + 1:]
+                        break
+                if move is not None:
+                    break
+                # Or-opt: move positions a..b to just after position k
+                a = i
+                for b in range(a, min(a + OR_OPT_SEGMENT, n + 1)):
+                    for k in range(n + 1):
+                        if a - 1 <= k <= b:
+                            continue
+                        if evaluations >= budget:
+                            self._commit(nodes)
+                            return True
+                        evaluations += 1
+                        if _relocation_delta(dist, nodes, sums, a, b, k) < -MIN_GAIN:
+                            if k > b:
+                                move = nodes[:a] + nodes[b + 1:k + 1] + nodes[a:b + 1] + nodes[k + 1:]
+                            else:
+                                move = nodes[:k + 1] + nodes[a:b + 1] + nodes[k + 1:a] + nodes[b + 1:]
+                            break
+                    if move is not None:
+                        break
+                if move is not None:
+                    break
+            if move is None:
+                self._commit(nodes)
+                return False
+            nodes = move
+            self.stats['moves'] += 1
+
+    def _commit(self, nodes):
+        slot_ids = {slot: target_id for target_id, slot in self._slots.items()}
+        self.tour = [slot_ids[slot] for slot in nodes[1:]]
+
+
+def _prefixes(dist, weight, nodes):
+    """
+    Per tour position t (nodes[0] is the start): leg[t] = length of the leg
+    into t, prefix[t] = distance to t, suffix[t] = weight of stops t.. and
+    weighted[t] = sum of leg[s] * suffix[s] for s <= t; the tour's cost is
+    weighted[-1], and suffix has one extra trailing zero
+    """
+    n = len(nodes) - 1
+    leg = [0.0] * (n + 1)
+    prefix = [0.0] * (n + 1)
+    for t in range(1, n + 1):
+        leg[t] = dist[nodes[t - 1]][nodes[t]]
+        prefix[t] = prefix[t - 1] + leg[t]
+    suffix = [0.0] * (n + 2)
+    for t in range(n, 0, -1):
+        suffix[t] = suffix[t + 1] + weight[nodes[t]]
+    weighted = [0.0] * (n + 1)
+    for t in range(1, n + 1):
+        weighted[t] = weighted[t - 1] + leg[t] * suffix[t]
+    return leg, prefix, suffix, weighted
+
+
+def _reversal_delta(dist, nodes, sums, i, j):
+    """Cost change of reversing tour positions i..j (1 <= i < j), from _prefixes() sums"""
+    leg, prefix, suffix, weighted = sums
+    n = len(nodes) - 1
+    delta = (suffix[i] * (dist[nodes[i - 1]][nodes[j]] - leg[i])
+             + (suffix[j + 1] + suffix[i]) * (prefix[j] - prefix[i])
+             - 2 * (weighted[j] - weighted[i]))
+    if j < n:
+        delta += suffix[j + 1] * (dist[nodes[i]][nodes[j + 1]] - leg[j + 1])
+    return delta
+
+
+def _relocation_delta(dist, nodes, sums, a, b, k):
+    """
+    Cost change of moving tour positions a..b (1 <= a <= b) to just after
+    position k (k < a - 1 or k > b), from _prefixes() sums
+    """
+    leg, prefix, suffix, _ = sums
+    n = len(nodes) - 1
+    segment = suffix[a] - suffix[b + 1]
+    inner = prefix[b] - prefix[a]
+    if k > b:
+        delta = (suffix[a] * (dist[nodes[a - 1]][nodes[b + 1]] - leg[a])
+                 - suffix[b + 1] * leg[b + 1]
+                 + segment * (prefix[k] - prefix[b + 1])
+                 + (segment + suffix[k + 1]) * dist[nodes[k]][nodes[a]]
+                 + (suffix[k + 1] - suffix[b + 1]) * inner)
+        if k < n:
+            delta += suffix[k + 1] * (dist[nodes[b]][nodes[k + 1]] - leg[k + 1])
+    else:
+        delta = (suffix[k + 1] * (dist[nodes[k]][nodes[a]] - leg[k + 1])
+                 - suffix[a] * leg[a]
+                 + (suffix[k + 1] - suffix[a]) * inner
+                 + (suffix[k + 1] - segment) * dist[nodes[b]][nodes[k + 1]]
+                 - segment * (prefix[a - 1] - prefix[k + 1]))
+        if b < n:
+            delta += suffix[b + 1] * (dist[nodes[a - 1]][nodes[b + 1]] - leg[b + 1])
+    return delta
@@ -0,0 +1,46 @@
+"""
+Mission Snapshots
+Binary checkpoint of a whole mission: environment (targets, obstacles,
+generator state), agents (positions, queues, plans) and bus contents
+A restored coordinator carries on from the cycle it was saved at, so
+missions can be forked from a checkpoint instead of replayed from cycle 0
+"""
+import pickle
+
+SNAPSHOT_MAGIC = b'LUNARSNP'
+SNAPSHOT_VERSION = 1
+
+
+def snapshot(coordinator):
+    """Serialize a coordinator and everything it references to bytes"""
+    # NumPy arrays travel as raw buffers under pickle protocol 5
+    return SNAPSHOT_MAGIC + bytes([SNAPSHOT_VERSION]) + pickle.dumps(coordinator, protocol=5)
+
+
+def restore(data):
+    """Rebuild a coordinator from snapshot() output"""
+    header = len(SNAPSHOT_MAGIC)
+    if data[:header] != SNAPSHOT_MAGIC:
+        raise ValueError("Not a mission snapshot")
+    if data[header] != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {data[header]}")
+    return pickle.loads(memoryview(data)[header + 1:])
+
+
+def fork(coordinator):
+    """Independent copy of a running mission"""
+    return restore(snapshot(coordinator))
+
+
+def save_snapshot(coordinator, path):
+    """Write a snapshot to disk; returns its size in bytes"""
+    data = snapshot(coordinator)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+def load_snapshot(path):
+    """Read a snapshot written by save_snapshot"""
+    with open(path, 'rb') as f:
+        return restore(f.read())
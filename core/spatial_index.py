@@ -0,0 +1,324 @@
+"""
+Spatial Index
+Bucketed lookups for targets and obstacles on the lunar surface
+Answers radius and point-in-circle queries without scanning every item
+"""
+import math
+import numpy as np
+
+# Cell coordinates are packed into one int64 key: (cx + OFFSET) << 32 | (cy + OFFSET)
+_KEY_OFFSET = 1 << 31
+
+
+def _pack_keys(cx, cy):
+    """Pack integer cell coordinates into sortable int64 keys"""
+    cx = np.asarray(cx, dtype=np.int64) + _KEY_OFFSET
+    cy = np.asarray(cy, dtype=np.int64) + _KEY_OFFSET
+    return (cx << 32) | cy
+
+
+class GridIndex:
+    """Uniform grid of id buckets; circles are stored in every cell they overlap
+
+    Bulk-loaded points live in a compact sorted layout (cell keys, bucket
+    offsets and ids ordered by cell). Items inserted one at a time go into a
+    small dict of buckets on top of it. Removing a bulk-loaded item only
+    clears its alive flag.
+    """
+
+    def __init__(self, cell_size=10.0):
+        self.cell_size = float(cell_size)
+        self.cells = {}
+        self.xs = np.zeros(0)
+        self.ys = np.zeros(0)
+        self.radii = np.zeros(0)
+        self.alive = np.zeros(0, dtype=bool)
+        self.count = 0
+        self._keys = np.zeros(0, dtype=np.int64)
+        self._starts = np.zeros(1, dtype=np.intp)
+        self._order = np.zeros(0, dtype=np.intp)
+        # Sorted snapshot of the dict buckets for vectorized lookups, rebuilt after edits
+        self._dynamic = None
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, item_id):
+        return 0 <= item_id < len(self.alive) and bool(self.alive[item_id])
+
+    def _grow(self, size):
+        """Grow the coordinate arrays so that item ids below size fit"""
+        capacity = max(size, 2 * len(self.alive), 16)
+        for name in ('xs', 'ys', 'radii', 'alive'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _cell_range(self, x, y, radius):
+        """Cells covered by the bounding box of a circle"""
+        cs = self.cell_size
+        return (math.floor((x - radius) / cs), math.floor((x + radius) / cs),
+                math.floor((y - radius) / cs), math.floor((y + radius) / cs))
+
+    def insert(self, item_id, x, y, radius=0.0):
+        """Add an item; radius > 0 registers it as a circle"""
+        if item_id in self:
+            self.remove(item_id)
+        if item_id >= len(self.alive):
+            self._grow(item_id + 1)
+        self.xs[item_id] = x
+        self.ys[item_id] = y
+        self.radii[item_id] = radius
+        self.alive[item_id] = True
+        self.count += 1
+        self._dynamic = None
+
+        cx0, cx1, cy0, cy1 = self._cell_range(x, y, radius)
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self.cells.setdefault((cx, cy), []).append(item_id)
+
+    def bulk_insert(self, xs, ys, radii=None):
+        """Add items 0..n-1 from coordinate arrays in one pass"""
+        if self.count or (radii is not None and np.any(np.asarray(radii) > 0)):
+            radii = np.zeros(len(xs)) if radii is None else np.asarray(radii, dtype=float)
+            for item_id in range(len(xs)):
+                self.insert(item_id, float(xs[item_id]), float(ys[item_id]), float(radii[item_id]))
+            return
+
+        # Empty index of points: sort ids by cell and record where each bucket starts
+        n = len(xs)
+        self.xs = np.array(xs, dtype=float)
+        self.ys = np.array(ys, dtype=float)
+        self.radii = np.zeros(n)
+        self.alive = np.ones(n, dtype=bool)
+        self.count = n
+        keys = _pack_keys(np.floor(self.xs / self.cell_size), np.floor(self.ys / self.cell_size))
+        self._order = np.argsort(keys, kind='stable')
+        keys = keys[self._order]
+        first = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if n else np.zeros(0, dtype=np.intp)
+        self._keys = keys[first]
+        self._starts = np.r_[first, n].astype(np.intp)
+
+    def remove(self, item_id):
+        """Drop an item from the index"""
+        if item_id not in self:
+            return False
+        cx0, cx1, cy0, cy1 = self._cell_range(self.xs[item_id], self.ys[item_id],
+                                              self.radii[item_id])
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket and item_id in bucket:
+                    bucket.remove(item_id)
+                    if not bucket:
+                        del self.cells[(cx, cy)]
+        self.alive[item_id] = False
+        self.count -= 1
+        self._dynamic = None
+        return True
+
+    def _candidates(self, cx0, cx1, cy0, cy1):
+        """Buckets covering a block of cells (may hold repeats and dead ids)"""
+        parts = []
+        if len(self._keys):
+            cx, cy = np.meshgrid(np.arange(cx0, cx1 + 1), np.arange(cy0, cy1 + 1), indexing='ij')
+            wanted = _pack_keys(cx.ravel(), cy.ravel())
+            pos = np.minimum(np.searchsorted(self._keys, wanted), len(self._keys) - 1)
+            pos = pos[self._keys[pos] == wanted]
+            for start, end in zip(self._starts[pos].tolist(), self._starts[pos + 1].tolist()):
+                parts.append(self._order[start:end])
+        if self.cells:
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    bucket = self.cells.get((cx, cy))
+                    if bucket:
+                        parts.append(bucket)
+        return parts
+
+    def query_radius(self, x, y, radius):
+        """Ids of items whose centre lies within radius of (x, y), in id order"""
+        parts = self._candidates(*self._cell_range(x, y, radius))
+        if not parts:
+            return np.zeros(0, dtype=np.intp)
+
+        ids = np.concatenate(parts).astype(np.intp, copy=False)
+        # Circles and re-inserted items can show up in several buckets
+        ids = np.unique(ids) if self.cells else np.sort(ids)
+        ids = ids[self.alive[ids]]
+        dist = np.sqrt((x - self.xs[ids])**2 + (y - self.ys[ids])**2)
+        return ids[dist <= radius]
+
+    def query_point(self, x, y):
+        """Ids of circles that strictly contain (x, y)"""
+        cs = self.cell_size
+        cx, cy = math.floor(x / cs), math.floor(y / cs)
+        hits = []
+        for part in self._candidates(cx, cx, cy, cy):
+            for item_id in (part.tolist() if isinstance(part, np.ndarray) else part):
+                dist = math.sqrt((x - self.xs[item_id])**2 + (y - self.ys[item_id])**2)
+                if dist < self.radii[item_id] and self.alive[item_id] and item_id not in hits:
+                    hits.append(item_id)
+        return hits
+
+    def _dynamic_buckets(self):
+        """Dict buckets flattened to (sorted keys, bucket offsets, ids)"""
+        if self._dynamic is None:
+            cells = list(self.cells.items())
+            keys = _pack_keys([c[0] for c, _ in cells], [c[1] for c, _ in cells]).reshape(-1)
+            order = np.argsort(keys)
+            cells = [cells[i] for i in order.tolist()]
+            keys = keys[order]
+            sizes = [len(bucket) for _, bucket in cells]
+            starts = np.r_[0, np.cumsum(sizes, dtype=np.intp)].astype(np.intp)
+            ids = np.array([i for _, bucket in cells for i in bucket], dtype=np.intp)
+            self._dynamic = (keys, starts, ids)
+        return self._dynamic
+
+    def contains_points(self, xs, ys):
+        """Vectorized query_point: True for each point strictly inside some circle"""
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        hit = np.zeros(len(xs), dtype=bool)
+        # Circles are always inserted one at a time, so they live in the dict buckets
+        keys, starts, ids = self._dynamic_buckets()
+        if not len(keys) or not len(xs):
+            return hit
+
+        wanted = _pack_keys(np.floor(xs / self.cell_size), np.floor(ys / self.cell_size))
+        pos = np.minimum(np.searchsorted(keys, wanted), len(keys) - 1)
+        found = keys[pos] == wanted
+        points, pos = np.flatnonzero(found), pos[found]
+        # Expand each point into (point, candidate circle) pairs
+        counts = starts[pos + 1] - starts[pos]
+        pair_point = np.repeat(points, counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cand = ids[np.repeat(starts[pos], counts) + offsets]
+        dist = np.sqrt((xs[pair_point] - self.xs[cand])**2 + (ys[pair_point] - self.ys[cand])**2)
+        hit[pair_point[(dist < self.radii[cand]) & self.alive[cand]]] = True
+        return hit
+
+
+class PresortedGridIndex:
+    """Read-only grid over points already stored in cell order
+
+    Item ids are row numbers, and rows of one cell are contiguous, so a
+    bucket is just a (start, end) range: nothing is sorted or copied at
+    load time, and with memory-mapped columns a query only pages in the
+    rows of the cells it covers.
+    """
+
+    def __init__(self, xs, ys, keys, starts, cell_size):
+        self.cell_size = float(cell_size)
+        self.xs = xs
+        self.ys = ys
+        self._keys = keys
+        self._starts = starts
+        self.count = len(xs)
+
+    @staticmethod
+    def cell_keys(xs, ys, cell_size):
+        """Cell key of each point; sort rows by these to build the layout"""
+        return _pack_keys(np.floor(np.asarray(xs) / cell_size), np.floor(np.asarray(ys) / cell_size))
+
+    @staticmethod
+    def layout(sorted_keys):
+        """(distinct keys, bucket offsets) for rows sorted by cell key"""
+        n = len(sorted_keys)
+        first = (np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+                 if n else np.zeros(0, dtype=np.intp))
+        return sorted_keys[first], np.r_[first, n].astype(np.int64)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, item_id):
+        return 0 <= item_id < self.count
+
+    def query_radius(self, x, y, radius):
+        """Ids of items whose centre lies within radius of (x, y), in id order"""
+        cs = self.cell_size
+        cx, cy = np.meshgrid(np.arange(math.floor((x - radius) / cs), math.floor((x + radius) / cs) + 1),
+                             np.arange(math.floor((y - radius) / cs), math.floor((y + radius) / cs) + 1),
+                             indexing='ij')
+        wanted = np.sort(_pack_keys(cx.ravel(), cy.ravel()))
+        if not len(self._keys):
+            return np.zeros(0, dtype=np.intp)
+        pos = np.minimum(np.searchsorted(self._keys, wanted), len(self._keys) - 1)
+        pos = pos[self._keys[pos] == wanted]
+        if not len(pos):
+            return np.zeros(0, dtype=np.intp)
+        ids = np.concatenate([np.arange(start, end, dtype=np.intp) for start, end in
+                              zip(self._starts[pos].tolist(), self._starts[pos + 1].tolist())])
+        dist = np.sqrt((x - self.xs[ids])**2 + (y - self.ys[ids])**2)
+        return ids[dist <= radius]
+
+    def query_point(self, x, y):
+        """Points contain nothing"""
+        return []
+
+    def contains_points(self, xs, ys):
+        return np.zeros(len(xs), dtype=bool)
+
+
+class LinearIndex:
+    """Brute-force reference index with the same interface as GridIndex"""
+
+    def __init__(self, cell_size=None):
+        self.items = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item_id):
+        return item_id in self.items
+
+    def insert(self, item_id, x, y, radius=0.0):
+        """Add an item; radius > 0 registers it as a circle"""
+        self.items[item_id] = (x, y, radius)
+
+    def bulk_insert(self, xs, ys, radii=None):
+        """Add items 0..n-1 from coordinate arrays"""
+        for item_id in range(len(xs)):
+            self.insert(item_id, float(xs[item_id]), float(ys[item_id]),
+                        0.0 if radii is None else float(radii[item_id]))
+
+    def remove(self, item_id):
+        """Drop an item from the index"""
+        return self.items.pop(item_id, None) is not None
+
+    def query_radius(self, x, y, radius):
+        """Ids of items whose centre lies within radius of (x, y), in id order"""
+        return np.array(sorted(item_id for item_id, (ix, iy, _) in self.items.items()
+                               if math.sqrt((x - ix)**2 + (y - iy)**2) <= radius), dtype=np.intp)
+
+    def query_point(self, x, y):
+        """Ids of circles that strictly contain (x, y)"""
+        return [item_id for item_id, (ix, iy, r) in self.items.items()
+                if math.sqrt((x - ix)**2 + (y - iy)**2) < r]
+
+    def contains_points(self, xs, ys):
+        """Vectorized query_point: True for each point strictly inside some circle"""
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        hit = np.zeros(len(xs), dtype=bool)
+        for ix, iy, r in self.items.values():
+            if r > 0:
+                hit |= np.sqrt((xs - ix)**2 + (ys - iy)**2) < r
+        return hit
+
+
+INDEX_TYPES = {
+    'grid': GridIndex,
+    'linear': LinearIndex,
+}
+
+
+def make_index(kind='grid', cell_size=10.0):
+    """Create a spatial index from a name ('grid', 'linear') or an index class"""
+    if isinstance(kind, str):
+        if kind not in INDEX_TYPES:
+            raise ValueError(f"Unknown spatial index '{kind}' (choose from {sorted(INDEX_TYPES)})")
+        kind = INDEX_TYPES[kind]
+    return kind(cell_size)
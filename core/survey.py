@@ -0,0 +1,106 @@
+"""
+Survey Maps
+On-disk hazard rasters and target catalogs for survey-derived worlds
+Both are plain .npy files opened with np.load(mmap_mode='r'): nothing is
+read at startup, and queries only page in the tiles around the rovers,
+so load time and resident memory stay flat as the map grows
+"""
+import json
+import math
+import os
+import numpy as np
+from core.spatial_index import PresortedGridIndex
+from core.target_table import TargetTable
+
+CATALOG_COLUMNS = {
+    'x': np.float64,
+    'y': np.float64,
+    'size': np.float32,
+    'type_code': np.uint8,
+    'composition_code': np.uint8,
+}
+
+CATALOG_META = 'catalog.json'
+
+
+def write_target_catalog(directory, table, width, height, tile_size=50.0):
+    """
+    Store a TargetTable as a memory-mappable catalog
+    Rows are reordered by tile so each tile is one contiguous range;
+    returns the new row order (catalog id -> original id)
+    """
+    os.makedirs(directory, exist_ok=True)
+    keys = PresortedGridIndex.cell_keys(table.x, table.y, tile_size)
+    order = np.argsort(keys, kind='stable')
+    for name, dtype in CATALOG_COLUMNS.items():
+        np.save(os.path.join(directory, f'{name}.npy'), getattr(table, name)[order].astype(dtype))
+    tile_keys, tile_starts = PresortedGridIndex.layout(keys[order])
+    np.save(os.path.join(directory, 'tile_keys.npy'), tile_keys)
+    np.save(os.path.join(directory, 'tile_starts.npy'), tile_starts)
+    with open(os.path.join(directory, CATALOG_META), 'w', encoding='utf-8') as f:
+        json.dump({'width': width, 'height': height, 'tile_size': tile_size,
+                   'count': int(len(order))}, f)
+    return order
+
+
+class TargetCatalog:
+    """Memory-mapped target catalog written by write_target_catalog"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, CATALOG_META), encoding='utf-8') as f:
+            meta = json.load(f)
+        self.width = meta['width']
+        self.height = meta['height']
+        self.tile_size = meta['tile_size']
+        columns = {name: self._map(name) for name in CATALOG_COLUMNS}
+        # Flags are the only writable column; untouched zero pages cost no memory
+        self.table = TargetTable(state=np.zeros(meta['count'], dtype=np.uint8), **columns)
+        self.index = PresortedGridIndex(self.table.x, self.table.y, self._map('tile_keys'),
+                                        self._map('tile_starts'), self.tile_size)
+
+    def _map(self, name):
+        return np.load(os.path.join(self.directory, f'{name}.npy'), mmap_mode='r')
+
+    def __len__(self):
+        return len(self.table)
+
+
+class HazardMap:
+    """
+    Memory-mapped hazard raster; raster[row, col] covers
+    x in [col*res, (col+1)*res), y in [row*res, (row+1)*res)
+    Cells at or above threshold are impassable; outside the raster is free
+    """
+
+    def __init__(self, path, resolution=1.0, threshold=1):
+        self.path = path
+        self.raster = np.load(path, mmap_mode='r')
+        self.resolution = float(resolution)
+        self.threshold = threshold
+        self.rows, self.cols = self.raster.shape
+
+    @property
+    def width(self):
+        return self.cols * self.resolution
+
+    @property
+    def height(self):
+        return self.rows * self.resolution
+
+    def is_blocked(self, x, y):
+        """True if (x, y) falls in a hazardous cell"""
+        col = math.floor(x / self.resolution)
+        row = math.floor(y / self.resolution)
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return bool(self.raster[row, col] >= self.threshold)
+        return False
+
+    def blocked_mask(self, xs, ys):
+        """Vectorized is_blocked"""
+        cols = np.floor(np.asarray(xs, dtype=float) / self.resolution).astype(np.int64)
+        rows = np.floor(np.asarray(ys, dtype=float) / self.resolution).astype(np.int64)
+        inside = (rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.cols)
+        mask = np.zeros(len(cols), dtype=bool)
+        mask[inside] = self.raster[rows[inside], cols[inside]] >= self.threshold
+        return mask
@@ -0,0 +1,179 @@
+"""
+Target Table
+Structure-of-arrays storage for lunar surface targets
+Coordinates and sizes live in NumPy columns, categories are small integer
+codes and the discovered/collected flags share one bitmask column
+"""
+import numpy as np
+
+TARGET_TYPES = ('rock', 'crater', 'anomaly')
+COMPOSITIONS = ('basalt', 'anorthosite', 'regolith', 'ice')
+
+# State bits
+DISCOVERED = 1
+COLLECTED = 2
+
+STATE_FLAGS = {
+    'discovered': DISCOVERED,
+    'collected': COLLECTED,
+}
+
+TARGET_FIELDS = ('id', 'x', 'y', 'type', 'size', 'composition', 'discovered', 'collected')
+
+
+class TargetTable:
+    def __init__(self, x, y, size, type_code, composition_code, state=None):
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.size = np.asarray(size, dtype=np.float32)
+        self.type_code = np.asarray(type_code, dtype=np.uint8)
+        self.composition_code = np.asarray(composition_code, dtype=np.uint8)
+        if state is None:
+            state = np.zeros(len(self.x), dtype=np.uint8)
+        self.state = np.asarray(state, dtype=np.uint8)
+
+    @classmethod
+    def from_records(cls, records):
+        """Build a table from an iterable of target dicts"""
+        records = list(records)
+        state = [(DISCOVERED if r.get('discovered') else 0) |
+                 (COLLECTED if r.get('collected') else 0) for r in records]
+        return cls(
+            [r['x'] for r in records],
+            [r['y'] for r in records],
+            [r['size'] for r in records],
+            [TARGET_TYPES.index(r['type']) for r in records],
+            [COMPOSITIONS.index(r['composition']) for r in records],
+            state,
+        )
+
+    def __len__(self):
+        return len(self.x)
+
+    def __getitem__(self, target_id):
+        if not -len(self.x) <= target_id < len(self.x):
+            raise IndexError(f"target id {target_id} out of range")
+        return TargetView(self, target_id % len(self.x))
+
+    def __iter__(self):
+        for target_id in range(len(self.x)):
+            yield TargetView(self, target_id)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the column arrays"""
+        return sum(col.nbytes for col in (self.x, self.y, self.size, self.type_code,
+                                          self.composition_code, self.state))
+
+    def has_flag(self, target_id, flag):
+        """True if the given state bit is set for a target"""
+        return bool(self.state[target_id] & flag)
+
+    def set_flag(self, target_id, flag):
+        """Set a state bit; returns True if it was not already set"""
+        if self.state[target_id] & flag:
+            return False
+        self.state[target_id] |= flag
+        return True
+
+    def clear_flag(self, target_id, flag):
+        """Clear a state bit"""
+        self.state[target_id] &= ~np.uint8(flag)
+
+    def ids_with(self, flag):
+        """Ids of all targets with a state bit set"""
+        return np.flatnonzero(self.state & flag)
+
+    def get_field(self, target_id, key):
+        """Read one field of a target as a plain Python value"""
+        if key == 'id':
+            return target_id
+        if key == 'x':
+            return float(self.x[target_id])
+        if key == 'y':
+            return float(self.y[target_id])
+        if key == 'size':
+            return float(self.size[target_id])
+        if key == 'type':
+            return TARGET_TYPES[self.type_code[target_id]]
+        if key == 'composition':
+            return COMPOSITIONS[self.composition_code[target_id]]
+        if key in STATE_FLAGS:
+            return bool(self.state[target_id] & STATE_FLAGS[key])
+        raise KeyError(key)
+
+    def set_field(self, target_id, key, value):
+        """Write one field of a target"""
+        if key == 'x':
+            self.x[target_id] = value
+        elif key == 'y':
+            self.y[target_id] = value
+        elif key == 'size':
+            self.size[target_id] = value
+        elif key == 'type':
+            self.type_code[target_id] = TARGET_TYPES.index(value)
+        elif key == 'composition':
+            self.composition_code[target_id] = COMPOSITIONS.index(value)
+        elif key in STATE_FLAGS:
+            if value:
+                self.set_flag(target_id, STATE_FLAGS[key])
+            else:
+                self.clear_flag(target_id, STATE_FLAGS[key])
+        else:
+            raise KeyError(key)
+
+
+class TargetView:
+    """Dict-like window onto one row of a TargetTable"""
+    __slots__ = ('table', 'id')
+
+    def __init__(self, table, target_id):
+        self.table = table
+        self.id = target_id
+
+    def __getitem__(self, key):
+        return self.table.get_field(self.id, key)
+
+    def __setitem__(self, key, value):
+        self.table.set_field(self.id, key, value)
+
+    def __contains__(self, key):
+        return key in TARGET_FIELDS
+
+    def __iter__(self):
+        return iter(TARGET_FIELDS)
+
+    def __len__(self):
+        return len(TARGET_FIELDS)
+
+    def __eq__(self, other):
+        if isinstance(other, TargetView):
+            return self.table is other.table and self.id == other.id
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self.table), self.id))
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return TARGET_FIELDS
+
+    def values(self):
+        return [self[key] for key in TARGET_FIELDS]
+
+    def items(self):
+        return [(key, self[key]) for key in TARGET_FIELDS]
+
+    def to_dict(self):
+        """Copy the row into a plain dict"""
+        return dict(self.items())
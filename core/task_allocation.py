@@ -0,0 +1,143 @@
+"""
+Task Allocation
+Assigns scored targets to executors from their live state: position,
+current target and queued orders (a new target joins the route near
+whichever of those it is closest to), and remaining carrying capacity
+Each executor contributes one column per free slot, so one optimal
+assignment (Hungarian method) over the cost matrix hands out a whole
+sweep of discoveries at once; targets nobody has room for stay in a
+backlog and are re-offered with the next batch
+"""
+import time
+import numpy as np
+
+# Cost (in metres of travel) of every order already ahead in a queue
+SLOT_COST = 10.0
+# Metres of travel one point of analyst score is worth
+SCORE_WEIGHT = 2.0
+
+
+def solve_assignment(cost):
+    """
+    Minimum-cost assignment of every row to a distinct column (rows <= columns)
+    Shortest augmenting paths with row/column potentials (Hungarian method),
+    O(rows^2 * columns) with the column scans vectorized; returns the column
+    index of each row
+    """
+    n, m = cost.shape
+    if n > m:
+        raise ValueError("solve_assignment needs at least as many columns as rows")
+    # 1-based as in the classic formulation; column 0 is the virtual start
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    owner = np.zeros(m + 1, dtype=np.intp)
+    way = np.zeros(m + 1, dtype=np.intp)
+    for row in range(1, n + 1):
+        owner[0] = row
+        column = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[column] = True
+            current = owner[column]
+            free = ~used[1:]
+            reduced = cost[current - 1] - u[current] - v[1:]
+            better = free & (reduced < minv[1:])
+            minv[1:][better] = reduced[better]
+            way[1:][better] = column
+            candidates = np.where(free, minv[1:], np.inf)
+            nxt = int(np.argmin(candidates)) + 1
+            delta = candidates[nxt - 1]
+            u[owner[used]] += delta
+            v[used] -= delta
+            minv[1:][free] -= delta
+            column = nxt
+            if owner[column] == 0:
+                break
+        # Flip the augmenting path
+        while column:
+            previous = way[column]
+            owner[column] = owner[previous]
+            column = previous
+    assignment = np.full(n, -1, dtype=np.intp)
+    columns = np.flatnonzero(owner[1:])
+    assignment[owner[1:][columns] - 1] = columns
+    return assignment
+
+
+class TaskAllocator:
+    def __init__(self, executors, slot_cost=SLOT_COST, score_weight=SCORE_WEIGHT):
+        self.executors = list(executors)
+        self.slot_cost = slot_cost
+        self.score_weight = score_weight
+        # Orders that found no free slot yet
+        self.backlog = []
+        self.solves = 0
+        self.solve_time = 0.0
+
+    def positions(self):
+        """Current executor positions as two arrays"""
+        return (np.array([e.x for e in self.executors], dtype=float),
+                np.array([e.y for e in self.executors], dtype=float))
+
+    def discard(self, target_id):
+        """Drop a backlogged order (its target was collected meanwhile)"""
+        self.backlog = [order for order in self.backlog if order['target_id'] != target_id]
+
+    def _state(self):
+        """Route anchor points per executor, orders ahead of a new one, free slots"""
+        anchor_x, anchor_y, owners, queued, free = [], [], [], [], []
+        for i, executor in enumerate(self.executors):
+            points = [(executor.x, executor.y)]
+            if executor.current_target:
+                points.append(executor.current_target['location'])
+            points.extend(task['location'] for task in executor.collection_queue)
+            ahead = len(points) - 1
+            anchor_x.extend(p[0] for p in points)
+            anchor_y.extend(p[1] for p in points)
+            owners.extend([i] * len(points))
+            queued.append(ahead)
+            free.append(max(executor.carrying_capacity - executor.collected_count - ahead, 0))
+        return (np.array(anchor_x, dtype=float), np.array(anchor_y, dtype=float),
+                np.array(owners, dtype=np.intp), np.array(queued), np.array(free))
+
+    def allocate(self, orders):
+        """
+        Assign orders (evaluations with 'location' and 'score') plus the backlog
+        Returns {executor name: [orders]}; unplaced orders go back to the backlog
+        """
+        orders = self.backlog + list(orders)
+        self.backlog = []
+        if not orders or not self.executors:
+            self.backlog = orders
+            return {}
+        start = time.perf_counter()
+        anchor_x, anchor_y, owners, queued, free = self._state()
+
+        location = np.array([order['location'] for order in orders], dtype=float).reshape(-1, 2)
+        score = np.array([order['score'] for order in orders], dtype=float)
+        # Detour to each executor: distance to the nearest point already on its route
+        dist = np.sqrt((location[:, 0, None] - anchor_x)**2 + (location[:, 1, None] - anchor_y)**2)
+        starts = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+        detour = np.minimum.reduceat(dist, starts, axis=1)
+
+        # One column per free slot; the k-th new order for an executor waits behind k more
+        slots = np.minimum(free, len(orders))
+        slot_owner = np.repeat(np.arange(len(self.executors)), slots)
+        slot_rank = np.arange(len(slot_owner)) - np.repeat(np.cumsum(slots) - slots, slots)
+        cost = (detour[:, slot_owner] + (queued[slot_owner] + slot_rank) * self.slot_cost
+                - self.score_weight * score[:, None])
+        # One "not now" column per order, dearer than any real slot
+        big = cost.max() + 1.0 if cost.size else 0.0
+        cost = np.hstack([cost, np.full((len(orders), len(orders)), big)])
+        assignment = solve_assignment(cost)
+
+        batches = {}
+        for order, column in zip(orders, assignment.tolist()):
+            if column < len(slot_owner):
+                batches.setdefault(self.executors[slot_owner[column]].name, []).append(order)
+            else:
+                self.backlog.append(order)
+        self.solves += 1
+        self.solve_time += time.perf_counter() - start
+        return batches
@@ -0,0 +1,78 @@
+"""
+Task Queue
+Heap-backed priority queue of collection tasks keyed by target id
+Highest score pops first; equal scores keep arrival order
+"""
+import heapq
+
+_LIVE = 3
+
+
+class TaskQueue:
+    def __init__(self, key='score'):
+        self.key = key
+        self._heap = []
+        self._entries = {}
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __bool__(self):
+        return bool(self._entries)
+
+    def __contains__(self, target_id):
+        return target_id in self._entries
+
+    def __iter__(self):
+        """Queued tasks in pop order (does not consume the queue)"""
+        for _, _, task, _ in sorted(entry for entry in self._heap if entry[_LIVE]):
+            yield task
+
+    def push(self, task):
+        """Queue a task; pushing a target id that is already queued re-prioritizes it"""
+        target_id = task['target_id']
+        if target_id in self._entries:
+            self._entries.pop(target_id)[_LIVE] = False
+        # [negated priority, arrival order, task, live flag]
+        entry = [-task[self.key], self._seq, task, True]
+        self._seq += 1
+        self._entries[target_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def pop(self):
+        """Remove and return the highest-priority task"""
+        while self._heap:
+            _, _, task, live = heapq.heappop(self._heap)
+            if live:
+                del self._entries[task['target_id']]
+                return task
+        raise IndexError("pop from empty TaskQueue")
+
+    def peek(self):
+        """Highest-priority task without removing it, or None"""
+        while self._heap and not self._heap[0][_LIVE]:
+            heapq.heappop(self._heap)
+        return self._heap[0][2] if self._heap else None
+
+    def remove(self, target_id):
+        """Cancel a queued task; returns it, or None if it was not queued"""
+        entry = self._entries.pop(target_id, None)
+        if entry is None:
+            return None
+        entry[_LIVE] = False
+        # Cancelled entries stay in the heap until popped; compact if they pile up
+        if len(self._heap) > 2 * len(self._entries) + 32:
+            self._heap = [e for e in self._heap if e[_LIVE]]
+            heapq.heapify(self._heap)
+        return entry[2]
+
+    def reprioritize(self, target_id, priority):
+        """Change the score of a queued task"""
+        entry = self._entries.get(target_id)
+        if entry is None:
+            return False
+        task = dict(entry[2])
+        task[self.key] = priority
+        self.push(task)
+        return True
@@ -0,0 +1,137 @@
+"""
+Trajectory Recording
+Per-rover position history captured at the end of every cycle
+Positions go into one preallocated (rows x rovers) float32 buffer per axis
+that doubles when full; once it reaches max_points rows it is decimated
+online (every other row dropped, sampling stride doubled), so memory stays
+bounded however long the mission runs
+Douglas-Peucker simplification is applied when tracks are read
+"""
+import numpy as np
+
+
+def simplify(points, tolerance):
+    """
+    Douglas-Peucker: indices of the points to keep so that no dropped point
+    lies further than tolerance from the simplified polyline
+    """
+    n = len(points)
+    if n <= 2 or tolerance <= 0:
+        return np.arange(n)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start, end = points[first], points[last]
+        inner = points[first + 1:last]
+        seg = end - start
+        length = np.hypot(seg[0], seg[1])
+        if length == 0:
+            dist = np.hypot(inner[:, 0] - start[0], inner[:, 1] - start[1])
+        else:
+            dist = np.abs(seg[0] * (inner[:, 1] - start[1]) - seg[1] * (inner[:, 0] - start[0])) / length
+        worst = int(np.argmax(dist))
+        if dist[worst] > tolerance:
+            split = first + 1 + worst
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return np.flatnonzero(keep)
+
+
+class TrajectoryRecorder:
+    def __init__(self, agents, max_points=4096, stride=1, capacity=256):
+        # Every agent with a position is tracked; the analyst has none
+        self.agents = [agent for agent in agents if hasattr(agent, 'x') and hasattr(agent, 'y')]
+        self.names = [agent.name for agent in self.agents]
+        self.max_points = max_points
+        self.stride = stride
+        self.start_cycle = None
+        self.count = 0
+        rovers = len(self.agents)
+        capacity = min(capacity, max_points)
+        self.cycles = np.zeros(capacity, dtype=np.int64)
+        self.xs = np.zeros((capacity, rovers), dtype=np.float32)
+        self.ys = np.zeros((capacity, rovers), dtype=np.float32)
+        # Most recent position, kept even when the cycle falls between samples
+        self.last_x = np.zeros(rovers, dtype=np.float32)
+        self.last_y = np.zeros(rovers, dtype=np.float32)
+        self.last_cycle = None
+        # Rovers that share one FleetState are read with a single fancy index
+        fleets = {id(getattr(agent, 'fleet', None)) for agent in self.agents}
+        fleet = getattr(self.agents[0], 'fleet', None) if self.agents else None
+        self._fleet = fleet if len(fleets) == 1 and fleet is not None else None
+        self._slots = np.array([agent.slot for agent in self.agents]) if self._fleet else None
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def nbytes(self):
+        return self.cycles.nbytes + self.xs.nbytes + self.ys.nbytes
+
+    def attach(self, coordinator):
+        """Record the starting positions, then one sample per cycle"""
+        self.record(coordinator.cycles_run)
+        coordinator.cycle_hooks.append(self.record)
+        return self
+
+    def _positions(self):
+        if self._fleet is not None:
+            return self._fleet.x[self._slots], self._fleet.y[self._slots]
+        return [agent.x for agent in self.agents], [agent.y for agent in self.agents]
+
+    def record(self, cycle):
+        """Sample every rover's position (cycle hook)"""
+        xs, ys = self._positions()
+        self.last_x[:] = xs
+        self.last_y[:] = ys
+        self.last_cycle = cycle
+        if self.start_cycle is None:
+            self.start_cycle = cycle
+        if (cycle - self.start_cycle) % self.stride:
+            return
+        if self.count == len(self.cycles):
+            if self.count < self.max_points:
+                self._grow(min(2 * self.count, self.max_points))
+            else:
+                self._decimate()
+                if (cycle - self.start_cycle) % self.stride:
+                    return
+        row = self.count
+        self.cycles[row] = cycle
+        self.xs[row] = self.last_x
+        self.ys[row] = self.last_y
+        self.count += 1
+
+    def _grow(self, capacity):
+        for name in ('cycles', 'xs', 'ys'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def _decimate(self):
+        """Keep the rows on the doubled stride (the first row is always kept)"""
+        kept = (self.count + 1) // 2
+        for buffer in (self.cycles, self.xs, self.ys):
+            buffer[:kept] = buffer[:self.count:2]
+        self.count = kept
+        self.stride *= 2
+
+    def track(self, agent, tolerance=None):
+        """(n, 2) positions of one rover (by name or index), newest last"""
+        column = self.names.index(agent) if isinstance(agent, str) else agent
+        points = np.column_stack([self.xs[:self.count, column], self.ys[:self.count, column]])
+        if self.count and self.last_cycle != self.cycles[self.count - 1]:
+            points = np.vstack([points, [(self.last_x[column], self.last_y[column])]])
+        if tolerance:
+            points = points[simplify(points, tolerance)]
+        return points
+
+    def tracks(self, tolerance=None):
+        """{name: (n, 2) positions} for every rover"""
+        return {name: self.track(i, tolerance) for i, name in enumerate(self.names)}
@@ -0,0 +1,368 @@
+"""
+Message Transport
+Lets agents reach a MessageBus that lives in another process
+A BusServer owns the real bus and serves it over a Unix domain socket;
+RemoteMessageBus offers the MessageBus interface on top of a transport.
+InProcessTransport keeps today's single-process behaviour behind the same API.
+
+Frames are a 5-byte header (little-endian body length, opcode) followed by
+a marshal-encoded tuple of arguments. Sends are one-way and buffered until
+the next request that needs a reply.
+"""
+import marshal
+import os
+import selectors
+import socket
+import struct
+import threading
+from core.message_bus import Message, MessageBus
+
+_HEADER = struct.Struct('<IB')
+
+# One-way operations
+OP_REGISTER = 1
+OP_SUBSCRIBE = 2
+OP_UNSUBSCRIBE = 3
+OP_SEND = 4
+OP_SEND_TO_ROLE = 5
+# Operations answered with an OP_REPLY frame
+OP_GET = 16
+OP_MEMBERS = 17
+OP_PENDING = 18
+OP_HISTORY = 19
+OP_PING = 20
+OP_BARRIER = 21
+OP_REPLY = 32
+
+_SEND_OPS = (OP_SEND, OP_SEND_TO_ROLE)
+
+
+def _plain(obj):
+    """Convert NumPy scalars/arrays and sets into types marshal can encode"""
+    if isinstance(obj, dict):
+        return {key: _plain(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_plain(value) for value in obj)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(_plain(value) for value in obj)
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return obj
+
+
+def encode_frame(op, args):
+    """Header plus marshal-encoded arguments"""
+    try:
+        body = marshal.dumps(args)
+    except ValueError:
+        body = marshal.dumps(_plain(args))
+    return _HEADER.pack(len(body), op) + body
+
+
+def decode_frames(buffer):
+    """Split complete frames off the front of a bytearray: [(op, args), ...]"""
+    frames = []
+    offset = 0
+    while len(buffer) - offset >= _HEADER.size:
+        length, op = _HEADER.unpack_from(buffer, offset)
+        end = offset + _HEADER.size + length
+        if end > len(buffer):
+            break
+        frames.append((op, marshal.loads(bytes(buffer[offset + _HEADER.size:end]))))
+        offset = end
+    del buffer[:offset]
+    return frames
+
+
+def _dispatch(bus, op, args):
+    """Apply one bus operation; returns the reply payload (None for one-way ops)"""
+    if op == OP_SEND:
+        bus.send_message(*args)
+    elif op == OP_SEND_TO_ROLE:
+        bus.send_to_role(*args)
+    elif op == OP_GET:
+        return [msg.to_record() for msg in bus.get_messages(*args)]
+    elif op == OP_REGISTER:
+        bus.register(*args)
+    elif op == OP_SUBSCRIBE:
+        bus.subscribe(args[0], args[1])
+    elif op == OP_UNSUBSCRIBE:
+        bus.unsubscribe(*args)
+    elif op == OP_MEMBERS:
+        return list(bus.members(*args))
+    elif op == OP_PENDING:
+        return bus.pending_count(*args)
+    elif op == OP_HISTORY:
+        return [msg.to_record() for msg in bus.get_history(*args)]
+    elif op == OP_PING:
+        return args
+    else:
+        raise ValueError(f"Unknown bus operation {op}")
+    return None
+
+
+class InProcessTransport:
+    """Calls straight into a local MessageBus: no encoding, no copies"""
+
+    def __init__(self, bus=None):
+        self.bus = bus if bus is not None else MessageBus()
+
+    def post(self, op, args):
+        _dispatch(self.bus, op, args)
+
+    def request(self, op, args):
+        if op == OP_BARRIER:
+            return False
+        return _dispatch(self.bus, op, args)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class UnixSocketTransport:
+    """Client end of a BusServer connection"""
+
+    def __init__(self, path, timeout=None):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(path)
+        self._out = bytearray()
+        self._in = bytearray()
+        # Flush one-way frames once this much is buffered
+        self.buffer_limit = 1 << 16
+
+    def post(self, op, args):
+        self._out += encode_frame(op, args)
+        if len(self._out) >= self.buffer_limit:
+            self.flush()
+
+    def flush(self):
+        if self._out:
+            self.sock.sendall(self._out)
+            self._out.clear()
+
+    def request(self, op, args):
+        self._out += encode_frame(op, args)
+        self.flush()
+        while True:
+            frames = decode_frames(self._in)
+            if frames:
+                # Requests are answered in order, one at a time
+                return frames[0][1]
+            chunk = self.sock.recv(1 << 16)
+            if not chunk:
+                raise ConnectionError("bus server closed the connection")
+            self._in += chunk
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.sock.close()
+
+
+class RemoteMessageBus:
+    """MessageBus interface over a transport, for agents in another process"""
+
+    def __init__(self, transport):
+        self.transport = transport
+        # Role membership is fixed once the fleet is up; refreshed at every barrier
+        self._members = {}
+
+    def register(self, name, role=None):
+        self.transport.post(OP_REGISTER, (name, role))
+        self._members.pop(role, None)
+
+    def members(self, role):
+        names = self._members.get(role)
+        if names is None:
+            names = self._members[role] = self.transport.request(OP_MEMBERS, (role,))
+        return names
+
+    def subscribe(self, name, msg_types):
+        self.transport.post(OP_SUBSCRIBE, (name, sorted(msg_types)))
+
+    def unsubscribe(self, name):
+        self.transport.post(OP_UNSUBSCRIBE, (name,))
+
+    def send_message(self, sender, recipient, msg_type, content):
+        """Queue a message for delivery; remote sends do not return the Message"""
+        self.transport.post(OP_SEND, (sender, recipient, msg_type, content))
+
+    def get_messages(self, recipient):
+        return [Message.from_record(record)
+                for record in self.transport.request(OP_GET, (recipient,))]
+
+    def pending_count(self, recipient=None):
+        return self.transport.request(OP_PENDING, (recipient,))
+
+    def send_to_role(self, sender, role, msg_type, content):
+        self.transport.post(OP_SEND_TO_ROLE, (sender, role, msg_type, content))
+
+    def broadcast(self, sender, msg_type, content):
+        self.send_message(sender, "ALL", msg_type, content)
+
+    def get_history(self, limit=None):
+        return [Message.from_record(record)
+                for record in self.transport.request(OP_HISTORY, (limit,))]
+
+    def ping(self, payload=None):
+        """Round trip to the bus; for latency measurements"""
+        return self.transport.request(OP_PING, payload)
+
+    def barrier(self):
+        """Wait for every process in the mission to finish its tick; True means stop"""
+        self._members.clear()
+        return self.transport.request(OP_BARRIER, ())
+
+    def flush(self):
+        self.transport.flush()
+
+    def close(self):
+        self.transport.close()
+
+
+class _Connection:
+    __slots__ = ('sock', 'inbox', 'outbox')
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.inbox = bytearray()
+        self.outbox = bytearray()
+
+
+class BusServer:
+    """
+    Serves a MessageBus to RemoteMessageBus clients over a Unix socket
+    With parties > 0 it also acts as a tick barrier for that many clients:
+    sends are held until every party reaches the barrier, then applied in
+    (sender, send order) so the outcome does not depend on process timing
+    """
+
+    def __init__(self, path, bus=None, parties=0, on_tick=None):
+        self.path = path
+        self.bus = bus if bus is not None else MessageBus()
+        self.parties = parties
+        # on_tick(tick, messages) -> True to stop the mission
+        self.on_tick = on_tick
+        self.tick = 0
+        self.stopped = False
+        self._staged = []
+        self._sent = {}
+        self._waiting = []
+        self._closing = False
+        self._thread = None
+        if os.path.exists(path):
+            os.unlink(path)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(path)
+        self.listener.listen()
+        self.listener.setblocking(False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ)
+
+    def start(self):
+        """Serve from a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, name="bus-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        while not self._closing:
+            for key, events in self.selector.select(timeout=0.1):
+                if key.fileobj is self.listener:
+                    self._accept()
+                    continue
+                conn = key.data
+                if events & selectors.EVENT_READ:
+                    self._read(conn)
+                if events & selectors.EVENT_WRITE and conn.outbox:
+                    self._write(conn)
+
+    def _accept(self):
+        sock, _ = self.listener.accept()
+        sock.setblocking(False)
+        self.selector.register(sock, selectors.EVENT_READ, _Connection(sock))
+
+    def _read(self, conn):
+        try:
+            chunk = conn.sock.recv(1 << 16)
+        except ConnectionError:
+            chunk = b''
+        if not chunk:
+            self._drop(conn)
+            return
+        conn.inbox += chunk
+        for op, args in decode_frames(conn.inbox):
+            self._handle(conn, op, args)
+        if conn.outbox:
+            self._write(conn)
+
+    def _handle(self, conn, op, args):
+        if op == OP_BARRIER:
+            self._waiting.append(conn)
+            if len(self._waiting) >= self.parties:
+                self._release()
+        elif op in _SEND_OPS and self.parties:
+            sender = args[0]
+            count = self._sent.get(sender, 0)
+            self._sent[sender] = count + 1
+            self._staged.append((sender, count, op, args))
+        else:
+            reply = _dispatch(self.bus, op, args)
+            if op >= OP_GET:
+                conn.outbox += encode_frame(OP_REPLY, reply)
+
+    def _release(self):
+        """All parties are at the barrier: deliver the tick's messages and start the next"""
+        self._staged.sort(key=lambda item: (item[0], item[1]))
+        first = self.bus.next_seq
+        for _, _, op, args in self._staged:
+            _dispatch(self.bus, op, args)
+        self._staged.clear()
+        delivered = self.bus.next_seq - first
+        messages = self.bus.get_history(delivered) if delivered else []
+        if self.on_tick is not None and not self.stopped:
+            self.stopped = bool(self.on_tick(self.tick, messages))
+        self.tick += 1
+        for conn in self._waiting:
+            conn.outbox += encode_frame(OP_REPLY, self.stopped)
+            self._write(conn)
+        self._waiting.clear()
+
+    def _write(self, conn):
+        try:
+            sent = conn.sock.send(conn.outbox)
+        except BlockingIOError:
+            sent = 0
+        except ConnectionError:
+            self._drop(conn)
+            return
+        del conn.outbox[:sent]
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if conn.outbox else 0)
+        self.selector.modify(conn.sock, events, conn)
+
+    def _drop(self, conn):
+        self.selector.unregister(conn.sock)
+        conn.sock.close()
+        if conn in self._waiting:
+            self._waiting.remove(conn)
+        if self.parties and not self.stopped:
+            # A party left mid-mission: release everyone else with a stop
+            self.stopped = True
+            self.parties -= 1
+            if self._waiting:
+                self._release()
+
+    def close(self):
+        self._closing = True
+        if self._thread is not None:
+            self._thread.join()
+        for key in list(self.selector.get_map().values()):
+            key.fileobj.close()
+        self.selector.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
@@ -11,6 +11,7 @@ Market Applications:
 TOTAL TAM: $50B+ across autonomous multi-robot systems
 """
 
+import argparse
 import sys
 import os
 
@@ -20,12 +21,22 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from core.environment import LunarEnvironment
 from core.message_bus import MessageBus
 from core.coordinator import MissionCoordinator
-from agents.scout import ScoutAgent
-from agents.analyst import AnalystAgent
-from agents.executor import ExecutorAgent
+from core.path_planner import PathPlanner
+from core.fleet import build_fleet
+from core.trajectory import TrajectoryRecorder
+from core.profiler import MissionProfiler
 from visualization.display import MissionVisualizer
+from visualization.export import FrameExporter
 
 def main():
+    parser = argparse.ArgumentParser(description="Autonomous lunar exploration demo")
+    parser.add_argument('--live', action='store_true', help="animate the map while the mission runs")
+    parser.add_argument('--record', default=None, metavar='PATH',
+                        help="render the mission off-screen to a .gif or a directory of PNG frames")
+    parser.add_argument('--profile', default=None, metavar='PATH',
+                        help="time agents and hot calls; writes a Chrome trace (PATH) and a CSV next to it")
+    args = parser.parse_args()
+    
     print("""
     ╔═══════════════════════════════════════════════════════════╗
     ║                                                           ║
@@ -57,22 +68,37 @@ def main():
     
     # Deploy autonomous agents
     print("🤖 Deploying autonomous agents...")
-    scout = ScoutAgent("Scout-1", environment, message_bus, start_x=20, start_y=20)
-    analyst = AnalystAgent("Analyst", environment, message_bus)
-    executor = ExecutorAgent("Executor-1", environment, message_bus, start_x=50, start_y=50)
-    
-    agents = [scout, analyst, executor]
+    agents = build_fleet(environment, message_bus, num_scouts=1, num_executors=1,
+                         planner=PathPlanner(environment))
     
     # Initialize mission coordinator
     coordinator = MissionCoordinator(environment, message_bus, agents)
+    recorder = TrajectoryRecorder(agents).attach(coordinator)
+    if args.live:
+        live = MissionVisualizer(environment, agents)
+        live.draw_tracks(recorder)
+        live.attach(coordinator)
+    exporter = None
+    if args.record:
+        exporter = FrameExporter(environment, agents, args.record, recorder=recorder).attach(coordinator)
+    profiler = MissionProfiler().attach(coordinator) if args.profile else None
     
     # Run autonomous mission
     coordinator.run_mission(max_cycles=40)
+    if exporter is not None:
+        frames = exporter.close()
+        print(f"\n🎞️  {frames} frames written to {args.record}")
+    if profiler is not None:
+        profiler.detach()
+        profiler.write_trace(args.profile)
+        profiler.write_csv(os.path.splitext(args.profile)[0] + '.csv')
+        print(f"\n⏱️  Profile written to {args.profile}\n{profiler.format_summary()}")
     
     # Generate visualization
     print("\n📊 Generating mission visualization...")
     visualizer = MissionVisualizer(environment, agents)
     fig = visualizer.create_static_visualization()
+    visualizer.draw_tracks(recorder)
     visualizer.save('lunar_mission_result.png')
     
     # Show visualization
@@ -0,0 +1,77 @@
+"""
+Vectorized analyst scoring gives exactly the scalar scores
+"""
+import random
+import pytest
+from agents.analyst import AnalystAgent
+from agents.executor import ExecutorAgent
+from core.environment import LunarEnvironment
+from core.events import NullSink
+from core.message_bus import MessageBus
+from core.task_allocation import TaskAllocator
+
+
+def _discoveries(environment):
+    """TARGET_DISCOVERED contents for every target, as a scout reports them"""
+    return [{'target_id': target['id'], 'location': (target['x'], target['y']), 'type': target['type'],
+             'size': target['size'], 'composition': target['composition']}
+            for target in environment.targets]
+
+
+def _loose_discoveries(seed):
+    """Discoveries with no target table behind them, unknown categories included"""
+    rng = random.Random(seed)
+    return [{'target_id': target_id, 'location': (rng.uniform(0, 100), rng.uniform(0, 100)),
+             'type': rng.choice(['rock', 'crater', 'anomaly', 'boulder']),
+             'size': rng.randint(1, 10),
+             'composition': rng.choice(['basalt', 'anorthosite', 'regolith', 'ice', 'glass'])}
+            for target_id in range(40)]
+
+
+def _allocator(kind, environment, bus):
+    if kind == 'none':
+        return None
+    if kind == 'empty':
+        # No executors: both paths score from EXECUTOR_HOME
+        return TaskAllocator([])
+    executors = [ExecutorAgent(f"Executor-{i + 1}", environment, bus, start_x=x, start_y=y, sink=NullSink())
+                 for i, (x, y) in enumerate([(10.0, 90.0), (75.5, 20.25), (50.0, 50.0)])]
+    return TaskAllocator(executors)
+
+
+def _analyst(environment, allocator_kind, batch_scoring=True):
+    bus = MessageBus()
+    allocator = _allocator(allocator_kind, environment, bus)
+    return AnalystAgent("Analyst-1", environment, bus, sink=NullSink(), batch_scoring=batch_scoring,
+                        allocator=allocator)
+
+
+@pytest.mark.parametrize("allocator_kind", ['none', 'empty', 'executors'])
+@pytest.mark.parametrize("seed", range(3))
+def test_batch_scores_equal_scalar_scores_from_the_target_table(allocator_kind, seed):
+    environment = LunarEnvironment(width=100, height=100, num_targets=60, seed=seed)
+    analyst = _analyst(environment, allocator_kind)
+    pending = _discoveries(environment)
+    batch = analyst._evaluate_batch(pending).tolist()
+    assert batch == [analyst._evaluate_target(target) for target in pending]
+
+
+@pytest.mark.parametrize("allocator_kind", ['none', 'empty', 'executors'])
+@pytest.mark.parametrize("seed", range(3))
+def test_batch_scores_equal_scalar_scores_without_a_target_table(allocator_kind, seed):
+    analyst = _analyst(None, allocator_kind)
+    pending = _loose_discoveries(seed)
+    batch = analyst._evaluate_batch(pending).tolist()
+    assert batch == [analyst._evaluate_target(target) for target in pending]
+
+
+@pytest.mark.parametrize("allocator_kind", ['none', 'empty', 'executors'])
+def test_batch_and_scalar_analysts_evaluate_alike(allocator_kind):
+    environment = LunarEnvironment(width=100, height=100, num_targets=60, seed=7)
+    evaluations = []
+    for batch_scoring in (True, False):
+        analyst = _analyst(environment, allocator_kind, batch_scoring)
+        analyst.pending_evaluations = _discoveries(environment)
+        analyst.take_action()
+        evaluations.append(analyst.evaluated_targets)
+    assert evaluations[0] == evaluations[1]
@@ -0,0 +1,130 @@
+"""
+RouteOptimizer: O(1) move deltas against full recomputation, local
+optimality of refined tours and the per-call move budget
+"""
+import random
+import numpy as np
+import pytest
+import core.route_optimizer as route_optimizer
+from core.route_optimizer import (RouteOptimizer, MIN_GAIN, OR_OPT_SEGMENT, _prefixes,
+                                  _reversal_delta, _relocation_delta)
+
+
+def _tour_cost(dist, weight, nodes):
+    """Score-weighted arrival distance, walked stop by stop"""
+    cost, travelled = 0.0, 0.0
+    for t in range(1, len(nodes)):
+        travelled += dist[nodes[t - 1]][nodes[t]]
+        cost += weight[nodes[t]] * travelled
+    return cost
+
+
+def _instance(seed, stops):
+    """Symmetric straight-line matrix over a start (slot 0) and stops 1..n, in a shuffled tour"""
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(0, 100, size=(stops + 1, 2))
+    dist = np.sqrt(((points[:, None, :] - points[None, :, :])**2).sum(axis=2)).tolist()
+    weight = [0.0] + rng.uniform(1, 20, size=stops).tolist()
+    order = rng.permutation(np.arange(1, stops + 1)).tolist()
+    return dist, weight, [0] + order
+
+
+def _reversal(nodes, i, j):
+    return nodes[:i] + nodes[i:j + 1][::-1] + nodes[j + 1:]
+
+
+def _relocation(nodes, a, b, k):
+    if k > b:
+        return nodes[:a] + nodes[b + 1:k + 1] + nodes[a:b + 1] + nodes[k + 1:]
+    return nodes[:k + 1] + nodes[a:b + 1] + nodes[k + 1:a] + nodes[b + 1:]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("stops", [1, 2, 3, 6, 9])
+def test_prefix_sums_give_the_tour_cost(seed, stops):
+    dist, weight, nodes = _instance(seed, stops)
+    assert _prefixes(dist, weight, nodes)[3][-1] == pytest.approx(_tour_cost(dist, weight, nodes))
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("stops", [2, 3, 6, 9])
+def test_reversal_delta_matches_recomputation(seed, stops):
+    dist, weight, nodes = _instance(seed, stops)
+    sums = _prefixes(dist, weight, nodes)
+    before = _tour_cost(dist, weight, nodes)
+    for i in range(1, stops + 1):
+        for j in range(i + 1, stops + 1):
+            after = _tour_cost(dist, weight, _reversal(nodes, i, j))
+            assert _reversal_delta(dist, nodes, sums, i, j) == pytest.approx(after - before, abs=1e-6)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("stops", [2, 3, 6, 9])
+def test_relocation_delta_matches_recomputation(seed, stops):
+    dist, weight, nodes = _instance(seed, stops)
+    sums = _prefixes(dist, weight, nodes)
+    before = _tour_cost(dist, weight, nodes)
+    for a in range(1, stops + 1):
+        for b in range(a, stops + 1):
+            for k in range(stops + 1):
+                if a - 1 <= k <= b:
+                    continue
+                after = _tour_cost(dist, weight, _relocation(nodes, a, b, k))
+                assert _relocation_delta(dist, nodes, sums, a, b, k) == pytest.approx(after - before, abs=1e-6)
+
+
+def _queue(seed, stops, **kwargs):
+    rng = random.Random(seed)
+    route = RouteOptimizer(**kwargs)
+    for target_id in range(stops):
+        route.push({'target_id': target_id, 'location': (rng.uniform(0, 100), rng.uniform(0, 100)),
+                    'score': rng.uniform(0, 20)})
+    return route
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_refined_tour_has_no_improving_move(seed):
+    route = _queue(seed, 4 + seed)
+    for _ in range(50):
+        route.optimize(50.0, 50.0)
+    # Refinement ran to completion rather than out of budget
+    assert not route._improving
+    dist, weight = route.dist.tolist(), route.weight.tolist()
+    nodes = [0] + [route._slots[target_id] for target_id in route.tour]
+    n = len(nodes) - 1
+    cost = _tour_cost(dist, weight, nodes)
+    for i in range(1, n + 1):
+        for j in range(i + 1, n + 1):
+            assert _tour_cost(dist, weight, _reversal(nodes, i, j)) > cost - MIN_GAIN
+        for b in range(i, min(i + OR_OPT_SEGMENT, n + 1)):
+            for k in range(n + 1):
+                if not i - 1 <= k <= b:
+                    assert _tour_cost(dist, weight, _relocation(nodes, i, b, k)) > cost - MIN_GAIN
+
+
+@pytest.mark.parametrize("budget", [1, 7, 40, 300])
+def test_optimize_stays_within_the_move_budget(monkeypatch, budget):
+    evaluations = [0]
+    for name in ('_reversal_delta', '_relocation_delta'):
+        delta = getattr(route_optimizer, name)
+
+        def counted(*args, delta=delta):
+            evaluations[0] += 1
+            return delta(*args)
+        monkeypatch.setattr(route_optimizer, name, counted)
+
+    route = _queue(budget, 20, move_budget=budget)
+    for _ in range(10):
+        evaluations[0] = 0
+        route.optimize(50.0, 50.0)
+        assert evaluations[0] <= budget
+
+
+def test_tours_are_deterministic():
+    tours = []
+    for _ in range(2):
+        route = _queue(3, 15, move_budget=25)
+        for _ in range(5):
+            route.optimize(20.0, 80.0)
+        tours.append(list(route.tour))
+    assert tours[0] == tours[1]
@@ -0,0 +1,155 @@
+"""
+TaskAllocator and solve_assignment against brute force on small cases
+"""
+import itertools
+import math
+import random
+import numpy as np
+import pytest
+from agents.executor import ExecutorAgent
+from core.events import NullSink
+from core.message_bus import MessageBus
+from core.task_allocation import TaskAllocator, solve_assignment
+
+
+def _brute_force_assignment(cost):
+    n, m = cost.shape
+    return min(sum(cost[row, column] for row, column in enumerate(columns))
+               for columns in itertools.permutations(range(m), n))
+
+
+@pytest.mark.parametrize("rows,columns", [(1, 1), (2, 2), (3, 3), (4, 4), (1, 5), (2, 5), (3, 6), (5, 6)])
+def test_solve_assignment_is_optimal(rows, columns):
+    rng = np.random.default_rng(rows * 10 + columns)
+    for _ in range(20):
+        cost = rng.uniform(-20, 50, size=(rows, columns)).round(1)
+        assignment = solve_assignment(cost)
+        assert sorted(set(assignment.tolist())) == sorted(assignment.tolist())
+        assert all(0 <= column < columns for column in assignment.tolist())
+        total = cost[np.arange(rows), assignment].sum()
+        assert total == pytest.approx(_brute_force_assignment(cost))
+
+
+def test_solve_assignment_rejects_more_rows_than_columns():
+    with pytest.raises(ValueError):
+        solve_assignment(np.zeros((3, 2)))
+
+
+def _executors(rng, count, bus):
+    """Executors at random positions, some with a current target and queued orders"""
+    executors = []
+    for i in range(count):
+        executor = ExecutorAgent(f"Executor-{i + 1}", None, bus, start_x=rng.uniform(0, 100),
+                                 start_y=rng.uniform(0, 100), sink=NullSink())
+        executor.carrying_capacity = rng.randint(1, 4)
+        if rng.random() < 0.5:
+            executor.current_target = _order(rng, 100 + i)
+        for k in range(rng.randint(0, 1)):
+            executor.collection_queue.push(_order(rng, 200 + 10 * i + k))
+        executors.append(executor)
+    return executors
+
+
+def _order(rng, target_id):
+    return {'target_id': target_id, 'location': (rng.uniform(0, 100), rng.uniform(0, 100)),
+            'score': rng.uniform(0, 25)}
+
+
+def _route_terms(executor):
+    """Anchor points, orders already ahead and free slots of one executor"""
+    points = [(executor.x, executor.y)]
+    if executor.current_target:
+        points.append(executor.current_target['location'])
+    points.extend(task['location'] for task in executor.collection_queue)
+    ahead = len(points) - 1
+    free = max(executor.carrying_capacity - executor.collected_count - ahead, 0)
+    return points, ahead, free
+
+
+def _objective(allocator, orders, choice, terms, big):
+    """Cost of sending orders[i] to executor choice[i] (None: back to the backlog)"""
+    total = 0.0
+    placed = [0] * len(terms)
+    for order, e in zip(orders, choice):
+        if e is None:
+            total += big
+            continue
+        points, ahead, _ = terms[e]
+        x, y = order['location']
+        total += (min(math.hypot(x - px, y - py) for px, py in points)
+                  + (ahead + placed[e]) * allocator.slot_cost
+                  - allocator.score_weight * order['score'])
+        placed[e] += 1
+    return total
+
+
+def _brute_force_allocation(allocator, executors, orders):
+    terms = [_route_terms(executor) for executor in executors]
+    # The allocator's "not now" cost: one more than its dearest real slot
+    slot_costs = [_objective(allocator, [order], [e], terms, 0.0)
+                  + rank * allocator.slot_cost
+                  for order in orders
+                  for e, (_, _, free) in enumerate(terms)
+                  for rank in range(min(free, len(orders)))]
+    big = max(slot_costs) + 1.0 if slot_costs else 0.0
+    best = math.inf
+    for choice in itertools.product([None] + list(range(len(executors))), repeat=len(orders)):
+        if any(choice.count(e) > terms[e][2] for e in range(len(executors))):
+            continue
+        best = min(best, _objective(allocator, orders, choice, terms, big))
+    return best, terms, big
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_allocation_matches_brute_force(seed):
+    rng = random.Random(seed)
+    bus = MessageBus()
+    executors = _executors(rng, rng.randint(1, 3), bus)
+    # Often more orders than free slots, so some must wait in the backlog
+    orders = [_order(rng, target_id) for target_id in range(rng.randint(1, 5))]
+    allocator = TaskAllocator(executors)
+
+    best, terms, big = _brute_force_allocation(allocator, executors, orders)
+    batches = allocator.allocate(orders)
+
+    index = {executor.name: e for e, executor in enumerate(executors)}
+    choice_by_id = {order['target_id']: None for order in allocator.backlog}
+    for name, batch in batches.items():
+        assert len(batch) <= terms[index[name]][2]
+        for order in batch:
+            choice_by_id[order['target_id']] = index[name]
+    assert sorted(choice_by_id) == sorted(order['target_id'] for order in orders)
+    # An executor's rank terms add up the same whichever order takes which slot
+    choice = [choice_by_id[order['target_id']] for order in orders]
+    assert _objective(allocator, orders, choice, terms, big) == pytest.approx(best)
+    # Every free slot is worth filling before anything waits
+    free = sum(term[2] for term in terms)
+    assert len(allocator.backlog) == max(len(orders) - free, 0)
+
+
+def test_allocation_without_executors_backlogs_everything():
+    rng = random.Random(0)
+    orders = [_order(rng, target_id) for target_id in range(3)]
+    allocator = TaskAllocator([])
+    assert allocator.allocate(orders) == {}
+    assert allocator.backlog == orders
+    # Backlogged orders are offered again with the next batch
+    more = [_order(rng, 3)]
+    assert allocator.allocate(more) == {}
+    assert allocator.backlog == orders + more
+
+
+def test_backlog_is_reoffered_once_an_executor_has_room():
+    rng = random.Random(1)
+    bus = MessageBus()
+    executor = ExecutorAgent("Executor-1", None, bus, sink=NullSink())
+    executor.carrying_capacity = 1
+    allocator = TaskAllocator([executor])
+    orders = [_order(rng, 0), _order(rng, 1)]
+    first = allocator.allocate(orders)
+    assert len(first["Executor-1"]) == 1 and len(allocator.backlog) == 1
+    waiting = allocator.backlog[0]
+    executor.carrying_capacity = 2
+    executor.collection_queue.push(first["Executor-1"][0])
+    assert allocator.allocate([]) == {"Executor-1": [waiting]}
+    assert allocator.backlog == []
@@ -1,18 +1,50 @@
 """
 Mission Visualization
 Real-time display of lunar exploration mission
+Obstacles are drawn once as a single collection; targets (one scatter per
+state) and rovers are animated artists that are updated in place and
+blitted over a cached background, so a frame costs the same however long
+the mission runs
 """
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from matplotlib.animation import FuncAnimation
+from matplotlib.collections import EllipseCollection, LineCollection, PatchCollection
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
+from core.target_table import TargetTable, DISCOVERED, COLLECTED
+
+AGENT_COLORS = {
+    'Scout': '#00d4ff',     # Cyan
+    'Analyst': '#ff00ff',   # Magenta
+    'Executor': '#ffff00'   # Yellow
+}
+
+# (state, color, marker, size); later states win
+TARGET_STYLES = (
+    ('undiscovered', '#888888', 's', 40),   # Undiscovered - gray
+    ('discovered', '#ffa500', '^', 80),     # Discovered - orange
+    ('collected', '#00ff41', 'o', 100),     # Collected - bright green
+)
 
 class MissionVisualizer:
-    def __init__(self, environment, agents):
+    def __init__(self, environment, agents, headless=False, figsize=(12, 10), dpi=100):
         self.environment = environment
         self.agents = agents
-        self.fig, self.ax = plt.subplots(figsize=(12, 10))
-        
+        self.headless = headless
+        if headless:
+            # Off-screen Agg canvas: no pyplot state, no GUI backend needed
+            self.fig = Figure(figsize=figsize, dpi=dpi)
+            FigureCanvasAgg(self.fig)
+            self.ax = self.fig.add_subplot()
+        else:
+            self.fig, self.ax = plt.subplots(figsize=figsize, dpi=dpi)
+        self.target_layers = {}
+        self.rover_layers = []
+        self.track_layer = None
+        self.stats_text = None
+        self.background = None
+
     def setup_plot(self):
         """Initialize the plot"""
         self.ax.set_xlim(0, self.environment.width)
@@ -20,96 +52,187 @@ class MissionVisualizer:
         self.ax.set_aspect('equal')
         self.ax.set_facecolor('#1a1a2e')
         self.fig.patch.set_facecolor('#16213e')
-        self.ax.set_title('🌙 AUTONOMOUS LUNAR EXPLORATION MISSION 🚀', 
+        self.ax.set_title('🌙 AUTONOMOUS LUNAR EXPLORATION MISSION 🚀',
                          fontsize=16, color='white', pad=20)
         self.ax.set_xlabel('Longitude (m)', fontsize=12, color='white')
         self.ax.set_ylabel('Latitude (m)', fontsize=12, color='white')
         self.ax.tick_params(colors='white')
-        
+
     def draw_static_elements(self):
         """Draw obstacles and targets"""
-        # Draw obstacles
-        for obs in self.environment.obstacles:
-            circle = patches.Circle((obs['x'], obs['y']), obs['radius'], 
-                                   color='#6c5b7b', alpha=0.7, label='Obstacle')
-            self.ax.add_patch(circle)
-        
-        # Draw all targets
-        for target in self.environment.targets:
-            if target['collected']:
-                color = '#00ff41'  # Collected - bright green
-                marker = 'o'
-                size = 100
-            elif target['discovered']:
-                color = '#ffa500'  # Discovered - orange
-                marker = '^'
-                size = 80
-            else:
-                color = '#888888'  # Undiscovered - gray
-                marker = 's'
-                size = 40
-            
-            self.ax.scatter(target['x'], target['y'], c=color, marker=marker, 
-                          s=size, alpha=0.8, edgecolors='white', linewidths=0.5)
-    
+        # All obstacles in one collection
+        circles = [patches.Circle((obs['x'], obs['y']), obs['radius'])
+                   for obs in self.environment.obstacles if obs['radius'] > 0]
+        self.ax.add_collection(PatchCollection(circles, facecolor='#6c5b7b', edgecolor='none',
+                                               alpha=0.7, label='Obstacle'))
+
+        # One scatter per target state; update_targets moves points between them
+        for state, color, marker, size in TARGET_STYLES:
+            self.target_layers[state] = self.ax.scatter(
+                [], [], c=color, marker=marker, s=size, alpha=0.8,
+                edgecolors='white', linewidths=0.5)
+        self.update_targets()
+
+    def _target_arrays(self):
+        """(x, y, state bits) of every target the environment holds"""
+        targets = self.environment.targets
+        if isinstance(targets, TargetTable):
+            return targets.x, targets.y, targets.state
+        rows = [(t['x'], t['y'], (DISCOVERED if t['discovered'] else 0) |
+                 (COLLECTED if t['collected'] else 0)) for t in targets]
+        if not rows:
+            return np.zeros(0), np.zeros(0), np.zeros(0, dtype=np.uint8)
+        xs, ys, state = (np.array(column) for column in zip(*rows))
+        return xs, ys, state
+
+    def update_targets(self):
+        """Refresh the target layers from the environment's state flags"""
+        xs, ys, state = self._target_arrays()
+        collected = (state & COLLECTED) != 0
+        discovered = ((state & DISCOVERED) != 0) & ~collected
+        masks = {'collected': collected, 'discovered': discovered,
+                 'undiscovered': ~(collected | discovered)}
+        for state_name, layer in self.target_layers.items():
+            mask = masks[state_name]
+            layer.set_offsets(np.column_stack([xs[mask], ys[mask]]))
+
     def draw_agents(self):
         """Draw agent positions"""
-        agent_colors = {
-            'Scout': '#00d4ff',     # Cyan
-            'Analyst': '#ff00ff',   # Magenta
-            'Executor': '#ffff00'   # Yellow
-        }
-        
+        # Only agents that have position (x, y), grouped by kind
+        groups = {}
         for agent in self.agents:
-            # Only draw agents that have position (x, y)
             if not hasattr(agent, 'x') or not hasattr(agent, 'y'):
                 continue
-                
-            # Get agent name and position
-            agent_name = agent.name
-            color = agent_colors.get(agent_name.split('-')[0], '#ffffff')
-            
-            # Draw agent
-            self.ax.scatter(agent.x, agent.y, c=color, marker='*', 
-                          s=400, edgecolors='white', linewidths=2, 
-                          label=agent_name, zorder=10)
-            
-            # Draw sensor/action range
-            if hasattr(agent, 'sensor_range'):
-                circle = patches.Circle((agent.x, agent.y), agent.sensor_range,
-                                      color=color, alpha=0.1, linestyle='--',
-                                      fill=True)
-                self.ax.add_patch(circle)
-    
+            groups.setdefault(agent.name.split('-')[0], []).append(agent)
+
+        for kind, members in groups.items():
+            color = AGENT_COLORS.get(kind, '#ffffff')
+            rovers = self.ax.scatter([a.x for a in members], [a.y for a in members], c=color,
+                                     marker='*', s=400, edgecolors='white', linewidths=2,
+                                     label=kind, zorder=10)
+
+            # Sensor/action ranges, sized in data units
+            ranges = None
+            sensing = [a for a in members if hasattr(a, 'sensor_range')]
+            if sensing:
+                diameters = [2 * a.sensor_range for a in sensing]
+                ranges = EllipseCollection(diameters, diameters, 0, units='xy',
+                                           offsets=[(a.x, a.y) for a in sensing],
+                                           offset_transform=self.ax.transData,
+                                           facecolors=color, alpha=0.1, linestyle='--')
+                self.ax.add_collection(ranges)
+            self.rover_layers.append((members, rovers, sensing, ranges))
+
+    def update_agents(self):
+        """Move the rover markers and sensor ranges to the agents' positions"""
+        for members, rovers, sensing, ranges in self.rover_layers:
+            rovers.set_offsets([(a.x, a.y) for a in members])
+            if ranges is not None:
+                ranges.set_offsets([(a.x, a.y) for a in sensing])
+
+    def draw_tracks(self, recorder, tolerance=None):
+        """Draw every rover's path from a TrajectoryRecorder as one LineCollection"""
+        colors = [AGENT_COLORS.get(name.split('-')[0], '#ffffff') for name in recorder.names]
+        lines = LineCollection([], colors=colors, linewidths=1.2, alpha=0.6, zorder=5)
+        self.ax.add_collection(lines)
+        self.track_layer = (recorder, tolerance, lines)
+        self.update_tracks()
+
+    def update_tracks(self):
+        if self.track_layer is not None:
+            recorder, tolerance, lines = self.track_layer
+            lines.set_segments(list(recorder.tracks(tolerance).values()))
+
+    def _stats_label(self):
+        return (f"Discovered: {len(self.environment.discovered_targets)} | "
+                f"Collected: {len(self.environment.collected_targets)}")
+
     def create_static_visualization(self):
         """Create a single frame visualization"""
         self.setup_plot()
         self.draw_static_elements()
         self.draw_agents()
-        
+
         # Add legend
         handles, labels = self.ax.get_legend_handles_labels()
         # Remove duplicates
         by_label = dict(zip(labels, handles))
-        self.ax.legend(by_label.values(), by_label.keys(), 
-                      loc='upper right', facecolor='#16213e', 
+        self.ax.legend(by_label.values(), by_label.keys(),
+                      loc='upper right', facecolor='#16213e',
                       edgecolor='white', fontsize=10)
-        
+
         # Add mission stats
-        stats_text = f"Discovered: {len(self.environment.discovered_targets)} | "
-        stats_text += f"Collected: {len(self.environment.collected_targets)}"
-        self.ax.text(0.02, 0.98, stats_text, transform=self.ax.transAxes,
-                    fontsize=12, verticalalignment='top', color='white',
-                    bbox=dict(boxstyle='round', facecolor='#16213e', alpha=0.8))
-        
-        plt.tight_layout()
+        self.stats_text = self.ax.text(0.02, 0.98, self._stats_label(), transform=self.ax.transAxes,
+                                       fontsize=12, verticalalignment='top', color='white',
+                                       bbox=dict(boxstyle='round', facecolor='#16213e', alpha=0.8))
+
+        self.fig.tight_layout()
         return self.fig
-    
+
+    @property
+    def animated_artists(self):
+        """Artists redrawn every frame; everything else lives in the cached background"""
+        artists = list(self.target_layers.values())
+        if self.track_layer is not None:
+            artists.append(self.track_layer[2])
+        for _, rovers, _, ranges in self.rover_layers:
+            artists.extend(artist for artist in (ranges, rovers) if artist is not None)
+        artists.append(self.stats_text)
+        return artists
+
+    def start_animation(self):
+        """Draw the static layers once and cache them as the blitting background"""
+        if self.stats_text is None:
+            self.create_static_visualization()
+        for artist in self.animated_artists:
+            artist.set_animated(True)
+        canvas = self.fig.canvas
+        canvas.draw()
+        self.background = canvas.copy_from_bbox(self.fig.bbox)
+
+    def update_frame(self, cycle=None):
+        """Update the changed artists and redraw only those over the background"""
+        if self.background is None:
+            self.start_animation()
+        self.update_targets()
+        self.update_tracks()
+        self.update_agents()
+        label = self._stats_label()
+        self.stats_text.set_text(label if cycle is None else f"Cycle {cycle} | {label}")
+
+        canvas = self.fig.canvas
+        canvas.restore_region(self.background)
+        for artist in self.animated_artists:
+            self.ax.draw_artist(artist)
+        if not self.headless:
+            canvas.blit(self.fig.bbox)
+            canvas.flush_events()
+
+    def attach(self, coordinator, every=1):
+        """Redraw the live display every `every` cycles while the coordinator runs"""
+        if not self.headless:
+            plt.show(block=False)
+        self.start_animation()
+
+        def on_cycle(cycle):
+            if cycle % every == 0:
+                self.update_frame(cycle)
+        coordinator.cycle_hooks.append(on_cycle)
+        return on_cycle
+
+    def stop_animation(self):
+        """Return the animated artists to normal drawing (for full redraws and saving)"""
+        if self.background is not None:
+            for artist in self.animated_artists:
+                artist.set_animated(False)
+            self.background = None
+
     def show(self):
         """Display the visualization"""
         plt.show()
-    
+
     def save(self, filename='lunar_mission.png'):
         """Save the visualization"""
-        plt.savefig(filename, dpi=300, facecolor='#16213e')
+        self.stop_animation()
+        self.fig.savefig(filename, dpi=300, facecolor='#16213e')
         print(f"\n📸 Visualization saved to {filename}")
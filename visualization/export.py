@@ -0,0 +1,74 @@
+"""
+Headless Frame Export
+Renders a mission off-screen on the Agg backend while the coordinator runs
+and writes it as numbered PNG frames or an animated GIF
+Frames are blitted (background cached once, only rovers, targets and the
+stats label redrawn), and GIF exports keep at most max_frames in memory by
+dropping every other frame and doubling the stride when full, so long
+missions cost a bounded amount per frame and in total
+"""
+import os
+import numpy as np
+from PIL import Image
+from visualization.display import MissionVisualizer
+
+
+class FrameExporter:
+    def __init__(self, environment, agents, path, every=1, fps=10, max_frames=300,
+                 figsize=(8, 6.5), dpi=80, recorder=None):
+        """
+        path ending in .gif writes one animation on close(); any other path is
+        a directory that receives frame_00001.png, frame_00002.png, ...
+        recorder: optional TrajectoryRecorder whose tracks are drawn behind the rovers
+        """
+        self.path = path
+        self.every = every
+        self.fps = fps
+        self.max_frames = max_frames
+        self.gif = path.lower().endswith('.gif')
+        self.visualizer = MissionVisualizer(environment, agents, headless=True,
+                                            figsize=figsize, dpi=dpi)
+        if recorder is not None:
+            self.visualizer.draw_tracks(recorder, tolerance=1.0)
+        self.frames = []
+        self.frames_written = 0
+        if not self.gif:
+            os.makedirs(path, exist_ok=True)
+
+    def attach(self, coordinator):
+        """Capture a frame at the end of every `every`-th cycle"""
+        self.visualizer.start_animation()
+        coordinator.cycle_hooks.append(self.on_cycle)
+        return self
+
+    def on_cycle(self, cycle):
+        if cycle % self.every == 0:
+            self.capture(cycle)
+
+    def render(self, cycle=None):
+        """Current mission state as an RGB image array"""
+        self.visualizer.update_frame(cycle)
+        return np.asarray(self.visualizer.fig.canvas.buffer_rgba())[..., :3].copy()
+
+    def capture(self, cycle=None):
+        """Render one frame and store or write it"""
+        frame = Image.fromarray(self.render(cycle))
+        if not self.gif:
+            self.frames_written += 1
+            frame.save(os.path.join(self.path, f'frame_{self.frames_written:05d}.png'))
+            return
+        # Palette images hold one byte per pixel; the octree quantizer is ~4x faster
+        self.frames.append(frame.quantize(colors=64, method=Image.Quantize.FASTOCTREE))
+        self.frames_written += 1
+        if len(self.frames) >= self.max_frames:
+            # Keep the frames that fall on the doubled stride
+            self.frames = self.frames[1::2]
+            self.every *= 2
+
+    def close(self):
+        """Write the GIF (a no-op for PNG frame directories); returns the frame count"""
+        if self.gif and self.frames:
+            self.frames[0].save(self.path, save_all=True, append_images=self.frames[1:],
+                                duration=int(1000 / self.fps), loop=0)
+            return len(self.frames)
+        return self.frames_written